@@ -0,0 +1,69 @@
+"""
+Measures the cold-start time of the command line program.
+
+Every measurement runs the program in a fresh interpreter, so it includes starting Python, importing the modules
+and solving a small instance. Run it from the lab3 directory:
+
+    python benchmark/startup.py [--runs N] [instance]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+LAB_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure(command, runs):
+    """
+    Measures the wall-clock time of a command.
+
+    :param command: The command with its arguments.
+    :type command: list
+    :param runs: The number of runs.
+    :type runs: int
+    :return: The times of all runs in seconds.
+    :rtype: list
+    """
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(command, cwd=LAB_DIR, stdout=subprocess.DEVNULL, check=True)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measures the cold-start time of the command line program.')
+    parser.add_argument('instance',
+                        nargs='?',
+                        default=os.path.join(LAB_DIR, 'input.txt'),
+                        help='the instance to solve, defaults to input.txt')
+    parser.add_argument('--runs',
+                        type=int,
+                        default=10,
+                        help='number of runs of every command')
+    args = parser.parse_args()
+
+    solve = [sys.executable, 'main.py', args.instance, '--seed', '0', '--progress', 'silent']
+    commands = [
+        ('interpreter only', [sys.executable, '-c', 'pass']),
+        ('import src.assignment', [sys.executable, '-c', 'import src.assignment']),
+        ('solve, dict backend', solve + ['--backend', 'dict']),
+        ('solve, networkx backend', solve + ['--backend', 'networkx']),
+    ]
+    print('{:<28} {:>10} {:>10} {:>10}'.format('command', 'min ms', 'median ms', 'max ms'))
+    for name, command in commands:
+        try:
+            times = measure(command, args.runs)
+        except subprocess.CalledProcessError:
+            print('{:<28} {:>10}'.format(name, 'failed'))
+            continue
+        print('{:<28} {:>10.1f} {:>10.1f} {:>10.1f}'.format(name, min(times) * 1000, statistics.median(times) * 1000,
+                                                           max(times) * 1000))
+
+
+if __name__ == '__main__':
+    main()
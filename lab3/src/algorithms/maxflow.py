@@ -1,4 +1,3 @@
-import networkx as nx
 from queue import deque
 
 
@@ -7,7 +6,7 @@ def edmonds_karp(G, s, t):
     An implementation of the Edmonds-Karp maximum flow algorithm.
 
     :param G: The network graph in which to find the maximum flow.
-    :type G: nx.DiGraph
+    :type G: src.classes.digraph.DiGraph or networkx.DiGraph
     :param s: The source node in the network.
     :type s: int
     :param t: The sink node in the network.
@@ -46,10 +45,10 @@ def build_residual_network(G):
     Initializes an empty residual network for the network graph *G*.
 
     :param G: The graph for which to build the residual network.
-    :type G: nx.DiGraph
+    :type G: src.classes.digraph.DiGraph or networkx.DiGraph
     :return: An empty residual network with the edges from the original network, and added edges in the other
     direction with capacity 0.
-    :rtype: nx.DiGraph
+    :rtype: src.classes.digraph.DiGraph or networkx.DiGraph
     """
     R = copy_digraph(G)
     edge_list = [(u, v) for u, v in G.edges()]
@@ -63,12 +62,12 @@ def copy_digraph(G):
     Makes a copy of the supplied graph *G*.
 
     :param G: The graph instance to be copied.
-    :type G: nx.DiGraph
-    :return: A copy of the supplied graph.
-    :rtype: nx.DiGraph
+    :type G: src.classes.digraph.DiGraph or networkx.DiGraph
+    :return: A copy of the supplied graph, of the same type.
+    :rtype: src.classes.digraph.DiGraph or networkx.DiGraph
     """
     inf = float('inf')
-    H = nx.DiGraph()
+    H = type(G)()
     H.add_nodes_from(G)
     edge_list = [(u, v, attr) for u, v, attr in G.edges(data=True)]
     for u, v, attr in edge_list:
@@ -82,7 +81,7 @@ def find_augmenting_path(G, s, t):
     Finds an augmenting path in the residual network *G*.
 
     :param G: The residual graph to find a path in.
-    :type G: nx.DiGraph
+    :type G: src.classes.digraph.DiGraph or networkx.DiGraph
     :param s: The number of the source node.
     :type s: int
     :param t: The number of the sink node.
@@ -92,8 +91,7 @@ def find_augmenting_path(G, s, t):
     :rtype: list
     """
     q = deque([s])
-    visited = [False] * len(G.nodes)
-    visited[s] = True
+    visited = {s}
     parent = {}
 
     def trace_path():
@@ -107,9 +105,9 @@ def find_augmenting_path(G, s, t):
         u = q.popleft()
         if u == t:
             return trace_path()
-        for _, v, attr in G.edges(u, data=True):
-            if (not visited[v]) and attr.get('capacity', float('inf')) > 0:
-                visited[v] = True
+        for v, attr in G[u].items():
+            if v not in visited and attr.get('capacity', float('inf')) > 0:
+                visited.add(v)
                 parent[v] = u
                 q.append(v)
 
@@ -137,9 +135,9 @@ def build_flow_dict(G, R):
     on all edges of the networks into a dictionary.
 
     :param G: The original network graph for which to find the maximum flow.
-    :type G: nx.DiGraph
+    :type G: src.classes.digraph.DiGraph or networkx.DiGraph
     :param R: The residual network for the graph *G*.
-    :type R: nx.DiGraph
+    :type R: src.classes.digraph.DiGraph or networkx.DiGraph
     :return: A nested dictionary containing flow values for all edges in the graph.
              To access the value of the flow on an edge *uv*, access the value ``flow_dict[u][v]``.
     :rtype: dict
@@ -1,40 +1,507 @@
 import argparse
+import os
+import signal
 import sys
 
+# Only what every run needs is imported here, the engines and the modules used by a single mode (batch, server,
+# profiling) are imported where they are used, so that starting the program doesn't pay for all of them.
+from src.classes.graph import BACKENDS, set_backend
 from src.utils.parser import Parser, ParseError
-from src.utils.genetic import GeneticSolver
+from src.utils.binary import is_binary_instance, load_binary, write_binary
+from src.utils.compression import DECOMPRESSION_ERRORS, STDIN, open_input
+from src.utils.profiling import memory_section
+from src.utils.progress import FULL, LEVELS, ProgressReporter
+
+# Seconds an instance of a batch may run past its timeout, while its search returns the best schedule found, before
+# it is abandoned.
+TIMEOUT_GRACE = 5.0
 
 
 def init_parser():
     """
     Constructs an instance of :class:`argparse.ArgumentParser` configured for the program.
 
-    The returned :class:`argparse.ArgumentParser` accepts one positional string argument, which is the input
-    file name.
+    The returned :class:`argparse.ArgumentParser` accepts positional string arguments, which are the input
+    file name (or, in batch mode, file and directory names), and optional arguments configuring the search.
     """
     parser = argparse.ArgumentParser(description='Solves the expert-project assignment problem.')
     parser.add_argument('filename',
-                        nargs=1,
+                        nargs='*',
+                        type=str,
+                        help='specify the file containing the input data for the problem, optionally compressed '
+                             'with gzip, xz, bz2 or zstd, or - to read it from the standard input')
+    parser.add_argument('--batch',
+                        action='store_true',
+                        help='solve many instances, given as files and directories of files, in a pool of worker '
+                             'processes and write one JSON result record per instance')
+    parser.add_argument('--workers',
+                        type=int,
+                        default=None,
+                        help='number of worker processes in batch mode, defaults to the number of CPUs')
+    parser.add_argument('--instance-timeout',
+                        type=float,
+                        default=None,
+                        help='seconds after which the search on an instance of a batch returns its best schedule; '
+                             'an instance still running {:g} seconds later is abandoned'.format(TIMEOUT_GRACE))
+    parser.add_argument('--output',
+                        type=str,
+                        default=None,
+                        help='file the batch result records are written to, defaults to the standard output')
+    parser.add_argument('--serve',
+                        type=str,
+                        default=None,
+                        metavar='ADDRESS',
+                        help='run a solver server on a Unix socket (unix:PATH) or a local TCP port ([HOST:]PORT), '
+                             'answering POST /solve requests with instances in the text or JSON format by a pool of '
+                             '--workers processes keeping their caches warm, and GET /stats with the request '
+                             'latency and throughput')
+    parser.add_argument('--parser',
+                        choices=['bulk', 'lines'],
+                        default='bulk',
+                        help='parse the expert and project blocks of the input file at once (faster), or line by line '
+                             '(lower peak memory)')
+    parser.add_argument('--format',
+                        choices=['dense', 'sparse'],
+                        default='dense',
+                        help='layout of a text input file: full skill and requirement vectors, or lists of skill '
+                             'indices and skill:need pairs for wide skill catalogs')
+    parser.add_argument('--backend',
+                        choices=BACKENDS,
+                        default='dict',
+                        help='container of the max-flow networks: the built-in one, or networkx.DiGraph '
+                             '(networkx is imported only for this backend)')
+    parser.add_argument('--convert',
+                        type=str,
+                        default=None,
+                        metavar='OUTPUT',
+                        help='convert the input file to the binary instance format, which is loaded by '
+                             'memory-mapping it, and exit without solving')
+    parser.add_argument('--seed',
+                        type=int,
+                        default=None,
+                        help='seed for the random number generator')
+    parser.add_argument('--engine',
+                        choices=['genetic', 'annealing', 'tabu', 'branch-and-bound'],
+                        default='genetic',
+                        help='search engine: genetic algorithm, simulated annealing, tabu search or exact '
+                             'branch and bound (for small instances)')
+    parser.add_argument('--iterations',
+                        type=int,
+                        default=None,
+                        help='iteration limit of simulated annealing or tabu search')
+    parser.add_argument('--generations',
+                        type=int,
+                        default=1000,
+                        help='generation limit of the genetic algorithm')
+    parser.add_argument('--population',
+                        type=int,
+                        default=3,
+                        help='number of members surviving every generation of the genetic algorithm')
+    parser.add_argument('--crossover-chance',
+                        type=float,
+                        default=0.67,
+                        help='probability of a member taking part in a crossover')
+    parser.add_argument('--mutation-chance',
+                        type=float,
+                        default=0.34,
+                        help='probability of a member being mutated')
+    parser.add_argument('--stagnation',
+                        type=int,
+                        default=None,
+                        help='number of generations (or iterations) without improvement after which the search '
+                             'stops (defaults to 100 for the genetic algorithm and tabu search and 2000 for '
+                             'simulated annealing)')
+    parser.add_argument('--time-budget',
+                        type=float,
+                        default=None,
+                        help='seconds of wall-clock time after which the search stops and returns the best '
+                             'schedule found so far')
+    parser.add_argument('--node-limit',
+                        type=int,
+                        default=None,
+                        help='node limit of branch and bound, the result may not be optimal if it is hit')
+    parser.add_argument('--no-reduction',
+                        action='store_true',
+                        help='don\'t remove projects which can\'t affect the shortage before the search')
+    parser.add_argument('--seeding',
+                        choices=['random', 'greedy', 'balanced', 'mixed'],
+                        default='random',
+                        help='strategy of building the initial population: random start times, list scheduling '
+                             'by demand on scarce skills, spreading scarce skills evenly, or a mix of all')
+    parser.add_argument('--selection',
+                        choices=['sus', 'tournament', 'truncation'],
+                        default='sus',
+                        help='method of selecting members surviving to the next generation')
+    parser.add_argument('--tournament-size',
+                        type=int,
+                        default=2,
+                        help='number of members competing in a single tournament of the tournament selection')
+    parser.add_argument('--elite',
+                        type=int,
+                        default=1,
+                        help='number of best members always carried over to the next generation')
+    parser.add_argument('--local-search-budget',
+                        type=int,
+                        default=0,
+                        help='number of evaluations per generation spent on local search of the best members '
+                             '(0 disables local search)')
+    parser.add_argument('--local-search-moves',
+                        choices=['neighbors', 'all'],
+                        default='neighbors',
+                        help='start times tried by local search: neighboring or all valid ones')
+    parser.add_argument('--bound-pruning',
+                        action='store_true',
+                        help='skip evaluating members whose shortage lower bound is worse than the shortage of '
+                             'every member that would be kept in the population (requires --selection truncation)')
+    parser.add_argument('--islands',
+                        type=int,
+                        default=1,
+                        help='number of populations evolved in parallel processes (island model)')
+    parser.add_argument('--migration-interval',
+                        type=int,
+                        default=10,
+                        help='number of generations between migrations of the best members between islands')
+    parser.add_argument('--migration-size',
+                        type=int,
+                        default=1,
+                        help='number of best members migrating from every island')
+    parser.add_argument('--coarsen',
+                        type=int,
+                        default=1,
+                        help='solve first on a time horizon coarsened by this factor and refine the best '
+                             'schedules at full resolution (1 disables coarsening)')
+    parser.add_argument('--coarse-seeds',
+                        type=int,
+                        default=3,
+                        help='number of best coarse schedules seeding the full resolution search')
+    parser.add_argument('--refine-radius',
+                        type=int,
+                        default=None,
+                        help='number of time units a project may move away from its coarse start times during '
+                             'refinement (defaults to the coarsening factor)')
+    parser.add_argument('--checkpoint',
+                        type=str,
+                        default=None,
+                        help='file to which the state of the genetic algorithm is periodically saved')
+    parser.add_argument('--checkpoint-interval',
+                        type=int,
+                        default=10,
+                        help='number of generations between two checkpoints')
+    parser.add_argument('--resume',
                         type=str,
-                        help='specify the file containing the input data for the problem')
+                        default=None,
+                        help='continue the genetic algorithm from a checkpoint file (further checkpoints are '
+                             'saved to the same file unless --checkpoint is given)')
+    parser.add_argument('--telemetry',
+                        type=str,
+                        default=None,
+                        help='file to which statistics of every generation of the genetic algorithm are written '
+                             'as JSON Lines')
+    parser.add_argument('--progress',
+                        choices=LEVELS,
+                        default=FULL,
+                        help='progress reporting: nothing, a status summary every --progress-interval seconds, '
+                             'or every step of the search')
+    parser.add_argument('--progress-interval',
+                        type=float,
+                        default=5.0,
+                        help='number of seconds between two status reports at the summary level')
+    parser.add_argument('--profile',
+                        type=str,
+                        default=None,
+                        metavar='PREFIX',
+                        help='run under cProfile and write the profile to PREFIX.pstats and its call stacks for '
+                             'flame graphs to PREFIX.collapsed')
+    parser.add_argument('--profile-memory',
+                        action='store_true',
+                        help='with --profile, also trace memory allocations and write the peak memory of parsing, '
+                             'building max-flow graphs and the genetic algorithm\'s population to PREFIX.memory.txt')
     return parser
 
 
+def init_logging(stream=None):
+    """
+    Sends the progress reports of the search to a stream.
+
+    :param stream: The stream, defaults to the standard output.
+    """
+    import logging
+    logger = logging.getLogger('taio')
+    handler = logging.StreamHandler(stream or sys.stdout)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    logger.addHandler(handler)
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+
+
+def load_instance(filename, parser_mode, input_format='dense'):
+    """
+    Loads a problem instance from a file in the text or the binary format.
+
+    Text files compressed with gzip, xz, bz2 or zstd are decompressed while being parsed. Binary files must be
+    uncompressed, since they are memory-mapped.
+
+    :param filename: The name of the file, '-' for the standard input.
+    :type filename: str
+    :param parser_mode: How to parse a text file in the dense format: 'bulk' or 'lines'.
+    :type parser_mode: str
+    :param input_format: The layout of a text file: 'dense' or 'sparse'.
+    :type input_format: str
+    :return: A :class:`src.classes.data.SchedulingData` object with problem instance info.
+    :rtype: src.classes.data.SchedulingData
+    :raise ParseError: When the file is of invalid format.
+    """
+    if filename != STDIN:
+        with open(filename, 'rb') as input_file:
+            binary = is_binary_instance(input_file)
+        if binary:
+            return load_binary(filename)
+
+    input_parser = Parser()
+    with open_input(filename) as input_file:
+        if input_format == 'sparse':
+            return input_parser.parse_sparse(input_file)
+        if parser_mode == 'bulk':
+            return input_parser.parse_bulk(input_file)
+        return input_parser.parse(input_file)
+
+
 def main():
     """The main program entry point."""
     arg_parser = init_parser()
     args = arg_parser.parse_args()
-    input_parser = Parser()
+    if args.profile_memory and not args.profile:
+        arg_parser.error('--profile-memory requires --profile')
+    if args.bound_pruning and args.selection != 'truncation' and args.elite < args.population:
+        arg_parser.error('--bound-pruning requires --selection truncation, other selections may keep pruned members')
+    try:
+        set_backend(args.backend)
+    except ImportError:
+        arg_parser.error('the networkx backend requires the networkx package')
+    if args.serve:
+        pipeline = run_server
+    elif not args.filename:
+        arg_parser.error('the following arguments are required: filename')
+    elif args.batch:
+        from src.utils.batch import run_batch
+        pipeline = run_batch
+    else:
+        pipeline = run
+    if not args.profile:
+        pipeline(arg_parser, args)
+        return
+
+    import cProfile
+    import pstats
+    from src.utils.profiling import MemoryProfiler, write_collapsed_stacks
+    memory_profiler = MemoryProfiler() if args.profile_memory else None
+    if memory_profiler:
+        memory_profiler.start()
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        pipeline(arg_parser, args)
+    finally:
+        profiler.disable()
+        stats = pstats.Stats(profiler)
+        stats.dump_stats(args.profile + '.pstats')
+        write_collapsed_stacks(stats, args.profile + '.collapsed')
+        if memory_profiler:
+            memory_profiler.stop()
+            with open(args.profile + '.memory.txt', 'w') as report_file:
+                report_file.write(memory_profiler.report())
+
+
+def run(arg_parser, args):
+    """
+    Runs the whole pipeline: parses the input file, solves the problem and prints the result.
+
+    :param arg_parser: The parser of the command line arguments, used to report invalid combinations of them.
+    :type arg_parser: argparse.ArgumentParser
+    :param args: The parsed command line arguments.
+    :type args: argparse.Namespace
+    """
+    if len(args.filename) > 1:
+        arg_parser.error('more than one input file requires --batch')
+    single_genetic = args.engine == 'genetic' and args.islands == 1 and args.coarsen == 1
+    if (args.checkpoint or args.resume) and not single_genetic:
+        arg_parser.error('checkpoints are supported only by the genetic engine with a single island')
+    if args.telemetry and not single_genetic:
+        arg_parser.error('telemetry is supported only by the genetic engine with a single island')
+    init_logging()
+    progress = ProgressReporter(args.progress, args.progress_interval)
     scheduling_data = None
     try:
-        with open(args.filename[0], 'r') as input_file:
-            scheduling_data = input_parser.parse(input_file)
-    except (IOError, ParseError) as e:
+        with memory_section('Parser.parse'):
+            scheduling_data = load_instance(args.filename[0], args.parser, args.format)
+    except (IOError, ParseError) + DECOMPRESSION_ERRORS as e:
         sys.stderr.write('Error parsing file \'{}\': {}\n'
                          .format(args.filename[0], e))
         exit(1)
-    result = GeneticSolver(scheduling_data).solve()
-    GeneticSolver.print_result(result[0], result[1])
+    if args.convert:
+        try:
+            with open(args.convert, 'wb') as output_file:
+                write_binary(scheduling_data, output_file)
+        except (IOError, OverflowError) as e:
+            sys.stderr.write('Error converting to \'{}\': {}\n'.format(args.convert, e))
+            exit(1)
+        return
+    from src.utils.scheduling import SchedulingSolver
+    member, solution = solve_instance(scheduling_data, args, progress, args.time_budget)
+    SchedulingSolver.print_result(member, solution)
+
+
+def solve_instance(scheduling_data, args, progress, time_budget):
+    """
+    Solves a problem instance with the search configured by the command line arguments.
+
+    :param scheduling_data: The problem instance.
+    :type scheduling_data: src.classes.data.SchedulingData
+    :param args: The parsed command line arguments.
+    :type args: argparse.Namespace
+    :param progress: The reporter of the progress of the search.
+    :type progress: ProgressReporter
+    :param time_budget: Seconds of wall-clock time for the search, None means no limit.
+    :type time_budget: float
+    :return: A tuple containing the best member and its solution for the instance.
+    :rtype: tuple
+    """
+    reduction = None
+    if not args.no_reduction:
+        from src.utils.reduction import ProblemReduction
+        reduction = ProblemReduction(scheduling_data)
+        if reduction.fixed_projects:
+            progress.event('Fixed {} of {} projects which can\'t affect the shortage.',
+                           len(reduction.fixed_projects), scheduling_data.project_count)
+            scheduling_data = reduction.reduced_data
+    if args.engine == 'branch-and-bound':
+        from src.utils.branch_and_bound import BranchAndBoundSolver
+        result = BranchAndBoundSolver(scheduling_data, seed=args.seed, max_node_count=args.node_limit,
+                                      time_budget=time_budget, progress=progress).solve()
+    elif args.engine == 'annealing' or args.engine == 'tabu':
+        engine_options = {'seed': args.seed, 'seeding': args.seeding, 'time_budget': time_budget,
+                          'progress': progress}
+        if args.iterations is not None:
+            engine_options['max_iteration_count'] = args.iterations
+        if args.stagnation is not None:
+            engine_options['max_iterations_without_change'] = args.stagnation
+        if args.engine == 'annealing':
+            from src.utils.annealing import AnnealingSolver as engine
+        else:
+            from src.utils.tabu import TabuSolver as engine
+        result = engine(scheduling_data, **engine_options).solve()
+    else:
+        from src.utils.selection import get_selection
+        solver_options = {
+            'selection': get_selection(args.selection, args.tournament_size),
+            'elite_count': args.elite,
+            'local_search_budget': args.local_search_budget,
+            'local_search_moves': args.local_search_moves,
+            'bound_pruning': args.bound_pruning,
+            'seeding': args.seeding,
+            'crossover_chance': args.crossover_chance,
+            'mutation_chance': args.mutation_chance,
+            'max_population_count': args.population,
+            'max_generation_count': args.generations
+        }
+        if args.stagnation is not None:
+            solver_options['max_iterations_without_change'] = args.stagnation
+        if args.coarsen > 1:
+            from src.utils.multiresolution import MultiResolutionSolver
+            result = MultiResolutionSolver(scheduling_data, args.coarsen, args.coarse_seeds, args.refine_radius,
+                                           seed=args.seed, time_budget=time_budget, progress=progress,
+                                           **solver_options).solve()
+        elif args.islands > 1:
+            from src.utils.island import IslandSolver
+            result = IslandSolver(scheduling_data, args.islands, args.migration_interval, args.migration_size,
+                                  seed=args.seed, time_budget=time_budget, progress=progress,
+                                  **solver_options).solve()
+        else:
+            from src.utils.checkpoint import CheckpointError, load_checkpoint
+            from src.utils.genetic import GeneticSolver
+            state = None
+            if args.resume:
+                try:
+                    state = load_checkpoint(args.resume, scheduling_data)
+                except CheckpointError as e:
+                    sys.stderr.write('Error resuming from \'{}\': {}\n'.format(args.resume, e))
+                    exit(1)
+                progress.event('Resuming from generation #{}.', state['generation_counter'])
+            telemetry = None
+            try:
+                if args.telemetry:
+                    telemetry = open(args.telemetry, 'w')
+                result = GeneticSolver(scheduling_data, seed=args.seed, state=state, time_budget=time_budget,
+                                       progress=progress, checkpoint_path=args.checkpoint or args.resume,
+                                       checkpoint_interval=args.checkpoint_interval, telemetry=telemetry,
+                                       **solver_options).solve()
+            finally:
+                if telemetry:
+                    telemetry.close()
+    if reduction:
+        result = reduction.restore(result)
+    return result
+
+
+def result_record(member, solution):
+    """
+    Converts the best schedule of an instance into a JSON-serializable result record.
+
+    :param member: The best member, the starting times of projects.
+    :type member: tuple
+    :param solution: The solution of the member, in the format returned by :meth:`SchedulingSolver.solve`.
+    :type solution: tuple
+    :return: The shortage, the starting times and the intervals with assignments, or a null shortage if no solution
+             was found.
+    :rtype: dict
+    """
+    if not member or not solution:
+        return {'shortage': None}
+    return {
+        'shortage': solution[0],
+        'start_times': list(member),
+        'intervals': [{'from': interval[0], 'to': interval[1], 'projects': sorted(interval[2]),
+                       'assignments': [list(assignment) for assignment in assignments]}
+                      for assignments, interval in zip(solution[1], solution[2])]
+    }
+
+
+def _raise_interrupt(signum, frame):
+    raise KeyboardInterrupt()
+
+
+def run_server(arg_parser, args):
+    """
+    Runs the solver server until it is interrupted.
+
+    :param arg_parser: The parser of the command line arguments, used to report invalid combinations of them.
+    :type arg_parser: argparse.ArgumentParser
+    :param args: The parsed command line arguments, configuring the search of every request.
+    :type args: argparse.Namespace
+    """
+    if args.filename or args.batch:
+        arg_parser.error('--serve takes no input files, instances are sent in requests')
+    if args.convert or args.checkpoint or args.resume or args.telemetry:
+        arg_parser.error('--convert, checkpoints and telemetry are not supported by the server')
+    if args.islands > 1:
+        arg_parser.error('islands are not supported by the server, requests are already solved in parallel')
+    if args.workers is not None and args.workers < 1:
+        arg_parser.error('--workers must be positive')
+    import multiprocessing
+    from src.utils.server import SolverServer, init_worker, solve_request  # http.server is imported only here
+    worker_count = args.workers or os.cpu_count() or 1
+    init_logging()
+    progress = ProgressReporter(args.progress, args.progress_interval)
+    with multiprocessing.Pool(worker_count, initializer=init_worker, initargs=(args.backend,)) as pool:
+        try:
+            server = SolverServer(args.serve, lambda request: pool.apply(solve_request, ((request, args),)),
+                                  progress)
+        except (ValueError, OSError) as e:
+            sys.stderr.write('Error listening on \'{}\': {}\n'.format(args.serve, e))
+            exit(1)
+        signal.signal(signal.SIGTERM, _raise_interrupt)  # installed after forking, the workers keep the default
+        progress.event('Solving requests with {} worker processes.', worker_count)
+        server.serve_forever()
 
 
 if __name__ == '__main__':
@@ -1,3 +1,61 @@
+from collections.abc import Sequence
+
+
+class SparseVector(Sequence):
+    """
+    A skill or requirement vector stored as its non-zero entries.
+
+    It behaves like a dense read-only list of the given length, but :func:`nonzero_items` iterates only the non-zero
+    entries, so code using it scales with the number of non-zero entries instead of the number of skills.
+    """
+
+    def __init__(self, length, items):
+        """
+        Constructor.
+
+        :param length: The length of the dense vector.
+        :type length: int
+        :param items: The (index, value) pairs of the non-zero entries, ordered by index.
+        :type items: list
+        """
+        self.length = length
+        self.items = items
+        self.values = dict(items)
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self)[index]
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError('vector index out of range')
+        return self.values.get(index, 0)
+
+    def __iter__(self):
+        dense = [0] * self.length
+        for index, value in self.items:
+            dense[index] = value
+        return iter(dense)
+
+    def __repr__(self):
+        return 'SparseVector({}, {})'.format(self.length, self.items)
+
+
+def nonzero_items(vector):
+    """
+    Iterates the non-zero entries of a dense or sparse vector.
+
+    :param vector: A list or a :class:`SparseVector`.
+    :return: An iterable of (index, value) pairs ordered by index.
+    """
+    if isinstance(vector, SparseVector):
+        return vector.items
+    return ((index, value) for index, value in enumerate(vector) if value)
+
+
 class ProblemData:
     """
     Stores all required data associated with a problem instance:
@@ -76,15 +134,14 @@ class ProblemResult:
 
 
 class SchedulingData:
-    experts = []
-    projects = []
-
     def __init__(self, counts):
         assert len(counts) == 4
         self.skill_count = counts[0]
         self.expert_count = counts[1]
         self.project_count = counts[2]
         self.overall_time_units = counts[3]
+        self.experts = []
+        self.projects = []
 
     def add_expert(self, expert_vector):
         self.experts.append(expert_vector)
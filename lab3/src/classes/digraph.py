@@ -0,0 +1,94 @@
+class DiGraph:
+    """
+    Directed graph stored as a dictionary of adjacency dictionaries.
+
+    Implements the subset of the interface of :class:`networkx.DiGraph` used by :mod:`src.algorithms.maxflow`, with
+    the same ordering of nodes and edges (the order they were added in), so that both containers give the same
+    maximum flows.
+    """
+    def __init__(self):
+        """Constructor."""
+        self._succ = {}
+
+    def add_node(self, node):
+        """
+        Adds a node to the graph, if it isn't in the graph yet.
+
+        :param node: The node to add.
+        """
+        if node not in self._succ:
+            self._succ[node] = {}
+
+    def add_nodes_from(self, nodes):
+        """
+        Adds nodes from the supplied iterable to the graph.
+
+        :param nodes: An iterable containing the nodes to add.
+        """
+        for node in nodes:
+            self.add_node(node)
+
+    def add_edge(self, u, v, **attr):
+        """
+        Adds a directed edge, together with its end nodes, or updates the attributes of an existing edge.
+
+        :param u: The node to start the edge in.
+        :param v: The node to end the edge in.
+        :param attr: The attributes of the edge, e.g. its capacity.
+        """
+        succ = self._succ
+        if u not in succ:
+            succ[u] = {}
+        if v not in succ:
+            succ[v] = {}
+        edge = succ[u].get(v)
+        if edge is None:
+            succ[u][v] = attr
+        else:
+            edge.update(attr)
+
+    @property
+    def nodes(self):
+        """
+        The nodes of the graph.
+
+        :return: A view of the nodes, in the order they were added.
+        """
+        return self._succ.keys()
+
+    def edges(self, nbunch=None, data=False):
+        """
+        Iterates the edges of the graph or the edges starting in a single node.
+
+        :param nbunch: The node to iterate the edges of, None for all edges.
+        :param data: Whether to yield the attribute dictionaries of the edges too.
+        :type data: bool
+        :return: An iterator of the tuples (u, v), or (u, v, attributes) if *data* is set.
+        """
+        nodes = self._succ if nbunch is None else [nbunch]
+        for u in nodes:
+            for v, attr in self._succ[u].items():
+                yield (u, v, attr) if data else (u, v)
+
+    def copy(self):
+        """
+        Makes a copy of the graph with copies of the attribute dictionaries of all edges.
+
+        :return: A copy of the graph.
+        :rtype: DiGraph
+        """
+        graph = DiGraph()
+        graph._succ = {u: {v: dict(attr) for v, attr in nbrs.items()} for u, nbrs in self._succ.items()}
+        return graph
+
+    def __iter__(self):
+        return iter(self._succ)
+
+    def __len__(self):
+        return len(self._succ)
+
+    def __contains__(self, node):
+        return node in self._succ
+
+    def __getitem__(self, node):
+        return self._succ[node]
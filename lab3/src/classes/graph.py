@@ -1,15 +1,49 @@
-import networkx as nx
 from src.algorithms.maxflow import edmonds_karp
+from src.classes.digraph import DiGraph
+
+BACKENDS = ['dict', 'networkx']
+
+# The container used by new graphs, networkx is imported only when its backend is selected.
+_backend = 'dict'
+
+
+def set_backend(name):
+    """
+    Selects the container used by new graphs.
+
+    :param name: 'dict' for :class:`src.classes.digraph.DiGraph`, 'networkx' for :class:`networkx.DiGraph`.
+    :type name: str
+    :raise ImportError: When networkx is selected, but it is not installed.
+    """
+    global _backend
+    assert name in BACKENDS
+    if name == 'networkx':
+        import networkx  # noqa: F401 (fail now rather than when the first graph is built)
+    _backend = name
+
+
+def _new_digraph():
+    """
+    Creates an empty container of the selected backend.
+
+    :return: An empty directed graph.
+    :rtype: DiGraph or networkx.DiGraph
+    """
+    if _backend == 'networkx':
+        import networkx as nx
+        return nx.DiGraph()
+    return DiGraph()
 
 
 class Graph:
     """
     Wrapper class for directed graphs.
-    Internally uses :class:`nx.DiGraph` as a data structure.
+    Internally uses :class:`src.classes.digraph.DiGraph` or, with the networkx backend, :class:`networkx.DiGraph`
+    as a data structure.
     """
     def __init__(self):
         """Constructor."""
-        self._internal_graph = nx.DiGraph()
+        self._internal_graph = _new_digraph()
 
     def add_nodes(self, node_list):
         """
@@ -33,6 +67,17 @@ class Graph:
         """
         self._internal_graph.add_edge(v_from, v_to, capacity=capacity)
 
+    def copy(self):
+        """
+        Makes a copy of the graph, which can be extended without changing the original.
+
+        :return: A copy of the graph.
+        :rtype: Graph
+        """
+        graph = Graph()
+        graph._internal_graph = self._internal_graph.copy()
+        return graph
+
     def maximum_flow(self, s, t):
         """
         Calculates the maximum flow in the network graph.
@@ -76,3 +121,15 @@ class Flow:
         :rtype: int
         """
         return self._flow_dict[v_from][v_to]
+
+    def get_flow_values(self, v_from):
+        """
+        Returns the flow values for all edges starting in the supplied vertex.
+
+        :param v_from: The start vertex for the edges.
+        :type v_from: int
+        :return: A dictionary mapping the end vertices of the edges to the values of the flow on them,
+                 in the order the edges were added.
+        :rtype: dict
+        """
+        return self._flow_dict[v_from]
@@ -0,0 +1,83 @@
+import math
+from src.utils.scheduling import SchedulingSolver
+
+
+class AnnealingSolver(SchedulingSolver):
+    def __init__(self, scheduling_data, seed=None, verbose=True, seeding='random',
+                 max_iteration_count=10000, max_iterations_without_change=2000,
+                 initial_temperature=None, cooling_rate=0.999,
+                 time_budget=None, on_improvement=None, progress=None):
+        super().__init__(scheduling_data, seed=seed, verbose=verbose, seeding=seeding,
+                         time_budget=time_budget, on_improvement=on_improvement, progress=progress)
+        self.max_iteration_count = max_iteration_count
+        self.max_iterations_without_change = max_iterations_without_change
+        self.initial_temperature = initial_temperature  # estimated from random moves if not given
+        self.cooling_rate = cooling_rate  # the temperature is multiplied by it after every iteration
+
+    # moves one random project to another valid start time
+    def _random_move(self, member):
+        i = self.random.choice(self.mutable_genes)
+        lo, hi = self.domains[i]
+        gene = self.random.randint(lo, hi - 1)
+        return member[:i] + ((gene + 1 if gene >= member[i] else gene),) + member[i + 1:]
+
+    # estimates the temperature at which a typical worsening move is accepted with probability 1/2
+    def _estimate_temperature(self, member, solution, sample_count=20):
+        worsenings = []
+        for _ in range(sample_count):
+            _, neighbour_solution = self._evaluate_canonical(self._random_move(member), member, solution)
+            if neighbour_solution[0] > solution[0]:
+                worsenings.append(neighbour_solution[0] - solution[0])
+        if not worsenings:
+            return 1.0
+        return sum(worsenings) / len(worsenings) / math.log(2)
+
+    # solving the problem using simulated annealing
+    def solve(self):
+        self._start_clock()
+        member, solution = self._evaluate_canonical(self._seed_members(1)[0])
+        best_member, best_solution = member, solution
+        self._report_improvement(best_member, best_solution)
+        last_change_in_best = 0
+
+        if solution[0] > 0 and self.mutable_genes:
+            temperature = self.initial_temperature or self._estimate_temperature(member, solution)
+            self.progress.event('Annealing from shortage {} at temperature {:.3f}.', solution[0], temperature)
+        else:
+            temperature = 0
+
+        reason = 'Found optimal solution. Finishing algorithm.'
+        for iteration in range(1, self.max_iteration_count + 1):
+            if best_solution[0] == 0:
+                break
+            if not self.mutable_genes:
+                reason = 'No project can be moved. Finishing algorithm.'
+                break
+            if iteration - last_change_in_best > self.max_iterations_without_change:
+                reason = 'Best result has not changed for {} iterations. Finishing algorithm.'\
+                    .format(self.max_iterations_without_change)
+                break
+            if self._out_of_time():
+                reason = 'Time budget of {:g}s has run out. Finishing algorithm.'.format(self.time_budget)
+                break
+
+            neighbour, neighbour_solution = self._evaluate_canonical(self._random_move(member), member, solution)
+            delta = neighbour_solution[0] - solution[0]
+            if delta <= 0 or (temperature > 0 and self.random.random() < math.exp(-delta / temperature)):
+                member, solution = neighbour, neighbour_solution
+                if solution[0] < best_solution[0]:
+                    best_member, best_solution = member, solution
+                    last_change_in_best = iteration
+                    self._report_improvement(best_member, best_solution)
+            temperature *= self.cooling_rate
+
+            if iteration % 100 == 0:
+                self.progress.status('Iteration #{iteration}: current shortage {shortage}, best shortage '
+                                     '{best_shortage}, temperature {temperature:.3f}.',
+                                     iteration=iteration, shortage=solution[0], best_shortage=best_solution[0],
+                                     temperature=temperature)
+        else:
+            reason = 'Reached iteration limit. Finishing algorithm.'
+
+        self.progress.event(reason)
+        return best_member, best_solution
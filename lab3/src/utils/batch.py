@@ -0,0 +1,130 @@
+import json
+import multiprocessing
+import os
+import signal
+import sys
+import time
+
+from src.assignment import TIMEOUT_GRACE, init_logging, load_instance, result_record, solve_instance
+from src.classes.graph import set_backend
+from src.utils.compression import DECOMPRESSION_ERRORS, STDIN
+from src.utils.parser import ParseError
+from src.utils.progress import SILENT, ProgressReporter
+
+
+class _InstanceTimeout(Exception):
+    """Exception type thrown in a batch worker when an instance runs past its timeout and grace period."""
+    pass
+
+
+def _raise_timeout(signum, frame):
+    raise _InstanceTimeout()
+
+
+def _solve_batch_file(task):
+    """
+    Parses and solves a single instance of a batch in a worker process.
+
+    Every error is caught and recorded, so that a single invalid instance doesn't stop the batch.
+
+    :param task: A tuple containing the file name and the parsed command line arguments.
+    :type task: tuple
+    :return: The result record of the instance, see :func:`src.assignment.result_record`, with the file name, the
+             status ('ok', 'error' or 'timeout') and the elapsed time.
+    :rtype: dict
+    """
+    filename, args = task
+    set_backend(args.backend)
+    start = time.monotonic()
+    record = {'file': filename}
+    timer = args.instance_timeout is not None and hasattr(signal, 'setitimer')
+    if timer:
+        signal.signal(signal.SIGALRM, _raise_timeout)
+        signal.setitimer(signal.ITIMER_REAL, args.instance_timeout + TIMEOUT_GRACE)
+    try:
+        scheduling_data = load_instance(filename, args.parser, args.format)
+        time_budget = args.time_budget
+        if args.instance_timeout is not None:
+            remaining = max(0.0, args.instance_timeout - (time.monotonic() - start))
+            time_budget = remaining if time_budget is None else min(time_budget, remaining)
+        member, solution = solve_instance(scheduling_data, args, ProgressReporter(SILENT), time_budget)
+        record['status'] = 'ok'
+        record.update(result_record(member, solution))
+    except _InstanceTimeout:
+        record['status'] = 'timeout'
+    except (IOError, ParseError) + DECOMPRESSION_ERRORS as e:
+        record.update(status='error', error=str(e))
+    except Exception as e:
+        record.update(status='error', error='{}: {}'.format(type(e).__name__, e))
+    finally:
+        if timer:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+    record['elapsed'] = round(time.monotonic() - start, 3)
+    return record
+
+
+def batch_files(paths):
+    """
+    Lists the instance files of a batch.
+
+    :param paths: Names of files and of directories, whose regular files (not descending into subdirectories) are
+                  taken in the order of their names.
+    :type paths: list
+    :return: The file names.
+    :rtype: list
+    """
+    filenames = []
+    for path in paths:
+        if os.path.isdir(path):
+            filenames.extend(sorted(entry.path for entry in os.scandir(path) if entry.is_file()))
+        else:
+            filenames.append(path)
+    return filenames
+
+
+def run_batch(arg_parser, args):
+    """
+    Solves many instances in a pool of worker processes and writes one JSON result record per line, in the order
+    the instances are finished.
+
+    :param arg_parser: The parser of the command line arguments, used to report invalid combinations of them.
+    :type arg_parser: argparse.ArgumentParser
+    :param args: The parsed command line arguments.
+    :type args: argparse.Namespace
+    """
+    if args.convert or args.checkpoint or args.resume or args.telemetry:
+        arg_parser.error('--convert, checkpoints and telemetry are not supported in batch mode')
+    if args.islands > 1:
+        arg_parser.error('islands are not supported in batch mode, the instances are already solved in parallel')
+    if STDIN in args.filename:
+        arg_parser.error('the standard input can\'t be read in batch mode')
+    if args.workers is not None and args.workers < 1:
+        arg_parser.error('--workers must be positive')
+    if args.instance_timeout is not None and args.instance_timeout <= 0:
+        arg_parser.error('--instance-timeout must be positive')
+    filenames = batch_files(args.filename)
+    worker_count = min(args.workers or os.cpu_count() or 1, max(1, len(filenames)))
+    init_logging(sys.stdout if args.output else sys.stderr)
+    progress = ProgressReporter(args.progress, args.progress_interval)
+    progress.event('Solving {} instances with {} worker processes.', len(filenames), worker_count)
+
+    try:
+        output_file = open(args.output, 'w') if args.output else sys.stdout
+    except IOError as e:
+        sys.stderr.write('Error opening \'{}\': {}\n'.format(args.output, e))
+        exit(1)
+    statuses = {'ok': 0, 'error': 0, 'timeout': 0}
+    try:
+        with multiprocessing.Pool(worker_count) as pool:
+            tasks = [(filename, args) for filename in filenames]
+            for record in pool.imap_unordered(_solve_batch_file, tasks):
+                output_file.write(json.dumps(record) + '\n')
+                output_file.flush()
+                statuses[record['status']] += 1
+                progress.status('{done} of {total} instances finished, {failed} failed.', done=sum(statuses.values()),
+                                total=len(filenames), failed=statuses['error'] + statuses['timeout'])
+    finally:
+        if output_file is not sys.stdout:
+            output_file.close()
+    progress.event('Batch finished: {} solved, {} failed, {} timed out.',
+                   statuses['ok'], statuses['error'], statuses['timeout'])
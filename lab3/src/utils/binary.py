@@ -0,0 +1,249 @@
+import array
+import itertools
+import mmap
+import struct
+import sys
+from collections.abc import Sequence
+
+from src.classes.data import SchedulingData
+from src.utils.parser import ParseError
+
+# Layout of a binary instance file (all numbers are little-endian):
+#
+#     - the magic bytes and the counts of skills, experts, projects and overall time units as uint32,
+#     - the skill rows of all experts, every row bit-packed into ceil(skill_count / 8) bytes, the skill *s* being
+#       the bit *s % 8* of the byte *s // 8*,
+#     - padding to a multiple of 4 bytes,
+#     - the requirement vectors of all projects as a (project_count x skill_count) uint32 array,
+#     - the numbers of time units of all projects as a uint32 array.
+MAGIC = b'TAIOBIN1'
+_HEADER = struct.Struct('<8sIIII')
+
+# Bits of every byte value, from the least significant one.
+_BITS = [tuple((byte >> bit) & 1 for bit in range(8)) for byte in range(256)]
+
+# Instances already mapped in this process, so that views unpickled in worker processes share one mapping.
+_instances = {}
+
+
+def is_binary_instance(file):
+    """
+    Checks if a file starts with the magic bytes of the binary instance format.
+
+    :param file: A file object opened in binary mode, its position is restored.
+    :return: Whether the file is a binary instance.
+    :rtype: bool
+    """
+    position = file.tell()
+    magic = file.read(len(MAGIC))
+    file.seek(position)
+    return magic == MAGIC
+
+
+def write_binary(data, file):
+    """
+    Writes a problem instance in the binary format.
+
+    :param data: The problem instance.
+    :type data: SchedulingData
+    :param file: A file object opened for writing in binary mode.
+    """
+    row_size = (data.skill_count + 7) // 8
+    file.write(_HEADER.pack(MAGIC, data.skill_count, data.expert_count, data.project_count,
+                            data.overall_time_units))
+    for expert in data.experts:
+        file.write(sum(1 << skill_id for skill_id, has_skill in enumerate(expert) if has_skill)
+                   .to_bytes(row_size, 'little'))
+    file.write(bytes(-(_HEADER.size + data.expert_count * row_size) % 4))
+    requirements = array.array('I', itertools.chain.from_iterable(requirements for requirements, _ in data.projects))
+    lengths = array.array('I', (p_length for _, p_length in data.projects))
+    if sys.byteorder != 'little':
+        requirements.byteswap()
+        lengths.byteswap()
+    file.write(requirements.tobytes())
+    file.write(lengths.tobytes())
+
+
+def load_binary(path):
+    """
+    Loads a problem instance from a binary file by memory-mapping it.
+
+    Nothing but the header and the project lengths is read: the experts and projects of the returned instance are
+    read-only views of the mapped file, so pages of the file are loaded only when they are touched.
+
+    :param path: The path of the file.
+    :type path: str
+    :return: A :class:`SchedulingData` object with problem instance info.
+    :rtype: SchedulingData
+    :raise ParseError: A :class:`ParseError` is thrown when the file is not a valid binary instance.
+    """
+    instance = _instances.get(path)
+    if instance is None:
+        instance = _instances[path] = BinaryInstance(path)
+    data = SchedulingData([instance.skill_count, instance.expert_count, instance.project_count,
+                           instance.overall_time_units])
+    data.experts = ExpertRows(instance)
+    data.projects = ProjectList(instance)
+    return data
+
+
+def _view(path, kind, index=None):
+    """Re-creates a view of a binary instance when it is unpickled, e.g. in a worker process."""
+    data = load_binary(path)
+    if kind == 'experts':
+        return data.experts if index is None else data.experts[index]
+    return data.projects if index is None else data.projects[index][0]
+
+
+class BinaryInstance:
+    """A memory-mapped binary instance file."""
+
+    def __init__(self, path):
+        """
+        Maps the file and checks its header and size.
+
+        :param path: The path of the file.
+        :type path: str
+        :raise ParseError: A :class:`ParseError` is thrown when the file is not a valid binary instance.
+        """
+        self.path = path
+        with open(path, 'rb') as file:
+            header = file.read(_HEADER.size)
+            if len(header) < _HEADER.size or header[:len(MAGIC)] != MAGIC:
+                raise ParseError('Not a binary instance file')
+            _, self.skill_count, self.expert_count, self.project_count, self.overall_time_units = \
+                _HEADER.unpack(header)
+            if self.skill_count < 1 or self.overall_time_units < 1:
+                raise ParseError('The numbers of skills and overall time units must be positive.')
+            self.row_size = (self.skill_count + 7) // 8
+            rows_end = _HEADER.size + self.expert_count * self.row_size
+            self.requirements_offset = rows_end + (-rows_end % 4)
+            self.lengths_offset = self.requirements_offset + 4 * self.project_count * self.skill_count
+            size = self.lengths_offset + 4 * self.project_count
+            file.seek(0, 2)
+            if file.tell() != size:
+                raise ParseError('Binary instance file has {} bytes, {} expected'.format(file.tell(), size))
+            self.buffer = memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+
+        self.requirements = self._uint32_array(self.requirements_offset, self.project_count * self.skill_count)
+        self.lengths = self._uint32_array(self.lengths_offset, self.project_count)
+        for project_id, p_length in enumerate(self.lengths):
+            if not 1 <= p_length <= self.overall_time_units:
+                raise ParseError('Project {}: The number of project time units must be between 1 and {}'
+                                 .format(project_id, self.overall_time_units))
+
+    def _uint32_array(self, offset, count):
+        """
+        Gives a view of a uint32 array in the file, without copying it unless the byte order needs swapping.
+
+        :param offset: The offset of the array in the file.
+        :type offset: int
+        :param count: The number of elements of the array.
+        :type count: int
+        :return: A sequence of the elements.
+        """
+        view = self.buffer[offset:offset + 4 * count]
+        if sys.byteorder == 'little' and struct.calcsize('I') == 4:
+            return view.cast('I')
+        values = array.array('I', view.tobytes())
+        values.byteswap()
+        return values
+
+
+class BitRow(Sequence):
+    """Read-only view of an expert's bit-packed skill row, behaving like a list of zeros and ones."""
+
+    def __init__(self, instance, expert_id):
+        self.instance = instance
+        self.expert_id = expert_id
+        offset = _HEADER.size + expert_id * instance.row_size
+        self.bytes = instance.buffer[offset:offset + instance.row_size]
+
+    def __len__(self):
+        return self.instance.skill_count
+
+    def __getitem__(self, skill_id):
+        if isinstance(skill_id, slice):
+            return list(self)[skill_id]
+        if skill_id < 0:
+            skill_id += len(self)
+        if not 0 <= skill_id < len(self):
+            raise IndexError('skill index out of range')
+        return (self.bytes[skill_id >> 3] >> (skill_id & 7)) & 1
+
+    def __iter__(self):
+        return itertools.islice(itertools.chain.from_iterable(_BITS[byte] for byte in self.bytes), len(self))
+
+    def __reduce__(self):
+        return _view, (self.instance.path, 'experts', self.expert_id)
+
+
+class ExpertRows(Sequence):
+    """Read-only view of the skill rows of all experts of a binary instance."""
+
+    def __init__(self, instance):
+        self.instance = instance
+
+    def __len__(self):
+        return self.instance.expert_count
+
+    def __getitem__(self, expert_id):
+        if isinstance(expert_id, slice):
+            return [self[i] for i in range(*expert_id.indices(len(self)))]
+        if expert_id < 0:
+            expert_id += len(self)
+        if not 0 <= expert_id < len(self):
+            raise IndexError('expert index out of range')
+        return BitRow(self.instance, expert_id)
+
+    def __reduce__(self):
+        return _view, (self.instance.path, 'experts')
+
+
+class ProjectList(Sequence):
+    """
+    Read-only view of the projects of a binary instance, behaving like a list of tuples (requirement vector,
+    number of time units), where the requirement vectors are views of the mapped file.
+    """
+
+    def __init__(self, instance):
+        self.instance = instance
+
+    def __len__(self):
+        return self.instance.project_count
+
+    def __getitem__(self, project_id):
+        if isinstance(project_id, slice):
+            return [self[i] for i in range(*project_id.indices(len(self)))]
+        if project_id < 0:
+            project_id += len(self)
+        if not 0 <= project_id < len(self):
+            raise IndexError('project index out of range')
+        return RequirementsView(self.instance, project_id), self.instance.lengths[project_id]
+
+    def __reduce__(self):
+        return _view, (self.instance.path, 'projects')
+
+
+class RequirementsView(Sequence):
+    """Read-only view of a project's requirement vector in a binary instance."""
+
+    def __init__(self, instance, project_id):
+        self.instance = instance
+        self.project_id = project_id
+        offset = project_id * instance.skill_count
+        self.values = instance.requirements[offset:offset + instance.skill_count]
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, skill_id):
+        if isinstance(skill_id, slice):
+            return list(self.values[skill_id])
+        return self.values[skill_id]
+
+    def __iter__(self):
+        return iter(self.values)
+
+    def __reduce__(self):
+        return _view, (self.instance.path, 'projects', self.project_id)
@@ -0,0 +1,72 @@
+from src.classes.data import nonzero_items
+
+
+def count_skill_supply(scheduling_data):
+    """
+    Counts the experts having every skill.
+
+    :param scheduling_data: The problem instance.
+    :type scheduling_data: src.classes.data.SchedulingData
+    :return: A list containing the number of experts having each skill.
+    :rtype: list
+    """
+    skill_supply = [0] * scheduling_data.skill_count
+    for expert in scheduling_data.experts:
+        for skill_id, has_skill in nonzero_items(expert):
+            if has_skill > 0:
+                skill_supply[skill_id] += 1
+    return skill_supply
+
+
+class ShortageBounds:
+    """
+    Computes cheap lower bounds on the expert shortage, without solving any maximum flow problem.
+
+    For a set of projects working at the same time, let *d(s)* be the total demand for skill *s* and *e(s)*
+    the number of experts having skill *s*. At most *e(s)* experts can work using skill *s* and at most
+    *expert_count* experts can work at all, so the shortage is at least:
+
+        - the sum of ``max(0, d(s) - e(s))`` over all skills,
+        - ``max(0, sum of d(s) - expert_count)``,
+
+    whichever is larger.
+    """
+
+    def __init__(self, scheduling_data):
+        """
+        Precomputes the supply of every skill.
+
+        :param scheduling_data: The problem instance.
+        :type scheduling_data: src.classes.data.SchedulingData
+        """
+        self.projects = scheduling_data.projects
+        self.expert_count = scheduling_data.expert_count
+        self.skill_supply = count_skill_supply(scheduling_data)
+
+    def interval_bound(self, project_ids):
+        """
+        Computes the lower bound on the shortage in a single time unit of an interval.
+
+        :param project_ids: The IDs of the projects active in the interval.
+        :type project_ids: set
+        :return: The lower bound on the shortage in one time unit.
+        :rtype: int
+        """
+        demand = {}  # skill ID -> demand, only for the skills the projects need
+        for project_id in project_ids:
+            for skill_id, need in nonzero_items(self.projects[project_id][0]):
+                demand[skill_id] = demand.get(skill_id, 0) + need
+        skill_bound = sum(max(0, need - self.skill_supply[skill_id]) for skill_id, need in demand.items())
+        expert_bound = max(0, sum(demand.values()) - self.expert_count)
+        return max(skill_bound, expert_bound)
+
+    def schedule_bound(self, intervals):
+        """
+        Computes the lower bound on the total shortage of a schedule.
+
+        :param intervals: The intervals of the schedule, as returned by :meth:`SchedulingSolver._find_intervals`.
+        :type intervals: list
+        :return: The lower bound on the total shortage.
+        :rtype: int
+        """
+        return sum(self.interval_bound(interval[2]) * (interval[1] - interval[0]) for interval in intervals)
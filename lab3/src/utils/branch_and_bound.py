@@ -0,0 +1,159 @@
+from src.classes.data import nonzero_items
+from src.utils.scheduling import SchedulingSolver
+
+
+class BranchAndBoundSolver(SchedulingSolver):
+    def __init__(self, scheduling_data, seed=None, verbose=True, seeding='mixed', max_node_count=None,
+                 time_budget=None, on_improvement=None, progress=None):
+        super().__init__(scheduling_data, seed=seed, verbose=verbose, seeding=seeding,
+                         time_budget=time_budget, on_improvement=on_improvement, progress=progress)
+        self.max_node_count = max_node_count  # None means searching until the optimum is proven
+        self.interval_shortages = {}  # frozenset of project IDs -> shortage in one time unit
+        self.added_shortages = {}  # (frozenset of project IDs, project ID) -> shortage added in one time unit
+        self.node_count = 0
+        self.best_member = None
+        self.best_shortage = None
+        self.stopped = None  # the limit which interrupted the search, None if it ran to completion
+
+    # checks the node limit and the time budget, the search is interrupted once any of them is hit
+    def _limit_reached(self):
+        if self.max_node_count is not None and self.node_count >= self.max_node_count:
+            self.stopped = 'node limit'
+        elif self._out_of_time():
+            self.stopped = 'time budget'
+        return self.stopped is not None
+
+    # reports a new best schedule found by the search
+    def _improve(self, member, shortage):
+        self.best_member, self.best_shortage = member, shortage
+        if self.on_improvement:
+            self._report_improvement(*self._evaluate_canonical(member))
+
+    # shortage in one time unit of an interval with given projects, every project set is solved only once
+    def _interval_shortage(self, project_ids):
+        if not project_ids:
+            return 0
+        shortage = self.interval_shortages.get(project_ids)
+        if shortage is None:
+            shortage = self._solve_interval((None, None, project_ids)).shortage
+            self.interval_shortages[project_ids] = shortage
+        return shortage
+
+    # the partial schedule is kept as segments (t_from, t_to, projects, shortage in one time unit) covering the whole
+    # time horizon; placing a project changes only the segments overlapping its span [start, start + length),
+    # so the shortage a placement adds is computed from these segments alone
+    def _placement_shortage(self, segments, i, start):
+        end = start + self.scheduling_data.projects[i][1]
+        added = 0
+        for s_from, s_to, s_projects, s_shortage in segments:
+            if s_to <= start:
+                continue
+            if end <= s_from:
+                break
+            unit_added = self.added_shortages.get((s_projects, i))
+            if unit_added is None:
+                unit_added = self._interval_shortage(s_projects | {i}) - s_shortage
+                self.added_shortages[s_projects, i] = unit_added
+            if unit_added:
+                added += unit_added * ((s_to if s_to < end else end) - (s_from if s_from > start else start))
+        return added
+
+    # segments of the partial schedule after placing project i at start, the ones overlapping its span are split
+    def _place(self, segments, i, start):
+        end = start + self.scheduling_data.projects[i][1]
+        placed = []
+        for segment in segments:
+            s_from, s_to, s_projects, s_shortage = segment
+            if s_to <= start or end <= s_from:
+                placed.append(segment)
+                continue
+            if s_from < start:
+                placed.append((s_from, start, s_projects, s_shortage))
+            projects = s_projects | {i}
+            placed.append((max(s_from, start), min(s_to, end), projects, self._interval_shortage(projects)))
+            if end < s_to:
+                placed.append((end, s_to, s_projects, s_shortage))
+        return placed
+
+    # lower bound on the shortage the projects from given depth on add to a partial schedule:
+    # the maximum flow is submodular in the set of projects, so the shortage a project adds to an interval can only
+    # grow as more projects are placed; every remaining project therefore adds at least the least shortage it would
+    # add at any of its start times to the current segments
+    def _remaining_bound(self, segments, depth):
+        bound = 0
+        for i in self.order[depth:]:
+            lo, hi = self.domains[i]
+            bound += min(self._placement_shortage(segments, i, start) for start in range(lo, hi + 1))
+        return bound
+
+    # assigns start times to projects in self.order from given depth on, depth-first; shifting a whole schedule
+    # doesn't change its shortage, so only schedules with some project at the earliest start of its domain
+    # (anchored ones, like the canonical forms) are searched
+    def _branch(self, starts, depth, fixed_shortage, segments, anchored):
+        if self.stopped or self._limit_reached():
+            return
+        self.node_count += 1
+
+        if depth == len(self.order):
+            if fixed_shortage < self.best_shortage:
+                self._improve(tuple(starts), fixed_shortage)
+                self.progress.status('> Found schedule with shortage {best_shortage} after {nodes} nodes.',
+                                     best_shortage=fixed_shortage, nodes=self.node_count)
+            return
+
+        i = self.order[depth]
+        lo, hi = self.domains[i]
+        previous = self.previous_identical[i]
+        if previous is not None:
+            lo = max(lo, starts[previous])  # identical projects are ordered by start times
+        if not anchored and depth == len(self.order) - 1:
+            hi = self.domains[i][0]  # the last project has to anchor the schedule
+
+        remaining_bound = self._remaining_bound(segments, depth + 1)
+        children = []
+        for start in range(lo, hi + 1):
+            child_shortage = fixed_shortage + self._placement_shortage(segments, i, start)
+            children.append((child_shortage + remaining_bound, start, child_shortage))
+        children.sort()
+
+        for bound, start, child_shortage in children:
+            if bound >= self.best_shortage:
+                break  # children are sorted by their bounds, so the remaining ones can't be better either
+            starts[i] = start
+            self._branch(starts, depth + 1, child_shortage, self._place(segments, i, start),
+                         anchored or start == self.domains[i][0])
+            starts[i] = None
+            if self.best_shortage == 0:
+                return
+
+    # solving the problem by branch and bound, returns an optimal schedule unless the node limit was hit
+    def solve(self):
+        self._start_clock()
+        project_count = self.scheduling_data.project_count
+
+        # most demanding projects first, so that the bounds grow early
+        def demand(i):
+            requirements, p_length = self.scheduling_data.projects[i]
+            return -sum(need for _, need in nonzero_items(requirements)) * p_length, i
+        self.order = sorted(range(project_count), key=demand)
+        self.previous_identical = [None] * project_count
+        for project_ids in self.project_classes:
+            for previous, i in zip(project_ids[:-1], project_ids[1:]):
+                self.previous_identical[i] = previous
+
+        # heuristic schedules give the first upper bound
+        for member in self._seed_members(3):
+            member, solution = self._evaluate_canonical(member)
+            if self.best_shortage is None or solution[0] < self.best_shortage:
+                self._improve(member, solution[0])
+        self.progress.event('Starting branch and bound from shortage {}.', self.best_shortage)
+
+        self._branch([None] * project_count, 0, 0, [(0, self.scheduling_data.overall_time_units, frozenset(), 0)],
+                     False)
+
+        if self.stopped:
+            self.progress.event('Reached {} after {} nodes, the schedule may not be optimal.',
+                                self.stopped, self.node_count)
+        else:
+            self.progress.event('Proved optimality after {} nodes. Finishing algorithm.', self.node_count)
+        return self._evaluate_canonical(self.best_member)
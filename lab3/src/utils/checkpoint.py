@@ -0,0 +1,82 @@
+import gzip
+import hashlib
+import os
+import pickle
+
+from src.classes.data import nonzero_items
+
+# Bumped whenever the layout of the saved state changes, so that old checkpoints are rejected instead of misread.
+CHECKPOINT_VERSION = 1
+
+
+class CheckpointError(Exception):
+    """Exception type thrown when a checkpoint can't be used to resume the search."""
+    pass
+
+
+def instance_digest(scheduling_data):
+    """
+    Computes a digest identifying a problem instance, so that a checkpoint is never resumed on different data.
+
+    :param scheduling_data: The problem instance.
+    :type scheduling_data: src.classes.data.SchedulingData
+    :return: The hexadecimal SHA-256 digest of the instance.
+    :rtype: str
+    """
+    # only the non-zero entries are hashed, so that sparse vectors aren't expanded and an instance has the same
+    # digest in the dense and the sparse format
+    instance = (scheduling_data.skill_count, scheduling_data.expert_count, scheduling_data.project_count,
+                scheduling_data.overall_time_units,
+                [(len(expert), tuple(nonzero_items(expert))) for expert in scheduling_data.experts],
+                [(len(requirements), tuple(nonzero_items(requirements)), p_length)
+                 for requirements, p_length in scheduling_data.projects])
+    return hashlib.sha256(repr(instance).encode()).hexdigest()
+
+
+def save_checkpoint(path, scheduling_data, state):
+    """
+    Saves the state of a search to a compressed file.
+
+    The file is first written next to the target and then renamed over it, so an interrupted write never
+    destroys the previous checkpoint.
+
+    :param path: The path of the checkpoint file.
+    :type path: str
+    :param scheduling_data: The problem instance being solved.
+    :type scheduling_data: src.classes.data.SchedulingData
+    :param state: The state captured by :meth:`src.utils.genetic.GeneticSolver.get_state`.
+    :type state: dict
+    """
+    checkpoint = {
+        'version': CHECKPOINT_VERSION,
+        'instance': instance_digest(scheduling_data),
+        'state': state
+    }
+    temporary_path = path + '.tmp'
+    with gzip.open(temporary_path, 'wb') as checkpoint_file:
+        pickle.dump(checkpoint, checkpoint_file, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temporary_path, path)
+
+
+def load_checkpoint(path, scheduling_data):
+    """
+    Loads the state of a search saved by :func:`save_checkpoint`.
+
+    :param path: The path of the checkpoint file.
+    :type path: str
+    :param scheduling_data: The problem instance to be solved, it must be the one the checkpoint was saved for.
+    :type scheduling_data: src.classes.data.SchedulingData
+    :raises CheckpointError: When the file is not a valid checkpoint or it belongs to a different instance.
+    :return: The saved state, to be passed to :class:`src.utils.genetic.GeneticSolver`.
+    :rtype: dict
+    """
+    try:
+        with gzip.open(path, 'rb') as checkpoint_file:
+            checkpoint = pickle.load(checkpoint_file)
+    except (OSError, EOFError, pickle.UnpicklingError) as e:
+        raise CheckpointError('Can\'t read checkpoint: {}'.format(e))
+    if not isinstance(checkpoint, dict) or checkpoint.get('version') != CHECKPOINT_VERSION:
+        raise CheckpointError('Unsupported checkpoint version.')
+    if checkpoint['instance'] != instance_digest(scheduling_data):
+        raise CheckpointError('Checkpoint was saved for a different problem instance.')
+    return checkpoint['state']
@@ -0,0 +1,124 @@
+import bz2
+import gzip
+import io
+import lzma
+import os
+import sys
+import zlib
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# The file name standing for the standard input.
+STDIN = '-'
+
+# Magic bytes starting the streams of every supported compression format.
+_MAGIC = [
+    (b'\x1f\x8b', 'gzip'),
+    (b'\xfd7zXZ\x00', 'xz'),
+    (b'BZh', 'bz2'),
+    (b'\x28\xb5\x2f\xfd', 'zstd'),
+]
+_MAGIC_SIZE = max(len(magic) for magic, _ in _MAGIC)
+
+# Compression formats assumed by extension when the magic bytes are not recognized, e.g. in a truncated file.
+_EXTENSIONS = {'.gz': 'gzip', '.xz': 'xz', '.lzma': 'xz', '.bz2': 'bz2', '.zst': 'zstd'}
+
+# Exceptions thrown while reading an invalid compressed stream, in addition to OSError; corrupted data which still
+# decompresses fails to decode as text before the checksum at the end of the stream is verified.
+DECOMPRESSION_ERRORS = ((EOFError, zlib.error, lzma.LZMAError, UnicodeDecodeError)
+                        + ((zstandard.ZstdError,) if zstandard is not None else ()))
+
+
+class _PrefixedStream(io.RawIOBase):
+    """Binary stream yielding bytes already read from a non-seekable stream, followed by the rest of the stream."""
+
+    def __init__(self, prefix, stream):
+        self.prefix = prefix
+        self.stream = stream
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        if self.prefix:
+            size = min(len(buffer), len(self.prefix))
+            buffer[:size] = self.prefix[:size]
+            self.prefix = self.prefix[size:]
+            return size
+        data = self.stream.read1(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+
+def detect_compression(magic, filename=None):
+    """
+    Detects the compression format of a stream from its first bytes, or from the extension of its file name.
+
+    :param magic: The first bytes of the stream.
+    :type magic: bytes
+    :param filename: The name of the file, if any.
+    :type filename: str
+    :return: 'gzip', 'xz', 'bz2' or 'zstd', None for an uncompressed stream.
+    :rtype: str
+    """
+    for prefix, compression in _MAGIC:
+        if magic.startswith(prefix):
+            return compression
+    if filename is not None:
+        return _EXTENSIONS.get(os.path.splitext(filename)[1].lower())
+    return None
+
+
+def _decompress(source, compression):
+    """
+    Opens a decompressing binary stream.
+
+    :param source: The name of the compressed file, which is closed with the stream, or a binary stream, which is not.
+    :param compression: The compression format, see :func:`detect_compression`.
+    :type compression: str
+    :return: A binary stream of the decompressed data.
+    :raise OSError: When the file can't be opened or the zstandard package needed for the format is not installed.
+    """
+    if compression == 'gzip':
+        return gzip.open(source, 'rb')
+    if compression == 'xz':
+        return lzma.open(source, 'rb')
+    if compression == 'bz2':
+        return bz2.open(source, 'rb')
+    if zstandard is None:
+        raise OSError('zstd compressed input requires the zstandard package')
+    if isinstance(source, str):
+        source = open(source, 'rb')
+    return io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(source, closefd=True))
+
+
+def open_input(filename):
+    """
+    Opens an input file for reading as text, decompressing it on the fly if it is compressed.
+
+    The data is decompressed while it is being parsed, so no intermediate file is written. gzip, xz and bz2 are
+    always supported, zstd only if the zstandard package is installed.
+
+    :param filename: The name of the file, '-' for the standard input.
+    :type filename: str
+    :return: A text stream of the (decompressed) file, closing the file, but not the standard input, when it is closed.
+    :rtype: io.TextIOWrapper
+    :raise OSError: When the file can't be opened.
+    """
+    if filename == STDIN:
+        magic = sys.stdin.buffer.read(_MAGIC_SIZE)
+        stream = io.BufferedReader(_PrefixedStream(magic, sys.stdin.buffer))
+        compression = detect_compression(magic)
+        if compression is not None:
+            stream = _decompress(stream, compression)
+        return io.TextIOWrapper(stream)
+
+    with open(filename, 'rb') as probe:
+        magic = probe.read(_MAGIC_SIZE)
+    compression = detect_compression(magic, filename)
+    if compression is None:
+        return open(filename, 'r')
+    return io.TextIOWrapper(_decompress(filename, compression))
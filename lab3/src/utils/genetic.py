@@ -1,104 +1,70 @@
-import random
+import heapq
+import json
+import time
 from collections import OrderedDict
-from src.classes.data import ProblemData
-from src.utils.solver import Solver
-
-
-class GeneticSolver:
-    def __init__(self, scheduling_data):
-        self.scheduling_data = scheduling_data
-        self.crossover_chance = 0.67
-        self.mutation_chance = 0.34
-        self.max_population_count = 3
-        self.max_generation_count = 1000
-        self.max_iterations_without_change = 100
-        self.population = self._init_population_valid()  # population may be smaller due to randomized duplicates
-        self.counts = [
-            scheduling_data.skill_count,
-            scheduling_data.expert_count,
-            scheduling_data.project_count
-        ]
-
-    # initializes population with valid members
-    def _init_population_valid(self):
+from contextlib import contextmanager
+from src.utils.bounds import ShortageBounds
+from src.utils.checkpoint import save_checkpoint
+from src.utils.profiling import memory_section
+from src.utils.scheduling import SchedulingSolver
+from src.utils.selection import elitism, stochastic_universal_sampling, truncation_selection
+
+
+class GeneticSolver(SchedulingSolver):
+    def __init__(self, scheduling_data, seed=None, verbose=True, state=None,
+                 selection=stochastic_universal_sampling, elite_count=1,
+                 local_search_budget=0, local_search_moves='neighbors', bound_pruning=False,
+                 seeding='random', domains=None, initial_members=None,
+                 checkpoint_path=None, checkpoint_interval=10,
+                 crossover_chance=0.67, mutation_chance=0.34, max_population_count=3,
+                 max_generation_count=1000, max_iterations_without_change=100,
+                 time_budget=None, on_improvement=None, progress=None, telemetry=None):
+        super().__init__(scheduling_data, seed=seed, verbose=verbose, seeding=seeding, domains=domains,
+                         time_budget=time_budget, on_improvement=on_improvement, progress=progress)
+        self.crossover_chance = crossover_chance
+        self.mutation_chance = mutation_chance
+        self.max_population_count = max_population_count
+        self.max_generation_count = max_generation_count
+        self.max_iterations_without_change = max_iterations_without_change
+        self.selection = selection
+        self.elite_count = elite_count
+        self.local_search_budget = local_search_budget  # evaluations per generation, 0 disables local search
+        self.local_search_moves = local_search_moves  # 'neighbors' (start +/- 1) or 'all' valid start times
+        # lower bounds used to skip evaluation of members which wouldn't survive truncation to the best members;
+        # any other selection may keep a worse member too, so the bounds are used only if survivors are truncated
+        truncation = selection is truncation_selection or elite_count >= max_population_count
+        self.bounds = ShortageBounds(scheduling_data) if bound_pruning and truncation else None
+        self.pruned_solves = 0
+        self.checkpoint_path = checkpoint_path  # None disables checkpointing
+        self.checkpoint_interval = checkpoint_interval  # number of generations between two checkpoints
+        self.checkpoint_generation = None  # generation of the last saved checkpoint
+        self.telemetry = telemetry  # text file receiving one JSON record per generation, None disables telemetry
+        self.telemetry_counters = None  # cumulative counters at the start of the current generation
+        self.phase_times = {}  # phase of the current generation -> seconds spent in it
+        self.generation_stats = {}  # statistics of the current generation's evaluated population
+        self.started = None
+        self.duplicates_rejected = 0
+        self.generation_counter = 1
+        self.best_member = None
+        self.best_solution = None
+        self.last_change_in_best = 0
+        # unevaluated member -> (parent, parent's solution, member before canonicalization), for delta evaluation
+        self.parents = {}
+        if state:
+            self.set_state(state)
+        else:
+            # population may be smaller due to randomized duplicates
+            self.population = self._init_population_valid(initial_members or [])
+
+    # initializes population with given members (repaired to be valid) and members built by the seeding strategy
+    def _init_population_valid(self, initial_members):
         population = OrderedDict()
-        for _ in range(self.max_population_count):
-            member = []
-            for i in range(self.scheduling_data.project_count):
-                p_length = self.scheduling_data.projects[i][1]
-                member.append(random.randint(0, self.scheduling_data.overall_time_units - p_length))
-            population[tuple(member)] = None
+        for member in initial_members:
+            population[self._canonicalize(self._repair(member))] = None
+        for member in self._seed_members(max(0, self.max_population_count - len(population))):
+            population[member] = None
         return population
 
-    # checks if scheduling even makes sense
-    def _validate_scheduling(self, member):
-        for i, p_from in enumerate(member):
-            p_length = self.scheduling_data.projects[i][1]
-            if p_from + p_length > self.scheduling_data.overall_time_units:
-                return False
-        return True
-
-    # finds intervals with assigned projects for given member
-    def _find_intervals(self, member):
-        if self.scheduling_data.project_count == 0:  # no projects specified
-            return []
-
-        events = []
-        projects = []
-
-        for i, p_from in enumerate(member):
-            p_to = p_from + self.scheduling_data.projects[i][1]
-            events.extend([p_from, p_to])
-            projects.append((i, p_from, p_to))
-
-        events = list(set(events))
-        events.sort()
-
-        intervals = []
-        for i_from, i_to in zip(events[:-1], events[1:]):
-            i_projects = set()
-            for i, p_from, p_to in projects:
-                if i_from < p_to and p_from < i_to:
-                    i_projects.add(i)
-            if len(i_projects) > 0:  # don't even consider intervals w/o projects
-                intervals.append((i_from, i_to, i_projects))
-
-        return intervals
-
-    # constructs ProblemData object for projects specified by given interval
-    def _interval_to_problem_data(self, interval):
-        data = ProblemData(self.counts)
-
-        for expert in self.scheduling_data.experts:
-            data.add_expert(expert)
-
-        for i, project in enumerate(self.scheduling_data.projects):
-            if i in interval[2]:
-                data.add_project(project[0])
-            else:
-                data.add_project([0] * self.scheduling_data.skill_count)
-
-        return data
-
-    # fitness function
-    def _solve_scheduling(self, member):
-        if not self._validate_scheduling(member):
-            return -1, None, None  # scheduling doesn't make sense
-
-        total_shortage = 0
-        assignments = []
-
-        intervals = self._find_intervals(member)
-        for interval in intervals:
-            problem_data = self._interval_to_problem_data(interval)
-            problem_result = Solver(problem_data).solve()
-
-            i_length = interval[1] - interval[0]
-            total_shortage += problem_result.shortage * i_length  # problem_result.shortage is in one time unit
-            assignments.append(problem_result.assignment)
-
-        return total_shortage, assignments, intervals
-
     # performs crossover of two members (n division points) and creates two offsprings
     def _n_point_crossover(self, parent1, parent2, n):
         offspring1 = list(parent1)
@@ -108,7 +74,7 @@ class GeneticSolver:
         if self.scheduling_data.project_count <= 1:
             return tuple(offspring1), tuple(offspring2)
 
-        cuts = random.sample(range(1, self.scheduling_data.project_count), n)
+        cuts = self.random.sample(range(1, self.scheduling_data.project_count), n)
         cuts.sort()
         cuts.append(self.scheduling_data.project_count)
 
@@ -116,153 +82,371 @@ class GeneticSolver:
             offspring1[cut_from:cut_to] = parent2[cut_from:cut_to]
             offspring2[cut_from:cut_to] = parent1[cut_from:cut_to]
 
-        return tuple(offspring1), tuple(offspring2)
+        return self._repair(offspring1), self._repair(offspring2)
 
     # performs mutation of n genes in given member and creates a new member
     def _n_point_mutation(self, member, n):
         mutated = list(member)
 
-        # member is empty (no projects) or there's no way to mutate since only one gene is allowed (0)
-        if self.scheduling_data.project_count == 0 or self.scheduling_data.overall_time_units == 1:
+        # member is empty (no projects) or there's no way to mutate since every domain has only one value
+        if len(self.mutable_genes) == 0:
             return tuple(mutated)
 
-        mutation = random.sample(range(0, self.scheduling_data.project_count), n)
-        possible_genes = list(range(0, self.scheduling_data.overall_time_units))
-
-        for i in mutation:
-            original_gene = member[i]
-            possible_genes.remove(original_gene)
-            mutated[i] = random.sample(possible_genes, 1)[0]
-            possible_genes.append(original_gene)
+        for i in self.random.sample(self.mutable_genes, min(n, len(self.mutable_genes))):
+            lo, hi = self.domains[i]
+            gene = self.random.randint(lo, hi - 1)  # pick one of the other hi - lo values in O(1)
+            mutated[i] = gene + 1 if gene >= member[i] else gene
 
         return tuple(mutated)
 
-    # solving the problem using genetic algorithm
-    def solve(self):
-        generation_counter = 1
-        best_member = None
-        best_solution = None
-        last_change_in_best = 0
-
-        while True:
-            # Generation evaluation.
-            current_best_member = None
-            current_best_solution = None
-
-            print('Evaluating generation #{} ({} members)... '
-                  .format(generation_counter, len(self.population)), end='', flush=True)
-            for member, solution in self.population.items():
-                if not solution:
-                    result = self._solve_scheduling(member)
-                    self.population[member] = result
-                if result[0] >= 0:
-                    if (not current_best_solution or current_best_solution[0] < 0) \
-                            or current_best_solution[0] > result[0] >= 0:
-                        current_best_member = member
-                        current_best_solution = result
-            print('Finished.')
-
-            # Updating all-time best result
-            if current_best_solution and current_best_solution[0] >= 0 and \
-                    (not best_solution or best_solution[0] < 0 or current_best_solution and
-                     best_solution[0] > current_best_solution[0] > 0):
-                best_member = current_best_member
-                best_solution = current_best_solution
-                last_change_in_best = 0
-            else:
-                last_change_in_best += 1
-
-            # Stop conditions.
-            if best_solution and best_solution[0] == 0:
-                print('\nFound optimal solution. Finishing algorithm.')
-                return best_member, best_solution
-
-            if best_member and last_change_in_best >= self.max_iterations_without_change:
-                print('\nBest result has not changed for {} iterations. Finishing algorithm.'
-                      .format(self.max_iterations_without_change))
-                return best_member, best_solution
-
-            if generation_counter > self.max_generation_count:
-                print('\nReached generation limit. Finishing algorithm.')
-                return best_member, best_solution
-
-            self.print_result(best_member, best_solution)
-
-            # Population control.
-            print('\nEvolving generation #{} into generation #{}.'.format(generation_counter, generation_counter + 1))
-            invalid = []
-            fitness_sum = 0
-
-            print('> Validating population of {} members... '.format(len(self.population)), end='', flush=True)
-            for member, solution in self.population.items():
-                if solution[0] > 0:
-                    fitness_sum += 1 / solution[0]
-                else:
-                    invalid.append(member)
-            print('Finished.')
-
-            if len(invalid) > 0:
-                print('> Removing {} invalid members... '.format(len(invalid)), end='', flush=True)
-                for member in invalid:
-                    del self.population[member]
-                print('Finished.')
-            else:
-                print('> No invalid members found.')
-
-            if len(self.population) == 0:
-                print('\nThere are no more members in the population. Stopping.')
-                return best_member, best_solution
-
-            if len(self.population) > self.max_population_count:
-                print('> Population exceeded member limit.\n> Selecting {} members from {}... '
-                      .format(self.max_population_count, len(self.population)), end='', flush=True)
-                new_population = OrderedDict()
-                for _ in range(self.max_population_count):
-                    chosen_member, chosen_solution = None, None
-                    random_value = random.uniform(0, fitness_sum)
-                    for member, solution in self.population.items():
-                        random_value -= 1 / solution[0]
-                        if random_value < 0:
-                            chosen_member, chosen_solution = member, solution
-                            break
-                    del self.population[chosen_member]
-                    fitness_sum -= chosen_solution[0]
-                    new_population[chosen_member] = chosen_solution
-                self.population = new_population
-                print('Finished.')
-
-            # Crossovers.
-            crossover_members = random.sample(self.population.keys(), int(len(self.population) * self.crossover_chance))
-            print('> Starting crossovers of {} members... '.format(len(crossover_members) // 2 * 2), end='', flush=True)
+    # evaluates all members of the current generation, returns the best one (member, solution)
+    def _evaluate_generation(self):
+        current_best_member = None
+        current_best_solution = None
+
+        pruned_members, pruned_solves = 0, 0
+        if self.bounds:
+            pruned_members, pruned_solves = self._evaluate_with_bounds()
+        for member, solution in self.population.items():
+            if not solution:
+                solution = self._evaluate_member(member)
+                self.population[member] = solution
+            if solution[0] >= 0:
+                if (not current_best_solution or current_best_solution[0] < 0) \
+                        or current_best_solution[0] > solution[0] >= 0:
+                    current_best_member = member
+                    current_best_solution = solution
+        self.parents.clear()
+        shortages = [solution[0] for solution in self.population.values() if solution[0] >= 0]
+        self.generation_stats = {
+            'population': len(self.population),
+            'best_shortage': min(shortages) if shortages else None,
+            'mean_shortage': sum(shortages) / len(shortages) if shortages else None
+        }
+        self.progress.detail('Evaluated generation #{} ({} members).', self.generation_counter, len(self.population))
+        if pruned_members > 0:
+            self.progress.detail('> Pruned {} members by shortage lower bounds, skipping {} max-flow solves.',
+                                 pruned_members, pruned_solves)
+
+        return current_best_member, current_best_solution
+
+    # evaluates a canonical member, incrementally if its evaluated parent is known, and caches its solution
+    def _evaluate_member(self, member):
+        parent, parent_solution, raw_member = self.parents.get(member, (None, None, member))
+        # the raw member differs from the parent in fewer genes than its canonical form
+        return self._evaluate_canonical(raw_member, parent, parent_solution)[1]
+
+    # adds a member to the population in its canonical form, unless an equivalent member is already there
+    # the solution is taken from the argument or the cache if possible, otherwise the member waits for evaluation
+    def _add_member(self, member, solution=None, parent=None):
+        canonical = self._canonicalize(member)
+        if self.population.get(canonical):
+            self.duplicates_rejected += 1
+            return
+        if solution:
+            self.population[canonical] = self._canonicalize_solution(member, solution)
+        elif canonical in self.fitness_cache:
+            self.population[canonical] = self.fitness_cache[canonical]
+            self.cache_hits += 1
+        else:
+            self.population[canonical] = None
+            if parent is not None:
+                self.parents[canonical] = (parent, self.population.get(parent), member)
+
+    # evaluates unevaluated members in order of their shortage lower bounds, removing the members whose bound
+    # shows they can't be among max_population_count best members without running any max-flow for them
+    # returns the number of removed members and the number of max-flow solves skipped, i.e. the project sets of their
+    # intervals which aren't in the interval cache
+    def _evaluate_with_bounds(self):
+        best_shortages = []  # max-heap (negated values) of max_population_count best shortages so far
+        pending = []
+        for member, solution in self.population.items():
+            if solution:
+                if solution[0] >= 0:
+                    heapq.heappush(best_shortages, -solution[0])
+            elif self._validate_scheduling(member):
+                intervals = self._find_intervals(member)
+                pending.append((self.bounds.schedule_bound(intervals), len(intervals), member, intervals))
+        while len(best_shortages) > self.max_population_count:
+            heapq.heappop(best_shortages)
+        pending.sort()
+
+        pruned_members, pruned_solves = 0, 0
+        for bound, _, member, intervals in pending:
+            if len(best_shortages) >= self.max_population_count and bound > -best_shortages[0]:
+                del self.population[member]
+                pruned_members += 1
+                keys = set(tuple(sorted(interval[2])) for interval in intervals)
+                pruned_solves += sum(1 for key in keys if key not in self.interval_cache)
+                continue
+            solution = self._evaluate_member(member)
+            self.population[member] = solution
+            heapq.heappush(best_shortages, -solution[0])
+            if len(best_shortages) > self.max_population_count:
+                heapq.heappop(best_shortages)
+
+        self.pruned_solves += pruned_solves
+        return pruned_members, pruned_solves
+
+    # updates all-time best result with the best member of the current generation
+    def _update_best(self, current_best_member, current_best_solution):
+        if current_best_solution and current_best_solution[0] >= 0 and \
+                (not self.best_solution or self.best_solution[0] < 0 or
+                 self.best_solution[0] > current_best_solution[0] >= 0):
+            self.best_member = current_best_member
+            self.best_solution = current_best_solution
+            self.last_change_in_best = 0
+            self._report_improvement(self.best_member, self.best_solution)
+        else:
+            self.last_change_in_best += 1
+
+    # checks stop conditions, returns the reason for stopping or None if the algorithm should continue
+    def _stop_reason(self):
+        if self.best_solution and self.best_solution[0] == 0:
+            return 'Found optimal solution. Finishing algorithm.'
+
+        if self.best_member and self.last_change_in_best >= self.max_iterations_without_change:
+            return 'Best result has not changed for {} iterations. Finishing algorithm.'\
+                .format(self.max_iterations_without_change)
+
+        if self.generation_counter > self.max_generation_count:
+            return 'Reached generation limit. Finishing algorithm.'
+
+        if self._out_of_time():
+            return 'Time budget of {:g}s has run out. Finishing algorithm.'.format(self.time_budget)
+
+        return None
+
+    # evolves current generation into the next one, returns False if there are no members left
+    def _evolve_generation(self):
+        # Population control.
+        self.progress.detail('Evolving generation #{} into generation #{}.',
+                             self.generation_counter, self.generation_counter + 1)
+        invalid = []
+
+        for member, solution in self.population.items():
+            if solution[0] < 0:
+                invalid.append(member)
+        self.progress.detail('> Validated population of {} members.', len(self.population))
+
+        if len(invalid) > 0:
+            for member in invalid:
+                del self.population[member]
+            self.progress.detail('> Removed {} invalid members.', len(invalid))
+        else:
+            self.progress.detail('> No invalid members found.')
+
+        if len(self.population) == 0:
+            return False
+
+        if len(self.population) > self.max_population_count:
+            self.progress.detail('> Population exceeded member limit, selecting {} members from {}.',
+                                 self.max_population_count, len(self.population))
+            with self._phase('selection'):
+                self.population = self._select(list(self.population.items()), self.max_population_count)
+
+        # Crossovers.
+        with self._phase('crossover'):
+            crossover_members = self.random.sample(list(self.population.keys()),
+                                                   int(len(self.population) * self.crossover_chance))
             for member1, member2 in zip(crossover_members[::2], crossover_members[1::2]):
-                n = random.randint(1, self.scheduling_data.project_count - 1)
+                n = self.random.randint(1, max(1, self.scheduling_data.project_count - 1))
                 offspring1, offspring2 = self._n_point_crossover(member1, member2, n)
-                if offspring1 not in self.population:
-                    self.population[offspring1] = None
-                if offspring2 not in self.population:
-                    self.population[offspring2] = None
-            print('Finished.')
-
-            # Mutations.
-            mutation_members = random.sample(self.population.keys(), int(len(self.population) * self.mutation_chance))
-            print('> Starting mutations of {} members... '.format(len(mutation_members)), end='', flush=True)
+                self._add_member(offspring1, parent=member1)
+                self._add_member(offspring2, parent=member2)
+        self.progress.detail('> Crossed over {} members.', len(crossover_members) // 2 * 2)
+
+        # Mutations.
+        with self._phase('mutation'):
+            mutation_members = self.random.sample(list(self.population.keys()),
+                                                  int(len(self.population) * self.mutation_chance))
             for member in mutation_members:
-                n = random.randint(1, self.scheduling_data.project_count)
-                mutated = self._n_point_mutation(member, n)
-                if mutated not in self.population:
-                    self.population[mutated] = None
-            print('Finished.')
+                n = self.random.randint(1, self.scheduling_data.project_count)
+                self._add_member(self._n_point_mutation(member, n), parent=member)
+        self.progress.detail('> Mutated {} members.', len(mutation_members))
+
+        # Local search.
+        if self.local_search_budget > 0:
+            budget = self.local_search_budget
+            with self._phase('local_search'):
+                for member, solution in self.elite(len(self.population)):
+                    if budget <= 0:
+                        break
+                    refined, refined_solution, evaluations = self._local_search(member, solution, budget)
+                    budget -= evaluations
+                    if refined != member:  # an unimproved member is already in the population
+                        self._add_member(refined, solution=refined_solution)
+            self.progress.detail('> Refined members with local search.')
+
+        return True
+
+    # hill-climbs from given evaluated member by moving single projects, keeps every improving move; neighbours are
+    # evaluated through the fitness cache, so they are found there when they are generated again
+    # returns the best member found (in its canonical form), its solution and the number of evaluations used
+    def _local_search(self, member, solution, budget):
+        evaluations = 0
+        improved = True
+        while improved and solution[0] > 0:
+            improved = False
+            genes = list(range(self.scheduling_data.project_count))
+            self.random.shuffle(genes)
+            for i in genes:
+                for start in self._local_search_moves(member, i):
+                    if evaluations >= budget:
+                        return member, solution, evaluations
+                    neighbour, neighbour_solution = self._evaluate_canonical(member[:i] + (start,) + member[i + 1:],
+                                                                             member, solution)
+                    evaluations += 1
+                    if 0 <= neighbour_solution[0] < solution[0]:
+                        member, solution = neighbour, neighbour_solution
+                        improved = True
+                        break
+        return member, solution, evaluations
+
+    # lists start times to try for i-th project of given member, nearest ones first
+    def _local_search_moves(self, member, i):
+        lo, hi = self.domains[i]
+        if self.local_search_moves == 'all':
+            starts = [start for start in range(lo, hi + 1) if start != member[i]]
+            starts.sort(key=lambda start: abs(start - member[i]))
+            return starts
+        return [start for start in (member[i] - 1, member[i] + 1) if lo <= start <= hi]
+
+    # selects count distinct members: the elite is carried over, the rest is chosen by the selection method
+    def _select(self, candidates, count):
+        elite, rest = elitism(candidates, min(self.elite_count, count))
+        new_population = OrderedDict(elite)
+        for member, solution in self.selection(rest, count - len(new_population), self.random):
+            new_population[member] = solution
+        if len(new_population) < count:  # selection chose some members more than once, fill up with the best
+            remaining = [(member, solution) for member, solution in rest if member not in new_population]
+            new_population.update(elitism(remaining, count - len(new_population))[0])
+        return new_population
+
+    # runs at most generation_count generations, returns the reason for stopping or None if the limit was hit
+    def run(self, generation_count):
+        if self.deadline is None:
+            self._start_clock()
+        if self.started is None:
+            self.started = time.perf_counter()
+        for _ in range(generation_count):
+            self._start_generation_telemetry()
+            with self._phase('evaluation'):
+                current_best = self._evaluate_generation()
+            self._update_best(*current_best)
+
+            reason = self._stop_reason()
+            if reason:
+                self._write_generation_telemetry()
+                return reason
+
+            self.progress.status('Generation #{generation}: best shortage {best_shortage}, {population} members.',
+                                 generation=self.generation_counter,
+                                 best_shortage=self.best_solution[0] if self.best_solution else None,
+                                 population=len(self.population))
+
+            evolved = self._evolve_generation()
+            self._write_generation_telemetry()
+            if not evolved:
+                return 'There are no more members in the population. Stopping.'
 
             # Generation counter incrementation.
-            generation_counter += 1
-
-    @staticmethod
-    def print_result(member, solution):
-        if member and solution:
-            print('\nTotal shortage: {}.'.format(solution[0]))
-            print('Best starting times for projects: {}.'.format(member))
-            print('Intervals [t_from, t_to] -> [projects] with assignments (expert, skill, project):')
-            for assignment, interval in zip(solution[1], solution[2]):
-                print('[{},{}] -> {}: {}'.format(interval[0], interval[1], list(interval[2]), assignment))
-        else:
-            print('\nNo solution found.')
+            self.generation_counter += 1
+
+        return None
+
+    # measures the wall time spent in a phase of the current generation
+    @contextmanager
+    def _phase(self, name):
+        started = time.perf_counter()
+        yield
+        self.phase_times[name] = self.phase_times.get(name, 0.0) + time.perf_counter() - started
+
+    # remembers the cumulative counters, so that the telemetry record reports only the current generation
+    def _start_generation_telemetry(self):
+        self.phase_times = {}
+        self.telemetry_counters = (self.maxflow_solves, self.solved_interval_count, self.cache_hits,
+                                   self.duplicates_rejected, self.pruned_solves)
+
+    # writes the telemetry record of the current generation as a single JSON line
+    def _write_generation_telemetry(self):
+        if not self.telemetry:
+            return
+        maxflow_solves, interval_count, cache_hits, duplicates_rejected, pruned_solves = self.telemetry_counters
+        record = {
+            'generation': self.generation_counter,
+            'elapsed': time.perf_counter() - self.started,
+            'times': self.phase_times,
+            'maxflow_solves': self.maxflow_solves - maxflow_solves,
+            'intervals': self.solved_interval_count - interval_count,
+            'cache_hits': self.cache_hits - cache_hits,
+            'duplicates_rejected': self.duplicates_rejected - duplicates_rejected,
+            'pruned_solves': self.pruned_solves - pruned_solves,
+            'best_so_far': self.best_solution[0] if self.best_solution else None
+        }
+        record.update(self.generation_stats)
+        self.telemetry.write(json.dumps(record) + '\n')
+
+    # solving the problem using genetic algorithm
+    def solve(self):
+        reason = None
+        with memory_section('GeneticSolver search'):
+            while not reason:
+                if self.checkpoint_path:
+                    reason = self.run(self.checkpoint_interval)
+                    if self.generation_counter != self.checkpoint_generation:
+                        self.save_checkpoint()
+                else:
+                    reason = self.run(self.max_generation_count)
+        self.progress.event(reason)
+        if self.bounds:
+            self.progress.event('Shortage lower bounds pruned {} max-flow solves.', self.pruned_solves)
+        self.progress.event('Equivalent members were found in the fitness cache {} times.', self.cache_hits)
+        return self.best_member, self.best_solution
+
+    # returns up to count best valid members of the population as (member, solution) pairs
+    def elite(self, count):
+        evaluated = [(member, solution) for member, solution in self.population.items()
+                     if solution and solution[0] >= 0]
+        return elitism(evaluated, count)[0]
+
+    # adds evaluated members coming from outside (e.g. another island) to the population
+    def immigrate(self, members):
+        for member, solution in members:
+            self._add_member(member, solution=solution)
+
+    # captures everything needed to continue the search later (possibly in another process)
+    def get_state(self):
+        return {
+            'population': self.population,
+            'random': self.random.getstate(),
+            'generation_counter': self.generation_counter,
+            'best_member': self.best_member,
+            'best_solution': self.best_solution,
+            'last_change_in_best': self.last_change_in_best,
+            'parents': self.parents,
+            'pruned_solves': self.pruned_solves,
+            'fitness_cache': self.fitness_cache,
+            'cache_hits': self.cache_hits
+        }
+
+    # saves the state to the checkpoint file, the search resumed from it doesn't repeat any evaluation
+    def save_checkpoint(self):
+        save_checkpoint(self.checkpoint_path, self.scheduling_data, self.get_state())
+        self.checkpoint_generation = self.generation_counter
+        self.progress.detail('> Saved checkpoint of generation #{} to \'{}\'.',
+                             self.generation_counter, self.checkpoint_path)
+
+    # restores the search from a state captured by get_state
+    def set_state(self, state):
+        self.population = state['population']
+        self.random.setstate(state['random'])
+        self.generation_counter = state['generation_counter']
+        self.best_member = state['best_member']
+        self.best_solution = state['best_solution']
+        self.last_change_in_best = state['last_change_in_best']
+        self.parents = state['parents']
+        self.pruned_solves = state['pruned_solves']
+        self.fitness_cache = state['fitness_cache']
+        self.cache_hits = state['cache_hits']
+
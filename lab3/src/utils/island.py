@@ -0,0 +1,170 @@
+import contextlib
+import multiprocessing
+import random
+import time
+
+from src.utils.genetic import GeneticSolver
+from src.utils.progress import default_reporter
+from src.utils.selection import elitism
+
+# The island evolved by a worker process, created once by :func:`_init_worker` and kept between epochs, so that its
+# fitness and interval caches never have to leave the process.
+_island = None
+
+
+def _init_worker(scheduling_data, seed, solver_options):
+    """
+    Initializes a worker process of the island pool, every island has a pool with a single worker of its own.
+
+    :param scheduling_data: The problem instance solved by the island.
+    :type scheduling_data: src.classes.data.SchedulingData
+    :param seed: The seed of the island.
+    :type seed: int
+    :param solver_options: A dictionary of keyword arguments for :class:`GeneticSolver`.
+    :type solver_options: dict
+    """
+    global _island
+    _island = GeneticSolver(scheduling_data, seed=seed, verbose=False, **solver_options)
+
+
+def _run_epoch(task):
+    """
+    Evolves the island of this worker for one epoch (the number of generations between two migrations).
+
+    :param task: A tuple containing the members immigrating to the island as (member, solution) pairs and the number
+                 of generations to run.
+    :type task: tuple
+    :return: A tuple containing the population of the island, its best member and solution and the reason for
+             stopping (None if the island may continue).
+    :rtype: tuple
+    """
+    immigrants, generation_count = task
+    _island.immigrate(immigrants)
+    reason = _island.run(generation_count)
+    return _island.population, _island.best_member, _island.best_solution, reason
+
+
+class IslandSolver:
+    """
+    Island model of the genetic algorithm.
+
+    Several independent :class:`GeneticSolver` populations are evolved in separate processes, each using its own
+    random stream. Every *migration_interval* generations the best members of every island migrate to the next
+    island on a ring.
+    """
+
+    def __init__(self, scheduling_data, island_count, migration_interval=10, migration_size=1, seed=None,
+                 verbose=True, time_budget=None, on_improvement=None, progress=None, **solver_options):
+        """
+        Constructor.
+
+        :param scheduling_data: The problem instance to solve.
+        :type scheduling_data: src.classes.data.SchedulingData
+        :param island_count: The number of islands (and worker processes).
+        :type island_count: int
+        :param migration_interval: The number of generations between migrations.
+        :type migration_interval: int
+        :param migration_size: The number of best members sent from every island during a migration.
+        :type migration_size: int
+        :param seed: The seed used to derive the seeds of all islands. If None, the islands are seeded randomly.
+        :type seed: int
+        :param verbose: Whether to report progress information, unless *progress* is given.
+        :type verbose: bool
+        :param time_budget: Seconds of wall-clock time for the whole search, None means no limit.
+        :type time_budget: float
+        :param on_improvement: Called with the best member and its solution whenever the best result improves.
+                               Islands report to it after every epoch.
+        :type on_improvement: callable
+        :param progress: The reporter of the progress of the search. Islands in worker processes report nothing.
+        :type progress: src.utils.progress.ProgressReporter
+        :param solver_options: Additional keyword arguments passed to :class:`GeneticSolver` on every island.
+        """
+        assert island_count > 0 and migration_interval > 0 and migration_size >= 0
+        self.scheduling_data = scheduling_data
+        self.island_count = island_count
+        self.migration_interval = migration_interval
+        self.migration_size = migration_size
+        self.progress = progress or default_reporter(verbose)
+        self.time_budget = time_budget
+        self.on_improvement = on_improvement
+        self.solver_options = solver_options
+        seed_generator = random.Random(seed)
+        self.seeds = [seed_generator.getrandbits(64) for _ in range(island_count)]
+
+    def solve(self):
+        """
+        Solves the problem using the island model.
+
+        :return: A tuple containing the best member found on any island and its solution, in the same format as
+                 returned by :meth:`GeneticSolver.solve`.
+        :rtype: tuple
+        """
+        populations = [None] * self.island_count
+        immigrants = [[] for _ in range(self.island_count)]
+        reasons = [None] * self.island_count
+        best_member, best_solution = None, None
+        epoch = 0
+        deadline = None if self.time_budget is None else time.monotonic() + self.time_budget
+
+        solver_options = self.solver_options
+        if self.time_budget is not None:
+            solver_options = dict(solver_options, time_budget=self.time_budget)
+        with contextlib.ExitStack() as stack:
+            pools = [stack.enter_context(multiprocessing.Pool(1, initializer=_init_worker,
+                                                              initargs=(self.scheduling_data, seed, solver_options)))
+                     for seed in self.seeds]
+            while True:
+                epoch += 1
+                active = [i for i in range(self.island_count) if not reasons[i]]
+                results = [pools[i].apply_async(_run_epoch, ((immigrants[i], self.migration_interval),))
+                           for i in active]
+                improved = False
+                for i, result in zip(active, results):
+                    populations[i], member, solution, reasons[i] = result.get()
+                    if solution and solution[0] >= 0 and (not best_solution or solution[0] < best_solution[0]):
+                        best_member, best_solution = member, solution
+                        improved = True
+                self.progress.detail('Finished epoch #{} on {} islands.', epoch, len(active))
+
+                if improved and self.on_improvement:
+                    self.on_improvement(best_member, best_solution)
+                if best_solution:
+                    self.progress.status('Epoch #{epoch}: best shortage {best_shortage}, {islands} islands running.',
+                                         epoch=epoch, best_shortage=best_solution[0],
+                                         islands=reasons.count(None))
+
+                if best_solution and best_solution[0] == 0:
+                    self.progress.event('Found optimal solution. Finishing algorithm.')
+                    break
+                if deadline is not None and time.monotonic() >= deadline:
+                    self.progress.event('Time budget of {:g}s has run out. Finishing algorithm.', self.time_budget)
+                    break
+                if all(reasons):
+                    self.progress.event('All islands have finished. Finishing algorithm.')
+                    break
+
+                immigrants = self._migrate(populations, reasons)
+
+        return best_member, best_solution
+
+    def _migrate(self, populations, reasons):
+        """
+        Chooses the best members of every island to send to the next island on the ring.
+
+        :param populations: The populations of all islands, as dictionaries of members and their solutions.
+        :type populations: list
+        :param reasons: The reasons for stopping of all islands (None for islands still running).
+        :type reasons: list
+        :return: The lists of (member, solution) pairs immigrating to every island, empty for stopped islands.
+        :rtype: list
+        """
+        immigrants = [[] for _ in range(self.island_count)]
+        if self.island_count < 2 or self.migration_size == 0:
+            return immigrants
+        for i, population in enumerate(populations):
+            target = (i + 1) % self.island_count
+            if not reasons[target]:
+                evaluated = [(member, solution) for member, solution in population.items()
+                             if solution and solution[0] >= 0]
+                immigrants[target] = elitism(evaluated, self.migration_size)[0]
+        return immigrants
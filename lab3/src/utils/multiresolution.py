@@ -0,0 +1,129 @@
+import time
+
+from src.classes.data import SchedulingData
+from src.utils.genetic import GeneticSolver
+from src.utils.progress import default_reporter
+
+
+def coarsen(scheduling_data, factor):
+    """
+    Builds a problem instance with the time horizon coarsened by a factor.
+
+    Every *factor* time units are bucketed into one, project lengths are rounded up.
+
+    :param scheduling_data: The problem instance to coarsen.
+    :type scheduling_data: src.classes.data.SchedulingData
+    :param factor: The number of time units bucketed into one.
+    :type factor: int
+    :return: The coarsened problem instance.
+    :rtype: SchedulingData
+    """
+    overall_time_units = -(-scheduling_data.overall_time_units // factor)
+    coarse_data = SchedulingData([scheduling_data.skill_count, scheduling_data.expert_count,
+                                  scheduling_data.project_count, overall_time_units])
+    coarse_data.experts = scheduling_data.experts
+    coarse_data.projects = [(requirements, min(-(-p_length // factor), overall_time_units))
+                            for requirements, p_length in scheduling_data.projects]
+    return coarse_data
+
+
+class MultiResolutionSolver:
+    """
+    Coarse-to-fine genetic search for instances with long time horizons.
+
+    The problem is first solved on a horizon coarsened by a factor. The best coarse schedules, scaled back up,
+    seed a search on the full resolution, in which every project may only start within a narrow window around
+    its start times in the seeds.
+    """
+
+    def __init__(self, scheduling_data, factor, seed_count=3, radius=None, seed=None, verbose=True,
+                 time_budget=None, on_improvement=None, progress=None, **solver_options):
+        """
+        Constructor.
+
+        :param scheduling_data: The problem instance to solve.
+        :type scheduling_data: src.classes.data.SchedulingData
+        :param factor: The number of time units bucketed into one on the coarse horizon.
+        :type factor: int
+        :param seed_count: The number of best coarse schedules seeding the full resolution search.
+        :type seed_count: int
+        :param radius: The number of time units a project may be moved away from its start times in the seeds
+                       during the full resolution search. Defaults to *factor*.
+        :type radius: int
+        :param seed: The seed for the random number generators of both searches.
+        :type seed: int
+        :param verbose: Whether to report progress information, unless *progress* is given.
+        :type verbose: bool
+        :param time_budget: Seconds of wall-clock time for both searches together, None means no limit.
+                            The coarse search may use at most half of it.
+        :type time_budget: float
+        :param on_improvement: Called with the best member and its solution whenever the best result of the full
+                               resolution search improves.
+        :type on_improvement: callable
+        :param progress: The reporter of the progress of both searches.
+        :type progress: src.utils.progress.ProgressReporter
+        :param solver_options: Additional keyword arguments passed to :class:`GeneticSolver` in both searches.
+        """
+        assert factor > 0 and seed_count > 0
+        self.scheduling_data = scheduling_data
+        self.factor = factor
+        self.seed_count = seed_count
+        self.radius = factor if radius is None else radius
+        self.seed = seed
+        self.progress = progress or default_reporter(verbose)
+        self.time_budget = time_budget
+        self.on_improvement = on_improvement
+        self.solver_options = solver_options
+
+    def _refinement_domains(self, seeds):
+        """
+        Computes the narrow windows of start times searched at full resolution.
+
+        :param seeds: The scaled-up best coarse schedules.
+        :type seeds: list
+        :return: The valid start times (lo, hi) of every project.
+        :rtype: list
+        """
+        domains = []
+        for i, (_, p_length) in enumerate(self.scheduling_data.projects):
+            latest_start = self.scheduling_data.overall_time_units - p_length
+            starts = [seed_member[i] for seed_member in seeds]
+            domains.append((max(0, min(starts) - self.radius), min(latest_start, max(starts) + self.radius)))
+        return domains
+
+    def solve(self):
+        """
+        Solves the problem with the coarse-to-fine search.
+
+        :return: A tuple containing the best member and its solution, in the same format as returned by
+                 :meth:`GeneticSolver.solve`.
+        :rtype: tuple
+        """
+        deadline = None if self.time_budget is None else time.monotonic() + self.time_budget
+        coarse_data = coarsen(self.scheduling_data, self.factor)
+        self.progress.event('Solving on a horizon coarsened from {} to {} time units.',
+                            self.scheduling_data.overall_time_units, coarse_data.overall_time_units)
+        coarse_solver = GeneticSolver(coarse_data, seed=self.seed, progress=self.progress,
+                                      time_budget=None if deadline is None else self.time_budget / 2,
+                                      **self.solver_options)
+        coarse_solver.solve()
+        coarse_best = coarse_solver.elite(self.seed_count)
+        if coarse_solver.best_member is not None and coarse_solver.best_member not in dict(coarse_best):
+            coarse_best.insert(0, (coarse_solver.best_member, coarse_solver.best_solution))
+
+        latest_starts = [self.scheduling_data.overall_time_units - p_length
+                         for _, p_length in self.scheduling_data.projects]
+        seeds = [tuple(min(start * self.factor, latest_start) for start, latest_start in zip(member, latest_starts))
+                 for member, _ in coarse_best[:self.seed_count]]
+        fine_options = dict(self.solver_options, on_improvement=self.on_improvement)
+        if deadline is not None:
+            fine_options['time_budget'] = max(0.0, deadline - time.monotonic())
+        if not seeds:
+            self.progress.event('No coarse schedule found, solving at full resolution.')
+            return GeneticSolver(self.scheduling_data, seed=self.seed, progress=self.progress,
+                                 **fine_options).solve()
+
+        self.progress.event('Refining {} coarse schedules at full resolution.', len(seeds))
+        fine_solver = GeneticSolver(self.scheduling_data, seed=self.seed, progress=self.progress,
+                                    domains=self._refinement_domains(seeds), initial_members=seeds, **fine_options)
+        return fine_solver.solve()
@@ -1,6 +1,11 @@
+import io
 import sys
 
-from src.classes.data import SchedulingData
+from src.classes.data import SchedulingData, SparseVector
+
+
+# Maps ASCII digits to their values, used to convert blocks of single-digit numbers without calling int.
+_DIGIT_VALUES = bytes.maketrans(b'0123456789', bytes(range(10)))
 
 
 class ParseError(Exception):
@@ -58,7 +63,19 @@ class Parser:
             - The number of skills or time units is zero or lower.
             - The number of experts or projects is negative.
         """
-        counts = self._parse_comma_delimited_numbers(file, 4)
+        return self._check_counts(self._parse_comma_delimited_numbers(file, 4))
+
+    @staticmethod
+    def _check_counts(counts):
+        """
+        Checks the counts of skills, experts, projects and time units.
+
+        :param counts: The four counts.
+        :type counts: list
+        :return: An instance of :class:`SchedulingData` storing the counts.
+        :rtype: SchedulingData
+        :raise ParseError: A :class:`ParseError` is thrown when a count is out of range, see :meth:`_parse_counts`.
+        """
         errors = []
         if counts[0] < 1:
             errors.append('The number of skills must be positive.')
@@ -86,7 +103,7 @@ class Parser:
         are non-binary.
         """
         vector = self._parse_comma_delimited_numbers(file, skill_count)
-        if any([(x < 0 or x > 1) for x in vector]):
+        if any(x < 0 or x > 1 for x in vector):
             raise ParseError('Line {}: Expert vectors must be binary'.format(self.line_no))
         return vector
 
@@ -118,7 +135,7 @@ class Parser:
         :raise ParseError: A :class:`ParseError` is thrown when the vector read from file contains negative values.
         """
         vector = self._parse_comma_delimited_numbers(file, skill_count + 1)
-        if any([x < 0 for x in vector[:-1]]):
+        if any(x < 0 for x in vector[:-1]):
             raise ParseError('Line {}: Project requirement vector must be non-negative'.format(self.line_no))
         if vector[-1] < 1:
             raise ParseError('Line {}: The number of project time units must be positive'.format(self.line_no))
@@ -155,3 +172,309 @@ class Parser:
         if len(file.readline()) > 0:
             sys.stderr.write('Data past line {} will be ignored\n'.format(self.line_no))
         return data
+
+    @staticmethod
+    def _split_block(lines, arg_count):
+        """
+        Splits a block of lines, each containing the same number of comma-delimited numbers, in a single pass.
+
+        :param lines: The lines of the block.
+        :type lines: list
+        :param arg_count: Expected number of comma-delimited numbers in every line.
+        :type arg_count: int
+        :return: A flat list containing the numbers of all lines, or None if any line is invalid.
+        :rtype: list
+        """
+        if any(line.count(',') != arg_count - 1 for line in lines):
+            return None
+        block = ','.join(lines)
+        if len(block) == 2 * arg_count * len(lines) - 1 and block[1::2] == ',' * (len(block) // 2):
+            # every number has a single character, which is the usual case for binary skill vectors
+            digits = block[::2].encode()
+            if not digits.translate(None, b'0123456789'):
+                return list(digits.translate(_DIGIT_VALUES))
+        try:
+            return list(map(int, block.split(',')))
+        except ValueError:
+            return None  # also raised for missing values, as int('') is invalid
+
+    def _parse_block_lines(self, lines, count, parse_line):
+        """
+        Parses a block of lines one by one, used to report the exact error of an invalid block.
+
+        :param lines: The lines of the block.
+        :type lines: list
+        :param count: The number of lines expected in the block, more than *lines* if the file has ended.
+        :type count: int
+        :param parse_line: The method parsing a single line from a file.
+        :type parse_line: callable
+        :return: The parsed vectors.
+        :rtype: list
+        """
+        block_file = io.StringIO(''.join(line + '\n' for line in lines))
+        return [parse_line(block_file) for _ in range(count)]
+
+    def _parse_experts_bulk(self, lines, data):
+        """
+        Reads all experts' skill vectors from their lines at once into a :class:`SchedulingData` object.
+
+        :param lines: The lines containing the skill vectors.
+        :type lines: list
+        :param data: A :class:`SchedulingData` object to add the skill vectors to.
+        :type data: SchedulingData
+        :raise ParseError: The same :class:`ParseError` as thrown by :meth:`_parse_experts` for invalid lines.
+        """
+        skill_count = data.skill_count
+        values = self._split_block(lines, skill_count)
+        if values is None or (values and not set(values) <= {0, 1}) or len(lines) < data.expert_count:
+            vectors = self._parse_block_lines(lines, data.expert_count,
+                                              lambda file: self._parse_expert(file, skill_count))
+        else:
+            self.line_no += len(lines)
+            vectors = [values[i:i + skill_count] for i in range(0, len(values), skill_count)]
+        for vector in vectors:
+            data.add_expert(vector)
+
+    def _parse_projects_bulk(self, lines, data):
+        """
+        Reads all projects' requirement vectors from their lines at once into a :class:`SchedulingData` object.
+
+        :param lines: The lines containing the requirement vectors.
+        :type lines: list
+        :param data: A :class:`SchedulingData` object to add the requirement vectors to.
+        :type data: SchedulingData
+        :raise ParseError: The same :class:`ParseError` as thrown by :meth:`_parse_projects` for invalid lines.
+        """
+        skill_count, time_units = data.skill_count, data.overall_time_units
+        values = self._split_block(lines, skill_count + 1)
+        if values is not None:
+            lengths = values[skill_count::skill_count + 1]
+            requirements = [x for i, x in enumerate(values) if i % (skill_count + 1) != skill_count]
+        if values is None or len(lines) < data.project_count or \
+                (values and (min(requirements, default=0) < 0 or min(lengths) < 1 or max(lengths) > time_units)):
+            vectors = self._parse_block_lines(lines, data.project_count,
+                                              lambda file: self._parse_project(file, skill_count, time_units))
+        else:
+            self.line_no += len(lines)
+            vectors = [values[i:i + skill_count + 1] for i in range(0, len(values), skill_count + 1)]
+        for vector in vectors:
+            data.add_project((vector[:-1], vector[-1]))
+
+    def parse_bulk(self, file):
+        """
+        Parses the contents of an input file like :meth:`parse`, but splits and converts the expert and project
+        blocks at once instead of line by line, which is much faster for large files.
+
+        Blocks are validated as a whole; only a block which is invalid is parsed again line by line, so that the
+        same :class:`ParseError` is thrown as by :meth:`parse`.
+
+        :param file: An opened file object to parse.
+        :type file: io.TextIOWrapper
+        :return: A :class:`SchedulingData` object with problem instance info.
+        :rtype: SchedulingData
+        """
+        data = self._parse_counts(file)
+        line_count = data.expert_count + data.project_count
+        if line_count > 0:
+            lines = file.read().split('\n', line_count)
+            if len(lines) > line_count:
+                remainder = lines.pop()
+            else:
+                remainder = ''
+                if lines[-1] == '':
+                    lines.pop()  # the file has ended before the last line
+        else:
+            lines, remainder = [], file.readline()
+        self._parse_experts_bulk(lines[:data.expert_count], data)
+        self._parse_projects_bulk(lines[data.expert_count:], data)
+        if len(remainder) > 0:
+            sys.stderr.write('Data past line {} will be ignored\n'.format(self.line_no))
+        return data
+
+    def _read_sparse_line(self, file):
+        """
+        Reads a line of the sparse format from a file.
+
+        :param file: A file object to read the line from.
+        :type file: io.TextIOWrapper
+        :return: The comma-delimited fields of the line, an empty list for a blank line.
+        :rtype: list
+        :raise ParseError: A :class:`ParseError` is thrown when the file has ended or a field is missing.
+        """
+        self.line_no += 1
+        line = file.readline()
+        if len(line) == 0:
+            raise ParseError('Line {}: Unexpected empty line or end-of-file hit'.format(self.line_no))
+        if not line.strip():
+            return []
+        fields = [x.strip() for x in line.split(',')]
+        if not all(fields):
+            raise ParseError('Line {}: At least one argument is missing a value.'.format(self.line_no))
+        return fields
+
+    def _parse_skill_index(self, field, skill_count, seen):
+        """
+        Converts a skill index of the sparse format and checks it.
+
+        :param field: The text of the index.
+        :type field: str
+        :param skill_count: The number of skills in the problem.
+        :type skill_count: int
+        :param seen: The indices already listed in the line, the index is added to it.
+        :type seen: set
+        :return: The skill index.
+        :rtype: int
+        :raise ParseError: A :class:`ParseError` is thrown when the index is not an integer, is out of range or has
+        already been listed in the line.
+        """
+        try:
+            skill_id = int(field)
+        except ValueError:
+            raise ParseError('Line {}: Non-base 10 integral value found'.format(self.line_no))
+        if not 0 <= skill_id < skill_count:
+            raise ParseError('Line {}: Skill index {} out of range, it must be between 0 and {}'
+                             .format(self.line_no, skill_id, skill_count - 1))
+        if skill_id in seen:
+            raise ParseError('Line {}: Skill index {} listed more than once'.format(self.line_no, skill_id))
+        seen.add(skill_id)
+        return skill_id
+
+    def _parse_sparse_expert(self, file, skill_count):
+        """
+        Reads a single expert's skills listed as comma-delimited skill indices, a blank line meaning no skills.
+
+        :param file: A file object to read the skills from.
+        :type file: io.TextIOWrapper
+        :param skill_count: The number of skills in the problem.
+        :type skill_count: int
+        :return: The skill vector of the expert.
+        :rtype: SparseVector
+        """
+        seen = set()
+        skill_ids = [self._parse_skill_index(field, skill_count, seen) for field in self._read_sparse_line(file)]
+        return SparseVector(skill_count, [(skill_id, 1) for skill_id in sorted(skill_ids)])
+
+    def _parse_sparse_project(self, file, skill_count, time_units):
+        """
+        Reads a single project listed as its number of time units followed by comma-delimited *skill:need* pairs.
+
+        :param file: A file object to read the project from.
+        :type file: io.TextIOWrapper
+        :param skill_count: The number of skills in the problem.
+        :type skill_count: int
+        :param time_units: The total number of time units available for all projects.
+        :type time_units: int
+        :return: A tuple (requirement vector, number of time units) of the project.
+        :rtype: tuple
+        :raise ParseError: A :class:`ParseError` is thrown when a pair is malformed, a need is negative or the number
+        of time units is out of range.
+        """
+        fields = self._read_sparse_line(file)
+        if not fields:
+            raise ParseError('Line {}: Unexpected empty line or end-of-file hit'.format(self.line_no))
+        try:
+            p_length = int(fields[0])
+        except ValueError:
+            raise ParseError('Line {}: Non-base 10 integral value found'.format(self.line_no))
+        seen = set()
+        items = []
+        for field in fields[1:]:
+            skill_field, separator, need_field = field.partition(':')
+            if not separator:
+                raise ParseError('Line {}: Requirements must be given as skill:need pairs'.format(self.line_no))
+            skill_id = self._parse_skill_index(skill_field.strip(), skill_count, seen)
+            try:
+                need = int(need_field)
+            except ValueError:
+                raise ParseError('Line {}: Non-base 10 integral value found'.format(self.line_no))
+            if need < 0:
+                raise ParseError('Line {}: Project requirement vector must be non-negative'.format(self.line_no))
+            if need > 0:
+                items.append((skill_id, need))
+        if p_length < 1:
+            raise ParseError('Line {}: The number of project time units must be positive'.format(self.line_no))
+        if p_length > time_units:
+            raise ParseError('Line {}: The number of project time units must not be greater than the total '
+                             'number of units (specified to be {} in the first line)'.format(self.line_no, time_units))
+        return SparseVector(skill_count, sorted(items)), p_length
+
+    def parse_sparse(self, file):
+        """
+        Parses an input file in the sparse format, meant for instances with wide skill catalogs where experts and
+        projects touch only a few skills.
+
+        The first line holds the counts as in the dense format. Every expert line lists the 0-based indices of the
+        expert's skills (a blank line for an expert without skills), every project line holds the number of time
+        units followed by *skill:need* pairs, e.g. ``3,0:2,17:1``. Skill and requirement vectors are stored as
+        :class:`src.classes.data.SparseVector` objects.
+
+        :param file: An opened file object to parse.
+        :type file: io.TextIOWrapper
+        :return: A :class:`SchedulingData` object with problem instance info.
+        :rtype: SchedulingData
+        """
+        data = self._parse_counts(file)
+        for i in range(data.expert_count):
+            data.add_expert(self._parse_sparse_expert(file, data.skill_count))
+        for i in range(data.project_count):
+            data.add_project(self._parse_sparse_project(file, data.skill_count, data.overall_time_units))
+        if len(file.readline()) > 0:
+            sys.stderr.write('Data past line {} will be ignored\n'.format(self.line_no))
+        return data
+
+    @staticmethod
+    def _check_json_vector(vector, length, name):
+        """
+        Checks that a value of a JSON instance is a list of integers of the given length.
+
+        :param vector: The value to check.
+        :param length: The expected length of the list.
+        :type length: int
+        :param name: The name of the value used in the error message, e.g. 'Expert 3'.
+        :type name: str
+        :raise ParseError: A :class:`ParseError` is thrown when the value is not such a list.
+        """
+        if not isinstance(vector, list) or len(vector) != length:
+            raise ParseError('{}: A list of {} integers expected'.format(name, length))
+        if not all(isinstance(x, int) and not isinstance(x, bool) for x in vector):
+            raise ParseError('{}: Non-integral value found'.format(name))
+
+    def parse_json(self, document):
+        """
+        Parses a problem instance given as a decoded JSON document of the form::
+
+            {"counts": [skills, experts, projects, time units],
+             "experts": [[skill vector], ...],
+             "projects": [[requirement vector..., time units], ...]}
+
+        The rows are the lines of the text format and are validated in the same way.
+
+        :param document: The decoded JSON document.
+        :type document: dict
+        :return: A :class:`SchedulingData` object with problem instance info.
+        :rtype: SchedulingData
+        :raise ParseError: A :class:`ParseError` is thrown when the document is not a valid instance.
+        """
+        if not isinstance(document, dict) or not all(key in document for key in ('counts', 'experts', 'projects')):
+            raise ParseError('An object with the keys "counts", "experts" and "projects" expected')
+        self._check_json_vector(document['counts'], 4, 'Counts')
+        data = self._check_counts(document['counts'])
+        experts, projects = document['experts'], document['projects']
+        if not isinstance(experts, list) or len(experts) != data.expert_count:
+            raise ParseError('{} experts expected'.format(data.expert_count))
+        if not isinstance(projects, list) or len(projects) != data.project_count:
+            raise ParseError('{} projects expected'.format(data.project_count))
+        for i, vector in enumerate(experts):
+            self._check_json_vector(vector, data.skill_count, 'Expert {}'.format(i))
+            if any(x < 0 or x > 1 for x in vector):
+                raise ParseError('Expert {}: Expert vectors must be binary'.format(i))
+            data.add_expert(vector)
+        for i, vector in enumerate(projects):
+            self._check_json_vector(vector, data.skill_count + 1, 'Project {}'.format(i))
+            if any(x < 0 for x in vector[:-1]):
+                raise ParseError('Project {}: Project requirement vector must be non-negative'.format(i))
+            if not 1 <= vector[-1] <= data.overall_time_units:
+                raise ParseError('Project {}: The number of project time units must be between 1 and {}'
+                                 .format(i, data.overall_time_units))
+            data.add_project((vector[:-1], vector[-1]))
+        return data
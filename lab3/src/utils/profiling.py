@@ -0,0 +1,133 @@
+import contextlib
+import os
+import tracemalloc
+from collections import defaultdict
+
+# Memory profiler measuring the sections of the program, set only while the program runs with memory profiling.
+_memory_profiler = None
+
+
+def write_collapsed_stacks(stats, path, max_depth=64):
+    """
+    Writes the call graph of a profile in the collapsed stack format read by flame graph tools.
+
+    cProfile records only the edges of the call graph, not whole stacks, so the self time of every function is split
+    among its callers in proportion to the time spent in it on behalf of each of them. Recursive calls are cut off,
+    so a function appears at most once in every stack.
+
+    :param stats: The profile.
+    :type stats: pstats.Stats
+    :param path: The path of the file to write.
+    :type path: str
+    :param max_depth: The maximum depth of the written stacks.
+    :type max_depth: int
+    """
+    callees = defaultdict(list)
+    for function, (_, _, _, _, callers) in stats.stats.items():
+        for caller, (_, _, _, edge_time) in callers.items():
+            callees[caller].append((function, edge_time))
+
+    def label(function):
+        filename, line, name = function
+        return '{}:{}({})'.format(os.path.basename(filename), line, name).replace(';', ',').replace(' ', '_')
+
+    stacks = defaultdict(float)
+
+    def walk(function, stack, on_stack, share):
+        _, _, self_time, _, _ = stats.stats[function]
+        stack.append(label(function))
+        on_stack.add(function)
+        stacks[';'.join(stack)] += self_time * share
+        if len(stack) < max_depth:
+            for callee, edge_time in callees[function]:
+                total_time = stats.stats[callee][3]
+                callee_share = share * edge_time / total_time if total_time > 0 else 0.0
+                if callee not in on_stack and callee_share * total_time >= 1e-6:
+                    walk(callee, stack, on_stack, callee_share)
+        on_stack.discard(function)
+        stack.pop()
+
+    for function, (_, _, _, _, callers) in stats.stats.items():
+        if not callers:
+            walk(function, [], set(), 1.0)
+
+    with open(path, 'w') as stacks_file:
+        for stack, seconds in sorted(stacks.items()):
+            microseconds = int(round(seconds * 1e6))
+            if microseconds > 0:
+                stacks_file.write('{} {}\n'.format(stack, microseconds))
+
+
+class MemoryProfiler:
+    """
+    Measures peak memory allocated in named sections of the program using :mod:`tracemalloc`.
+
+    Sections may be nested: the peak of an outer section includes the peaks of the sections inside it.
+    """
+
+    def __init__(self):
+        """Constructor."""
+        self.sections = {}  # name -> [call count, the highest peak, total retained memory]
+        self.stack = []  # [start memory, peak so far] of every open section
+
+    def start(self):
+        """Starts tracing memory allocations and makes :func:`memory_section` measure the sections."""
+        global _memory_profiler
+        tracemalloc.start()
+        _memory_profiler = self
+
+    def stop(self):
+        """Stops tracing memory allocations."""
+        global _memory_profiler
+        _memory_profiler = None
+        tracemalloc.stop()
+
+    @contextlib.contextmanager
+    def section(self, name):
+        """
+        Measures the memory allocated in a section.
+
+        :param name: The name of the section, measurements of all sections with the same name are aggregated.
+        :type name: str
+        """
+        current, peak = tracemalloc.get_traced_memory()
+        if self.stack:
+            self.stack[-1][1] = max(self.stack[-1][1], peak)
+        tracemalloc.reset_peak()
+        self.stack.append([current, current])
+        try:
+            yield
+        finally:
+            start, peak = self.stack.pop()
+            current, traced_peak = tracemalloc.get_traced_memory()
+            peak = max(peak, traced_peak)
+            calls, highest_peak, retained = self.sections.get(name, (0, 0, 0))
+            self.sections[name] = (calls + 1, max(highest_peak, peak - start), retained + current - start)
+            if self.stack:
+                self.stack[-1][1] = max(self.stack[-1][1], peak)
+            tracemalloc.reset_peak()
+
+    def report(self):
+        """
+        Builds a report of all measured sections.
+
+        :return: A table with the call count, the highest peak and the memory retained after every section.
+        :rtype: str
+        """
+        lines = ['{:<40} {:>10} {:>16} {:>16}'.format('section', 'calls', 'peak KiB', 'retained KiB (sum)')]
+        for name, (calls, peak, retained) in self.sections.items():
+            lines.append('{:<40} {:>10} {:>16.1f} {:>16.1f}'.format(name, calls, peak / 1024, retained / 1024))
+        return '\n'.join(lines) + '\n'
+
+
+def memory_section(name):
+    """
+    Measures the memory allocated in a section if the program runs with memory profiling.
+
+    :param name: The name of the section.
+    :type name: str
+    :return: A context manager measuring the section, or doing nothing if memory is not being profiled.
+    """
+    if _memory_profiler is None:
+        return contextlib.nullcontext()
+    return _memory_profiler.section(name)
@@ -0,0 +1,90 @@
+import logging
+import time
+
+SILENT = 'silent'
+SUMMARY = 'summary'
+FULL = 'full'
+LEVELS = [SILENT, SUMMARY, FULL]
+
+
+class ProgressReporter:
+    """
+    Reports the progress of a search to a logger.
+
+    Three kinds of reports are distinguished:
+
+        - details of every step of the search, logged only at the *full* level (as DEBUG records),
+        - periodic status of the search, logged every time at the *full* level and at most once per *interval*
+          seconds at the *summary* level (as INFO records with the status fields in the *progress* attribute,
+          so that structured handlers don't need to parse the message),
+        - events such as the start of a stage or the reason for stopping, logged at the *summary* and *full* levels
+          (as INFO records).
+
+    Nothing is logged at the *silent* level. Messages are formatted only if they are logged, so the reports cost
+    next to nothing when they are suppressed.
+    """
+
+    def __init__(self, level=FULL, interval=5.0, logger=None):
+        """
+        Constructor.
+
+        :param level: The verbosity level: 'silent', 'summary' or 'full'.
+        :type level: str
+        :param interval: The minimum number of seconds between two status reports at the summary level.
+        :type interval: float
+        :param logger: The logger the reports are sent to. Defaults to the 'taio' logger.
+        :type logger: logging.Logger
+        """
+        assert level in LEVELS
+        self.level = level
+        self.interval = interval
+        self.logger = logger or logging.getLogger('taio')
+        self.last_status = time.monotonic()
+
+    def detail(self, message, *args):
+        """
+        Reports a single step of the search.
+
+        :param message: The message, formatted with :meth:`str.format` using *args*.
+        :type message: str
+        """
+        if self.level == FULL:
+            self.logger.debug(message.format(*args))
+
+    def status(self, message, **fields):
+        """
+        Reports the current status of the search, rate-limited at the summary level.
+
+        :param message: The message, formatted with :meth:`str.format` using *fields*.
+        :type message: str
+        :param fields: The status fields, e.g. the generation number and the best shortage.
+        """
+        if self.level == SILENT:
+            return
+        now = time.monotonic()
+        if self.level == SUMMARY and now - self.last_status < self.interval:
+            return
+        self.last_status = now
+        self.logger.info(message.format(**fields), extra={'progress': fields})
+
+    def event(self, message, *args):
+        """
+        Reports an event important enough to be logged at the summary level.
+
+        :param message: The message, formatted with :meth:`str.format` using *args*.
+        :type message: str
+        """
+        if self.level != SILENT:
+            self.logger.info(message.format(*args))
+
+
+def default_reporter(verbose):
+    """
+    Builds the reporter used by solvers which were given only the verbose flag.
+
+    :param verbose: Whether the solver should report every step.
+    :type verbose: bool
+    :return: A reporter at the full level if *verbose* is set, a silent one otherwise.
+    :rtype: ProgressReporter
+    """
+    return ProgressReporter(FULL if verbose else SILENT)
@@ -0,0 +1,102 @@
+from src.classes.data import SchedulingData, nonzero_items
+from src.utils.scheduling import SchedulingSolver
+
+
+class ProblemReduction:
+    """
+    Removes projects which can't affect the shortage from a problem instance before searching for a schedule.
+
+    A project can't affect the shortage if every skill *s* it needs is *safe*: the number of experts having *s* and
+    no other skill needed by any project is at least the total demand for *s* of all projects. Then, whatever
+    the schedule, the demand for *s* can be covered by these experts, who are of no use anywhere else, so a project
+    needing only safe skills is always fully staffed and doesn't take experts from other projects. In particular,
+    this holds for projects with an all-zero requirement vector.
+
+    Such projects get a fixed start time and are removed from the searched instance. The full schedule is restored
+    once the search is done.
+    """
+
+    def __init__(self, scheduling_data):
+        """
+        Detects the projects to fix and builds the reduced problem instance.
+
+        :param scheduling_data: The problem instance to reduce.
+        :type scheduling_data: src.classes.data.SchedulingData
+        """
+        self.scheduling_data = scheduling_data
+        self.fixed_projects = self._find_fixed_projects()
+        self.free_projects = [i for i in range(scheduling_data.project_count) if i not in self.fixed_projects]
+        self.reduced_data = self._reduce()
+
+    def _find_fixed_projects(self):
+        """
+        Finds the projects needing only safe skills.
+
+        :return: A dictionary mapping the IDs of the fixed projects to their fixed start times.
+        :rtype: dict
+        """
+        data = self.scheduling_data
+        demand = [0] * data.skill_count
+        for requirements, _ in data.projects:
+            for skill_id, need in nonzero_items(requirements):
+                demand[skill_id] += need
+
+        dedicated_experts = [0] * data.skill_count
+        for expert in data.experts:
+            expert_needed_skills = [skill_id for skill_id, has_skill in nonzero_items(expert)
+                                    if has_skill > 0 and demand[skill_id] > 0]
+            if len(expert_needed_skills) == 1:
+                dedicated_experts[expert_needed_skills[0]] += 1
+
+        safe = [dedicated_experts[skill_id] >= demand[skill_id] for skill_id in range(data.skill_count)]
+        return dict((project_id, 0) for project_id, (requirements, _) in enumerate(data.projects)
+                    if all(safe[skill_id] for skill_id, need in nonzero_items(requirements) if need > 0))
+
+    def _reduce(self):
+        """
+        Builds the problem instance without the fixed projects.
+
+        :return: The reduced problem instance. Project *i* of the reduced instance is the project
+                 ``free_projects[i]`` of the original one.
+        :rtype: SchedulingData
+        """
+        data = self.scheduling_data
+        reduced_data = SchedulingData([data.skill_count, data.expert_count, len(self.free_projects),
+                                       data.overall_time_units])
+        reduced_data.experts = data.experts
+        reduced_data.projects = [data.projects[project_id] for project_id in self.free_projects]
+        return reduced_data
+
+    def restore_member(self, member):
+        """
+        Converts a member of the reduced instance into a member of the original instance.
+
+        :param member: The start times of the projects of the reduced instance.
+        :type member: tuple
+        :return: The start times of all projects of the original instance.
+        :rtype: tuple
+        """
+        full_member = [0] * self.scheduling_data.project_count
+        for project_id, start in self.fixed_projects.items():
+            full_member[project_id] = start
+        for project_id, start in zip(self.free_projects, member):
+            full_member[project_id] = start
+        return tuple(full_member)
+
+    def restore(self, result):
+        """
+        Converts the result of solving the reduced instance into the result for the original instance.
+
+        The restored schedule is evaluated once more on the original instance, so that the fixed projects are
+        included in its intervals and assignments.
+
+        :param result: A tuple containing the best member of the reduced instance and its solution.
+        :type result: tuple
+        :return: A tuple containing the best member of the original instance and its solution.
+        :rtype: tuple
+        """
+        member, solution = result
+        if member is None or not self.fixed_projects:
+            return result
+        full_member = self.restore_member(member)
+        return full_member, SchedulingSolver(self.scheduling_data, verbose=False).evaluate(full_member)
@@ -0,0 +1,283 @@
+import random
+import time
+from collections import OrderedDict
+from src.classes.data import nonzero_items
+from src.utils.profiling import memory_section
+from src.utils.progress import default_reporter
+from src.utils.seeding import PopulationSeeder
+from src.utils.solver import Solver
+from src.utils.warmcache import current_warm_cache
+
+
+# base of all scheduling engines: the shortage-cost fitness engine shared by all of them
+# members are tuples with start times of projects, solutions are tuples containing:
+# (total shortage or -1 if invalid, assignments in intervals, intervals, shortages per time unit in intervals)
+class SchedulingSolver:
+    def __init__(self, scheduling_data, seed=None, verbose=True, seeding='random', domains=None,
+                 time_budget=None, on_improvement=None, progress=None):
+        self.scheduling_data = scheduling_data
+        self.seeding = seeding  # 'random', 'greedy', 'balanced' or 'mixed', see PopulationSeeder.seed
+        self.verbose = verbose
+        self.progress = progress or default_reporter(verbose)  # see ProgressReporter, overrides verbose if given
+        self.random = random.Random(seed)  # every solver has its own random stream
+        self.counts = [
+            scheduling_data.skill_count,
+            scheduling_data.expert_count,
+            scheduling_data.project_count
+        ]
+        self.domains = domains or self._init_domains()  # custom domains may restrict the search to some windows
+        self.mutable_genes = [i for i, (lo, hi) in enumerate(self.domains) if lo < hi]
+        self.project_classes = self._init_project_classes()
+        self.max_cache_count = 1000
+        self.fitness_cache = OrderedDict()  # canonical member -> solution, the oldest entries are evicted first
+        self.cache_hits = 0
+        self.maxflow_solves = 0  # number of interval assignment problems solved
+        self.solved_interval_count = 0  # number of intervals in all schedules evaluated from scratch or by delta
+        self.expert_layer = None  # network part shared by all intervals, built on the first solve
+        self.warm_cache = current_warm_cache()  # state shared with earlier searches in this process, if started
+        self.max_interval_cache_count = 10000
+        # sorted projects of an interval -> its ProblemResult, the oldest entries are evicted first
+        self.interval_cache = self.warm_cache.interval_cache(scheduling_data) if self.warm_cache else OrderedDict()
+        self.interval_cache_hits = 0
+        self.time_budget = time_budget  # seconds of wall-clock time for the search, None means no limit
+        self.deadline = None  # set when the search starts
+        self.on_improvement = on_improvement  # called with (member, solution) whenever the best result improves
+
+    # starts measuring the time budget
+    def _start_clock(self):
+        if self.time_budget is not None:
+            self.deadline = time.monotonic() + self.time_budget
+
+    # checks if the time budget has run out
+    def _out_of_time(self):
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+    # streams a new best result to the caller, so that an early answer can be used before the search ends
+    def _report_improvement(self, member, solution):
+        if self.on_improvement:
+            self.on_improvement(member, solution)
+
+    # builds count starting members with the seeding strategy
+    def _seed_members(self, count):
+        seeder = PopulationSeeder(self.scheduling_data, self.domains, self.random)
+        return [self._canonicalize(member) for member in seeder.seed(self.seeding, count)]
+
+    # computes valid start times [lo, hi] of every project, so that it ends within the overall time units
+    def _init_domains(self):
+        return [(0, self.scheduling_data.overall_time_units - p_length)
+                for _, p_length in self.scheduling_data.projects]
+
+    # checks if scheduling even makes sense
+    def _validate_scheduling(self, member):
+        for gene, (lo, hi) in zip(member, self.domains):
+            if not lo <= gene <= hi:
+                return False
+        return True
+
+    # moves genes outside of their domains to the nearest valid start time
+    def _repair(self, member):
+        return tuple(min(max(gene, lo), hi) for gene, (lo, hi) in zip(member, self.domains))
+
+    # finds intervals with assigned projects for given member (only within [w_from, w_to) if window is given)
+    def _find_intervals(self, member, window=None):
+        if self.scheduling_data.project_count == 0:  # no projects specified
+            return []
+
+        events = []
+        projects = []
+
+        for i, p_from in enumerate(member):
+            p_to = p_from + self.scheduling_data.projects[i][1]
+            if window:
+                if p_to <= window[0] or window[1] <= p_from:
+                    continue  # project is not active in the window at all
+                p_from, p_to = max(p_from, window[0]), min(p_to, window[1])
+            events.extend([p_from, p_to])
+            projects.append((i, p_from, p_to))
+
+        if window:
+            events.extend(window)
+        events = list(set(events))
+        events.sort()
+
+        intervals = []
+        for i_from, i_to in zip(events[:-1], events[1:]):
+            i_projects = set()
+            for i, p_from, p_to in projects:
+                if i_from < p_to and p_from < i_to:
+                    i_projects.add(i)
+            if len(i_projects) > 0:  # don't even consider intervals w/o projects
+                intervals.append((i_from, i_to, i_projects))
+
+        return intervals
+
+    # fitness function
+    def _solve_scheduling(self, member):
+        if not self._validate_scheduling(member):
+            return -1, None, None, None  # scheduling doesn't make sense
+
+        total_shortage = 0
+        assignments = []
+        shortages = []
+
+        intervals = self._find_intervals(member)
+        for interval in intervals:
+            problem_result = self._solve_interval(interval)
+
+            i_length = interval[1] - interval[0]
+            total_shortage += problem_result.shortage * i_length  # problem_result.shortage is in one time unit
+            assignments.append(problem_result.assignment)
+            shortages.append(problem_result.shortage)
+
+        return total_shortage, assignments, intervals, shortages
+
+    # solves the assignment problem for projects active in given interval
+    # the result depends only on the set of projects, so it is cached: the same sets recur in many schedules
+    # the experts are the same in every interval, so their part of the network is built once and only copied
+    def _solve_interval(self, interval):
+        key = tuple(sorted(interval[2]))
+        result = self.interval_cache.get(key)
+        if result is not None:
+            self.interval_cache_hits += 1
+            return result
+        self.maxflow_solves += 1
+        if self.expert_layer is None:
+            if self.warm_cache:
+                self.expert_layer = self.warm_cache.expert_layer(self.counts, self.scheduling_data.experts)
+            else:
+                self.expert_layer = Solver.build_expert_layer(self.counts, self.scheduling_data.experts)
+        with memory_section('Interval network construction'):
+            solver = Solver(counts=self.counts, expert_layer=self.expert_layer)
+            for i in key:
+                solver.add_project(self.scheduling_data.projects[i][0], i)
+        result = solver.solve()
+        self.interval_cache[key] = result
+        if len(self.interval_cache) > self.max_interval_cache_count:
+            self.interval_cache.popitem(last=False)
+        return result
+
+    # fitness function for a member derived from an evaluated parent by changing a few genes
+    # only the time windows covering old and new placements of changed projects are re-solved,
+    # intervals outside of them have the same projects as in the parent, so their solutions are reused
+    def _solve_scheduling_delta(self, parent, parent_solution, member):
+        if not self._validate_scheduling(member):
+            return -1, None, None, None  # scheduling doesn't make sense
+
+        windows = []
+        for i, (parent_gene, gene) in enumerate(zip(parent, member)):
+            if parent_gene != gene:
+                windows.append([min(parent_gene, gene), max(parent_gene, gene) + self.scheduling_data.projects[i][1]])
+        windows.sort()
+        merged_windows = []
+        for window in windows:
+            if merged_windows and window[0] <= merged_windows[-1][1]:
+                merged_windows[-1][1] = max(merged_windows[-1][1], window[1])
+            else:
+                merged_windows.append(window)
+
+        # pieces of the schedule as (t_from, t_to, projects, assignment, shortage)
+        pieces = []
+        for interval, assignment, shortage in zip(parent_solution[2], parent_solution[1], parent_solution[3]):
+            i_from = interval[0]
+            for w_from, w_to in merged_windows:  # cut the window parts out of the parent's interval
+                if w_from >= interval[1]:
+                    break
+                if i_from < w_from:
+                    pieces.append((i_from, w_from, interval[2], assignment, shortage))
+                i_from = max(i_from, w_to)
+            if i_from < interval[1]:
+                pieces.append((i_from, interval[1], interval[2], assignment, shortage))
+        for window in merged_windows:
+            for interval in self._find_intervals(member, window):
+                problem_result = self._solve_interval(interval)
+                pieces.append(interval + (problem_result.assignment, problem_result.shortage))
+        pieces.sort(key=lambda piece: piece[0])
+
+        total_shortage = 0
+        assignments = []
+        intervals = []
+        shortages = []
+        for i_from, i_to, i_projects, assignment, shortage in pieces:
+            if intervals and intervals[-1][1] == i_from and intervals[-1][2] == i_projects:
+                intervals[-1] = (intervals[-1][0], i_to, i_projects)  # glue pieces split only by window bounds
+            else:
+                intervals.append((i_from, i_to, i_projects))
+                assignments.append(assignment)
+                shortages.append(shortage)
+            total_shortage += shortage * (i_to - i_from)
+
+        return total_shortage, assignments, intervals, shortages
+
+    # groups projects with identical requirements, lengths and domains, which can swap start times freely
+    def _init_project_classes(self):
+        classes = {}
+        for i, ((requirements, p_length), domain) in enumerate(zip(self.scheduling_data.projects, self.domains)):
+            classes.setdefault((tuple(nonzero_items(requirements)), p_length, domain), []).append(i)
+        return [project_ids for project_ids in classes.values() if len(project_ids) > 1]
+
+    # finds the mapping of given member into its canonical form:
+    # the whole schedule is shifted as early as the domains allow and projects within each class of identical
+    # projects are ordered by their start times; returns (permutation of project indices, time offset)
+    def _canonical_mapping(self, member):
+        offset = min((gene - lo for gene, (lo, _) in zip(member, self.domains)), default=0)
+        permutation = list(range(len(member)))
+        for project_ids in self.project_classes:
+            ordered = sorted(project_ids, key=lambda i: member[i])
+            for i, j in zip(ordered, project_ids):
+                permutation[i] = j
+        return permutation, offset
+
+    # returns the canonical form of given member, shared by all members with the same shortage due to symmetries
+    def _canonicalize(self, member):
+        permutation, offset = self._canonical_mapping(member)
+        canonical = [0] * len(member)
+        for i, gene in enumerate(member):
+            canonical[permutation[i]] = gene - offset
+        return tuple(canonical)
+
+    # transforms the solution of given member into the solution of its canonical form
+    def _canonicalize_solution(self, member, solution):
+        if solution[0] < 0:
+            return solution
+        permutation, offset = self._canonical_mapping(member)
+        if offset == 0 and all(i == j for i, j in enumerate(permutation)):
+            return solution
+        assignments = [[(expert_id, skill_id, permutation[project_id])
+                        for expert_id, skill_id, project_id in assignment] for assignment in solution[1]]
+        intervals = [(i_from - offset, i_to - offset, set(permutation[i] for i in i_projects))
+                     for i_from, i_to, i_projects in solution[2]]
+        return solution[0], assignments, intervals, solution[3]
+
+    # evaluates given member (incrementally if its evaluated parent is given) using the fitness cache
+    # returns the canonical form of the member and its solution
+    def _evaluate_canonical(self, member, parent=None, parent_solution=None):
+        canonical = self._canonicalize(member)
+        if canonical in self.fitness_cache:
+            self.cache_hits += 1
+            return canonical, self.fitness_cache[canonical]
+        if parent_solution and parent_solution[0] >= 0:
+            solution = self._solve_scheduling_delta(parent, parent_solution, member)
+        else:
+            solution = self._solve_scheduling(member)
+        solution = self._canonicalize_solution(member, solution)
+        if solution[0] >= 0:
+            self.solved_interval_count += len(solution[2])
+        self.fitness_cache[canonical] = solution
+        if len(self.fitness_cache) > self.max_cache_count:
+            self.fitness_cache.popitem(last=False)
+        return canonical, solution
+
+    # evaluates a single member, returns its solution
+    def evaluate(self, member):
+        return self._solve_scheduling(member)
+
+    @staticmethod
+    def print_result(member, solution):
+        if member and solution:
+            print('\nTotal shortage: {}.'.format(solution[0]))
+            print('Best starting times for projects: {}.'.format(member))
+            print('Intervals [t_from, t_to] -> [projects] with assignments (expert, skill, project):')
+            for assignment, interval in zip(solution[1], solution[2]):
+                print('[{},{}] -> {}: {}'.format(interval[0], interval[1], list(interval[2]), assignment))
+        else:
+            print('\nNo solution found.')
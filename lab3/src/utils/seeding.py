@@ -0,0 +1,170 @@
+from src.classes.data import nonzero_items
+from src.utils.bounds import count_skill_supply
+
+
+class PopulationSeeder:
+    """
+    Constructs starting members for :class:`src.utils.scheduling.SchedulingSolver` engines.
+
+    Besides uniformly random members, it builds members with heuristics aware of scarce skills:
+
+        - list scheduling: projects are ordered by their demand on scarce skills and every project is placed
+          where it adds the least (scarcity weighted) overlap with the projects placed before,
+        - load balancing: projects needing each scarce skill are spread evenly across the time horizon.
+
+    Both heuristics have randomized variants, used to keep the population diverse.
+    """
+
+    def __init__(self, scheduling_data, domains, rng):
+        """
+        Precomputes the scarcity of every skill.
+
+        :param scheduling_data: The problem instance.
+        :type scheduling_data: src.classes.data.SchedulingData
+        :param domains: The valid start times (lo, hi) of every project.
+        :type domains: list
+        :param rng: The random number generator to use.
+        :type rng: random.Random
+        """
+        self.projects = scheduling_data.projects
+        self.overall_time_units = scheduling_data.overall_time_units
+        self.domains = domains
+        self.rng = rng
+        skill_supply = count_skill_supply(scheduling_data)
+        # the scarcer the skill, the more an overlap of its demand costs; skills nobody has are short
+        # no matter the schedule, so they don't matter at all
+        self.weights = [1 / supply if supply > 0 else 0 for supply in skill_supply]
+        demand = [0] * scheduling_data.skill_count
+        self.projects_needing = {}  # skill ID -> IDs of the projects needing it, in ascending order
+        for project_id, (requirements, p_length) in enumerate(self.projects):
+            for skill_id, need in nonzero_items(requirements):
+                if need > 0:
+                    demand[skill_id] += need * p_length
+                    self.projects_needing.setdefault(skill_id, []).append(project_id)
+        scarcity = [demand[s] * self.weights[s] for s in range(scheduling_data.skill_count)]
+        self.scarce_skills = sorted((s for s in range(scheduling_data.skill_count) if scarcity[s] > 0),
+                                    key=lambda s: -scarcity[s])
+
+    def random_member(self):
+        """
+        :return: A member with uniformly random start times.
+        :rtype: tuple
+        """
+        return tuple(self.rng.randint(lo, hi) for lo, hi in self.domains)
+
+    def list_scheduling_member(self, randomized=False):
+        """
+        Builds a member by greedy list scheduling.
+
+        Projects are placed one by one, starting with those with the highest demand on scarce skills. Every project
+        is placed at the start time minimizing the sum of its scarcity weighted overlap with the projects already
+        placed. Prefix sums of the per-skill load make evaluating a start time cost O(skills the project needs); the
+        load is only kept for the skills some placed project needs.
+
+        :param randomized: If True, the order of projects is perturbed and the start time is chosen randomly among
+                           the three best ones.
+        :type randomized: bool
+        :return: The constructed member.
+        :rtype: tuple
+        """
+        member = [0] * len(self.projects)
+        load = {}  # skill ID -> load in every time unit
+
+        def priority(project_id):
+            requirements, p_length = self.projects[project_id]
+            value = sum(need * self.weights[s] for s, need in nonzero_items(requirements)) * p_length
+            return value * self.rng.uniform(0.8, 1.2) if randomized else value
+
+        for project_id in sorted(range(len(self.projects)), key=priority, reverse=True):
+            requirements, p_length = self.projects[project_id]
+            needed = [(s, need * self.weights[s]) for s, need in nonzero_items(requirements)
+                      if need * self.weights[s] > 0]
+            needed = [(s, weight) for s, weight in needed if s in load]  # skills without load add no overlap
+            prefix_sums = []
+            for s, _ in needed:
+                prefix_sum = [0]
+                for value in load[s]:
+                    prefix_sum.append(prefix_sum[-1] + value)
+                prefix_sums.append(prefix_sum)
+
+            lo, hi = self.domains[project_id]
+            costs = []
+            for start in range(lo, hi + 1):
+                cost = sum(weight * (prefix_sum[start + p_length] - prefix_sum[start])
+                           for (_, weight), prefix_sum in zip(needed, prefix_sums))
+                costs.append((cost, start))
+            if randomized:
+                start = self.rng.choice(sorted(costs)[:3])[1]
+            else:
+                start = min(costs)[1]
+
+            member[project_id] = start
+            for s, need in nonzero_items(requirements):
+                if need * self.weights[s] > 0:
+                    skill_load = load.setdefault(s, [0] * self.overall_time_units)
+                    for t in range(start, start + p_length):
+                        skill_load[t] += need
+        return tuple(member)
+
+    def load_balancing_member(self, randomized=False):
+        """
+        Builds a member by spreading the load of scarce skills evenly across the time horizon.
+
+        Starting with the scarcest skill, the projects needing it which were not placed yet get their centers evenly
+        spaced over the horizon, longest projects first. Projects not needing any scarce skill are placed randomly.
+
+        :param randomized: If True, the projects are shuffled and their centers are jittered.
+        :type randomized: bool
+        :return: The constructed member.
+        :rtype: tuple
+        """
+        member = [None] * len(self.projects)
+        for skill_id in self.scarce_skills:
+            project_ids = [i for i in self.projects_needing[skill_id] if member[i] is None]
+            if randomized:
+                self.rng.shuffle(project_ids)
+            else:
+                project_ids.sort(key=lambda i: -self.projects[i][1])
+            spacing = self.overall_time_units / max(1, len(project_ids))
+            for k, project_id in enumerate(project_ids):
+                center = (k + 0.5) * spacing
+                if randomized:
+                    center += self.rng.uniform(-spacing / 2, spacing / 2)
+                lo, hi = self.domains[project_id]
+                member[project_id] = min(max(int(round(center - self.projects[project_id][1] / 2)), lo), hi)
+        for project_id, (lo, hi) in enumerate(self.domains):
+            if member[project_id] is None:
+                member[project_id] = self.rng.randint(lo, hi)
+        return tuple(member)
+
+    def seed(self, strategy, count):
+        """
+        Builds members of the initial population.
+
+        :param strategy: One of:
+
+            - ``'random'`` - uniformly random members,
+            - ``'greedy'`` - list scheduling members (the first one deterministic, the rest randomized),
+            - ``'balanced'`` - load balancing members (the first one deterministic, the rest randomized),
+            - ``'mixed'`` - both deterministic heuristic members, followed by randomized heuristic members
+              and random members in turns.
+        :type strategy: str
+        :param count: The number of members to build.
+        :type count: int
+        :return: The list of built members. It may contain duplicates.
+        :rtype: list
+        """
+        if strategy == 'random':
+            return [self.random_member() for _ in range(count)]
+        if strategy == 'greedy':
+            return [self.list_scheduling_member(randomized=i > 0) for i in range(count)]
+        if strategy == 'balanced':
+            return [self.load_balancing_member(randomized=i > 0) for i in range(count)]
+        if strategy == 'mixed':
+            builders = [lambda: self.list_scheduling_member(randomized=True),
+                        lambda: self.load_balancing_member(randomized=True),
+                        self.random_member]
+            members = [self.list_scheduling_member(), self.load_balancing_member()]
+            members.extend(builders[i % len(builders)]() for i in range(count - len(members)))
+            return members[:count]
+        raise ValueError('Unknown seeding strategy: {}'.format(strategy))
@@ -0,0 +1,128 @@
+import heapq
+from functools import partial
+
+
+def fitness(solution):
+    """
+    Computes the fitness of a member from its solution. Lower shortage means higher fitness.
+
+    :param solution: A valid solution, as returned by :meth:`SchedulingSolver._solve_scheduling`.
+    :type solution: tuple
+    :return: The fitness of the member, in the range (0, 1].
+    :rtype: float
+    """
+    return 1 / (1 + solution[0])
+
+
+def elitism(candidates, count):
+    """
+    Splits the candidates into the *count* best ones and the remaining ones in O(N log count) time.
+
+    :param candidates: A list of evaluated (member, solution) pairs.
+    :type candidates: list
+    :param count: The number of best candidates to carry over.
+    :type count: int
+    :return: A tuple containing the list of the best candidates and the list of the remaining ones.
+    :rtype: tuple
+    """
+    if count <= 0:
+        return [], candidates
+    best = heapq.nsmallest(count, range(len(candidates)), key=lambda i: candidates[i][1][0])
+    chosen = set(best)
+    return [candidates[i] for i in best], [c for i, c in enumerate(candidates) if i not in chosen]
+
+
+def stochastic_universal_sampling(candidates, count, rng):
+    """
+    Selects *count* candidates proportionally to their fitness in O(N) time.
+
+    A single random offset is drawn and *count* evenly spaced pointers are placed over the cumulative fitness,
+    so the selection has minimal spread compared to repeated roulette spins.
+
+    :param candidates: A list of evaluated (member, solution) pairs.
+    :type candidates: list
+    :param count: The number of selections to make.
+    :type count: int
+    :param rng: The random number generator to use.
+    :type rng: random.Random
+    :return: The list of selected (member, solution) pairs. A candidate may be selected more than once.
+    :rtype: list
+    """
+    if count <= 0 or not candidates:
+        return []
+    fitness_values = [fitness(solution) for _, solution in candidates]
+    step = sum(fitness_values) / count
+    pointer = rng.uniform(0, step)
+    selected = []
+    cumulative = 0
+    i = 0
+    for candidate, value in zip(candidates, fitness_values):
+        cumulative += value
+        while i < count and pointer < cumulative:
+            selected.append(candidate)
+            pointer += step
+            i += 1
+    # floating point errors may leave the last pointers just past the total fitness
+    selected.extend([candidates[-1]] * (count - i))
+    return selected
+
+
+def tournament_selection(candidates, count, rng, tournament_size=2):
+    """
+    Selects *count* candidates, each being the best of *tournament_size* randomly drawn ones,
+    in O(N * tournament_size) time.
+
+    :param candidates: A list of evaluated (member, solution) pairs.
+    :type candidates: list
+    :param count: The number of selections to make.
+    :type count: int
+    :param rng: The random number generator to use.
+    :type rng: random.Random
+    :param tournament_size: The number of candidates competing in a single tournament.
+    :type tournament_size: int
+    :return: The list of selected (member, solution) pairs. A candidate may be selected more than once.
+    :rtype: list
+    """
+    if count <= 0 or not candidates:
+        return []
+    selected = []
+    for _ in range(count):
+        contestants = [rng.randrange(len(candidates)) for _ in range(tournament_size)]
+        selected.append(candidates[min(contestants, key=lambda i: candidates[i][1][0])])
+    return selected
+
+
+def truncation_selection(candidates, count, rng):
+    """
+    Selects the *count* best candidates in O(N log count) time.
+
+    :param candidates: A list of evaluated (member, solution) pairs.
+    :type candidates: list
+    :param count: The number of selections to make.
+    :type count: int
+    :param rng: The random number generator, unused as the selection is deterministic.
+    :type rng: random.Random
+    :return: The list of selected (member, solution) pairs, every candidate is selected at most once.
+    :rtype: list
+    """
+    return elitism(candidates, count)[0]
+
+
+def get_selection(name, tournament_size=2):
+    """
+    Returns the selection method with the supplied name.
+
+    :param name: Either ``'sus'`` (stochastic universal sampling), ``'tournament'`` or ``'truncation'``.
+    :type name: str
+    :param tournament_size: The size of tournaments, used only by the tournament selection.
+    :type tournament_size: int
+    :return: A function taking the candidates, the number of selections and a random number generator.
+    :rtype: callable
+    """
+    if name == 'sus':
+        return stochastic_universal_sampling
+    if name == 'tournament':
+        return partial(tournament_selection, tournament_size=tournament_size)
+    if name == 'truncation':
+        return truncation_selection
+    raise ValueError('Unknown selection method: {}'.format(name))
@@ -0,0 +1,321 @@
+import argparse
+import errno
+import io
+import json
+import os
+import signal
+import socket
+import socketserver
+import stat
+import statistics
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from src.assignment import result_record, solve_instance
+from src.classes.graph import set_backend
+from src.utils.parser import Parser, ParseError
+from src.utils.progress import SILENT, ProgressReporter
+from src.utils.warmcache import WarmCache, current_warm_cache
+
+# Hosts the TCP server may listen on, the server has no authentication, so it is reachable only from this machine.
+LOCAL_HOSTS = ['127.0.0.1', 'localhost', '::1']
+
+
+def parse_address(address):
+    """
+    Parses the address the server listens on.
+
+    :param address: 'unix:PATH' or a path containing '/' for a Unix socket, 'HOST:PORT' or 'PORT' for a TCP port on
+                    a local host (127.0.0.1 by default).
+    :type address: str
+    :return: A tuple ('unix', path) or ('tcp', (host, port)).
+    :rtype: tuple
+    :raise ValueError: When the address is malformed or the host is not a local one.
+    """
+    if address.startswith('unix:'):
+        return 'unix', address[len('unix:'):]
+    if '/' in address:
+        return 'unix', address
+    host, _, port = address.rpartition(':')
+    host = host.strip('[]') or '127.0.0.1'
+    if host not in LOCAL_HOSTS:
+        raise ValueError('the server may only listen on a local host: {}'.format(', '.join(LOCAL_HOSTS)))
+    return 'tcp', (host, int(port))
+
+
+class RequestStats:
+    """Thread-safe statistics of the requests handled by the server: their count, throughput and latency."""
+
+    def __init__(self, window=1000):
+        """
+        Constructor.
+
+        :param window: The number of the latest requests the latency percentiles are computed from.
+        :type window: int
+        """
+        self.lock = threading.Lock()
+        self.start = time.monotonic()
+        self.request_count = 0
+        self.failed_count = 0
+        self.latencies = deque(maxlen=window)
+
+    def record(self, latency, ok):
+        """
+        Records a handled request.
+
+        :param latency: The seconds between receiving the request and sending the response.
+        :type latency: float
+        :param ok: Whether the request was solved successfully.
+        :type ok: bool
+        """
+        with self.lock:
+            self.request_count += 1
+            self.failed_count += not ok
+            self.latencies.append(latency)
+
+    def snapshot(self):
+        """
+        Computes the current statistics.
+
+        :return: The request counts, the uptime, the throughput in requests per second since the start, and the
+                 mean, median, 95th percentile and maximum latency of the latest requests in seconds.
+        :rtype: dict
+        """
+        with self.lock:
+            latencies = sorted(self.latencies)
+            uptime = time.monotonic() - self.start
+            stats = {
+                'requests': self.request_count,
+                'failed': self.failed_count,
+                'uptime': round(uptime, 3),
+                'throughput': round(self.request_count / uptime, 3) if uptime > 0 else 0.0
+            }
+        if latencies:
+            stats['latency'] = {
+                'mean': round(statistics.fmean(latencies), 4),
+                'p50': round(latencies[len(latencies) // 2], 4),
+                'p95': round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))], 4),
+                'max': round(latencies[-1], 4)
+            }
+        return stats
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """
+    Handles the requests of the server:
+
+        - ``POST /solve`` solves the instance in the request body, given in the text format (``?format=sparse`` for
+          the sparse one) or in the JSON format (with the ``application/json`` content type). ``?seed=N`` and
+          ``?time_budget=S`` override the search options of the server.
+        - ``GET /stats`` reports the request statistics.
+    """
+
+    def do_GET(self):
+        if urlsplit(self.path).path != '/stats':
+            self._send(404, {'status': 'error', 'error': 'Not found'})
+            return
+        self._send(200, self.server.solver_server.stats.snapshot())
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        if url.path != '/solve':
+            self._send(404, {'status': 'error', 'error': 'Not found'})
+            return
+        start = time.monotonic()
+        try:
+            request = self._read_request(url.query)
+        except ValueError as e:
+            record = {'status': 'error', 'error': str(e)}
+        else:
+            record = self.server.solver_server.solve(request)
+        latency = time.monotonic() - start
+        record['latency'] = round(latency, 4)
+        self.server.solver_server.finish(latency, record)
+        self._send({'ok': 200, 'error': 400}.get(record['status'], 500), record)
+
+    def _read_request(self, query):
+        """
+        Reads the body and the options of a solve request.
+
+        :param query: The query string of the request.
+        :type query: str
+        :return: The request passed to the solve function of the server.
+        :rtype: dict
+        :raise ValueError: When the request is malformed.
+        """
+        length = self.headers.get('Content-Length')
+        if length is None:
+            raise ValueError('Content-Length is required')
+        body = self.rfile.read(int(length)).decode()
+        options = {}
+        parameters = parse_qs(query)
+        if 'seed' in parameters:
+            options['seed'] = int(parameters['seed'][-1])
+        if 'time_budget' in parameters:
+            options['time_budget'] = float(parameters['time_budget'][-1])
+        input_format = parameters.get('format', ['dense'])[-1]
+        if input_format not in ('dense', 'sparse'):
+            raise ValueError('Unknown format: {}'.format(input_format))
+        content_type = self.headers.get('Content-Type', '').split(';')[0].strip()
+        return {'body': body, 'json': content_type == 'application/json', 'format': input_format, 'options': options}
+
+    def _send(self, code, document):
+        content = (json.dumps(document) + '\n').encode()
+        self.send_response(code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        self.server.solver_server.progress.detail('{} {}', self.address_string(), format % args)
+
+
+class _TCPHTTPServer(ThreadingHTTPServer):
+    """HTTP server listening on an IPv4 TCP port, every request handled in its own thread."""
+    daemon_threads = True
+
+
+class _TCP6HTTPServer(_TCPHTTPServer):
+    """HTTP server listening on an IPv6 TCP port, every request handled in its own thread."""
+    address_family = socket.AF_INET6
+
+
+class _UnixHTTPServer(socketserver.ThreadingUnixStreamServer):
+    """HTTP server listening on a Unix socket, every request handled in its own thread."""
+    daemon_threads = True
+
+    def get_request(self):
+        request, _ = super().get_request()
+        return request, ('local', 0)
+
+
+class SolverServer:
+    """
+    Long-running HTTP server answering solve requests on a Unix socket or a local TCP port.
+
+    Requests are handled in threads, each passing its request to the *solve* function, which is expected to hand it
+    over to a pool of worker processes keeping their warm state between requests.
+    """
+
+    def __init__(self, address, solve, progress):
+        """
+        Constructor, binds the server to its address.
+
+        :param address: The address, see :func:`parse_address`.
+        :type address: str
+        :param solve: Called with a request dictionary (the body, whether it is JSON, the text format and the option
+                      overrides) and returning a JSON-serializable record with a 'status' of 'ok', 'error' (invalid
+                      instance) or 'failed'.
+        :type solve: callable
+        :param progress: The reporter of the served requests.
+        :type progress: src.utils.progress.ProgressReporter
+        :raise ValueError: When the address is malformed.
+        :raise OSError: When the server can't listen on the address, or a file which isn't a socket exists at the
+                        path of a Unix socket.
+        """
+        self.solve = solve
+        self.progress = progress
+        self.stats = RequestStats()
+        self.kind, self.address = parse_address(address)
+        if self.kind == 'unix':
+            if os.path.lexists(self.address):
+                if not stat.S_ISSOCK(os.lstat(self.address).st_mode):
+                    raise OSError(errno.EEXIST, 'Not a socket, refusing to replace it', self.address)
+                os.unlink(self.address)  # left behind by a server which was killed
+            self.http_server = _UnixHTTPServer(self.address, _RequestHandler)
+        else:
+            server_type = _TCP6HTTPServer if ':' in self.address[0] else _TCPHTTPServer
+            self.http_server = server_type(self.address, _RequestHandler)
+        self.http_server.solver_server = self
+
+    def finish(self, latency, record):
+        """
+        Records a handled request and reports the statistics.
+
+        :param latency: The latency of the request in seconds.
+        :type latency: float
+        :param record: The response record.
+        :type record: dict
+        """
+        self.stats.record(latency, record['status'] == 'ok')
+        self.progress.detail('Request finished with status {} in {:.3f}s.', record['status'], latency)
+        stats = self.stats.snapshot()
+        self.progress.status('{requests} requests ({failed} failed), {throughput:.2f} requests/s, mean latency '
+                             '{mean:.3f}s, p95 latency {p95:.3f}s.', requests=stats['requests'],
+                             failed=stats['failed'], throughput=stats['throughput'], **stats['latency'])
+
+    def serve_forever(self):
+        """Serves requests until the process is interrupted, then closes the server."""
+        self.progress.event('Listening on {}.', self.address if self.kind == 'unix'
+                            else 'http://{}:{}'.format(*self.http_server.server_address[:2]))
+        try:
+            self.http_server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.http_server.server_close()
+            if self.kind == 'unix' and os.path.exists(self.address):
+                os.unlink(self.address)
+        stats = self.stats.snapshot()
+        self.progress.event('Served {} requests ({} failed), {:.2f} requests/s.',
+                            stats['requests'], stats['failed'], stats['throughput'])
+
+
+def init_worker(backend):
+    """
+    Initializes a worker process of the solver server, its warm cache lives as long as the process.
+
+    Interrupts are ignored, the server process shuts the pool down when it is interrupted.
+
+    :param backend: The graph backend, see :func:`src.classes.graph.set_backend`.
+    :type backend: str
+    """
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    set_backend(backend)
+    WarmCache().start()
+
+
+def solve_request(task):
+    """
+    Parses and solves the instance of a single server request in a worker process.
+
+    :param task: A tuple containing the request, see :class:`SolverServer`, and the parsed command
+                 line arguments of the server.
+    :type task: tuple
+    :return: The result record of the instance, see :func:`src.assignment.result_record`, with the status ('ok',
+             'error' for an invalid instance or 'failed'), the solving time and the numbers of warm cache hits.
+    :rtype: dict
+    """
+    request, args = task
+    args = argparse.Namespace(**dict(vars(args), **request['options']))
+    warm_cache = current_warm_cache()
+    hits = warm_cache.layer_hits, warm_cache.instance_hits
+    start = time.monotonic()
+    record = {}
+    try:
+        input_parser = Parser()
+        if request['json']:
+            try:
+                document = json.loads(request['body'])
+            except ValueError as e:
+                raise ParseError('Invalid JSON: {}'.format(e))
+            scheduling_data = input_parser.parse_json(document)
+        elif request['format'] == 'sparse':
+            scheduling_data = input_parser.parse_sparse(io.StringIO(request['body']))
+        else:
+            scheduling_data = input_parser.parse_bulk(io.StringIO(request['body']))
+        member, solution = solve_instance(scheduling_data, args, ProgressReporter(SILENT), args.time_budget)
+        record['status'] = 'ok'
+        record.update(result_record(member, solution))
+    except ParseError as e:
+        record.update(status='error', error=str(e))
+    except Exception as e:
+        record.update(status='failed', error='{}: {}'.format(type(e).__name__, e))
+    record['solve_time'] = round(time.monotonic() - start, 4)
+    record['warm'] = {'expert_layer_hits': warm_cache.layer_hits - hits[0],
+                      'instance_hits': warm_cache.instance_hits - hits[1]}
+    return record
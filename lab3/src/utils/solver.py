@@ -1,28 +1,110 @@
-from src.classes.data import ProblemResult
+from src.classes.data import ProblemResult, nonzero_items
 from src.classes.graph import Graph
+from src.utils.profiling import memory_section
 
 
 class Solver:
-    def __init__(self, input_data):
+    def __init__(self, input_data=None, counts=None, expert_layer=None, skill_ids=None):
         """
         Initializes the solver using the supplied input data.
 
+        The solver can also be built incrementally: given only the counts, it starts with an empty network and
+        experts and projects are added one at a time by :meth:`add_expert` and :meth:`add_project`, so that their
+        vectors never have to be held in memory all at once.
+
+        Only the skills which are used get a node in the network, so the size of the network and the time to solve
+        it don't depend on the skill count of sparse instances.
+
         :param input_data: An instance of :class:`src.classes.data.ProblemData` containing information
                            about the problem instance.
         :type input_data: src.classes.data.ProblemData
+        :param counts: A list of skill, expert and project counts, used instead of *input_data* to build the
+                       solver incrementally.
+        :type counts: list
+        :param expert_layer: A network containing all experts, built by :meth:`build_expert_layer` for the same
+                             counts. It is copied, so it can be shared by many solvers which differ only in projects.
+        :type expert_layer: src.classes.graph.Graph
+        :param skill_ids: The IDs of the skills whose nodes are added to the network up front, the skills of the
+                          experts in *input_data* by default. The node of any other skill is added with its first edge.
+        :type skill_ids: list
         """
-        self.experts = input_data.experts
-        self.projects = input_data.projects
-
-        self.expert_count = input_data.expert_count
-        self.project_count = input_data.project_count
-        self.skills_count = input_data.skill_count
+        if input_data is not None:
+            counts = [input_data.skill_count, input_data.expert_count, input_data.project_count]
+            if skill_ids is None:
+                skill_ids = self.used_skills(input_data.experts)
+        self.skills_count, self.expert_count, self.project_count = counts
+        self.added_expert_count = self.expert_count if expert_layer else 0
+        self.added_project_count = 0
+        self.demand = 0
 
         nodes_count = self.expert_count + self.project_count + self.skills_count
         self.s = 0
         self.t = nodes_count + 1
 
-        self._build_graph()
+        with memory_section('Solver graph construction'):
+            self._build_graph(expert_layer, skill_ids or [])
+            if input_data is not None:
+                for vector in input_data.experts:
+                    self.add_expert(vector)
+                for vector in input_data.projects:
+                    self.add_project(vector)
+
+    @classmethod
+    def build_expert_layer(cls, counts, experts):
+        """
+        Builds the part of the network which depends only on the experts: the source and the expert-skill edges.
+
+        :param counts: A list of skill, expert and project counts.
+        :type counts: list
+        :param experts: An iterable of the skill vectors of all experts.
+        :return: The network, to be passed to the constructor.
+        :rtype: src.classes.graph.Graph
+        """
+        experts = list(experts)
+        solver = cls(counts=counts, skill_ids=cls.used_skills(experts))
+        for vector in experts:
+            solver.add_expert(vector)
+        return solver.graph
+
+    @staticmethod
+    def used_skills(experts):
+        """
+        Finds the skills any of the experts has.
+
+        :param experts: An iterable of the skill vectors of experts, dense or sparse.
+        :return: The sorted IDs of the skills.
+        :rtype: list
+        """
+        return sorted(set(skill_id for vector in experts for skill_id, has_skill in nonzero_items(vector)
+                          if has_skill > 0))
+
+    def add_expert(self, vector):
+        """
+        Adds the next expert to the network.
+
+        :param vector: The skill vector of the expert.
+        :type vector: list
+        """
+        expert_id = self.added_expert_count
+        self.added_expert_count += 1
+        self.graph.add_edge(self.s, self._v_expert(expert_id), capacity=1)
+        self._connect_expert_to_skills(expert_id, vector)
+
+    def add_project(self, requirements, project_id=None):
+        """
+        Adds a project to the network.
+
+        :param requirements: The requirement vector of the project.
+        :type requirements: list
+        :param project_id: The ID number of the project, the next one by default. Projects which are never added
+                           are treated as having no requirements.
+        :type project_id: int
+        """
+        if project_id is None:
+            project_id = self.added_project_count
+        self.added_project_count = project_id + 1
+        self._connect_skills_to_project(project_id, requirements)
+        self._connect_project_to_sink(project_id, requirements)
 
     def solve(self):
         """
@@ -34,28 +116,30 @@ class Solver:
         """
         # Find maximum flow in the graph.
         max_flow_value, flow_graph = self.graph.maximum_flow(self.s, self.t)
-        skills = dict((skill_id, []) for skill_id in range(self.skills_count))
+        skills = {}
         assignment = []
 
         # Split the experts into the skills they were chosen to by the maximum flow.
-        for (expert_id, expert_skills) in enumerate(self.experts):
-            for (skill_id, has_skill) in enumerate(expert_skills):
-                if has_skill > 0:
-                    if flow_graph.get_flow_value(self._v_expert(expert_id), self._v_skill(skill_id)) == 1:
-                        skills[skill_id].append(expert_id)
-                        break
+        for expert_id in range(self.expert_count):
+            for v_skill, flow_value in flow_graph.get_flow_values(self._v_expert(expert_id)).items():
+                if flow_value == 1:
+                    skills.setdefault(v_skill - self._v_skill(0), []).append(expert_id)
+                    break
 
         # Given the list of experts assigned to skills, assign them project-by-project according to their needs.
         # This can be done naively; Kirchhoff's law for networks ensures that incoming and outgoing flow for skill
-        # vertices will be equal.
-        for (project_id, requirements) in enumerate(self.projects):
-            for (skill_id, need) in enumerate(requirements):
-                if need > 0:
-                    flow_value = flow_graph.get_flow_value(self._v_skill(skill_id), self._v_project(project_id))
-                    while flow_value > 0:
-                        expert_id = skills[skill_id].pop()
-                        assignment.append((expert_id, skill_id, project_id))
-                        flow_value -= 1
+        # vertices will be equal, so only the skills some experts were chosen to have any flow to projects.
+        project_flows = []
+        for skill_id in skills:
+            for v_project, flow_value in flow_graph.get_flow_values(self._v_skill(skill_id)).items():
+                if flow_value > 0:
+                    project_flows.append((v_project - self._v_project(0), skill_id, flow_value))
+        project_flows.sort()
+        for project_id, skill_id, flow_value in project_flows:
+            while flow_value > 0:
+                expert_id = skills[skill_id].pop()
+                assignment.append((expert_id, skill_id, project_id))
+                flow_value -= 1
 
         shortage = self._calculate_shortage(max_flow_value)
         return ProblemResult(shortage, assignment)
@@ -69,59 +153,79 @@ class Solver:
         :return: The expert shortage as a number.
         :rtype: int
         """
-        demand = sum(sum(x) for x in self.projects)
-        return demand - supply
+        return self.demand - supply
 
-    def _build_graph(self):
-        """Builds the network graph corresponding to the problem instance being solved."""
-        self.graph = Graph()
-        self._add_nodes()
-        self._connect_experts_to_source()
-        self._connect_experts_to_skills()
-        self._connect_skills_to_projects()
-        self._connect_projects_to_sink()
+    def _build_graph(self, expert_layer=None, skill_ids=()):
+        """
+        Builds the initial network graph, without experts and projects unless a prebuilt expert layer is given.
 
-    def _add_nodes(self):
-        """Adds nodes for experts, skills and projects, as well as the network source and sink, to the graph."""
-        self.graph.add_nodes(list(range(self.t + 1)))
+        :param expert_layer: A network containing all experts, built by :meth:`build_expert_layer`.
+        :type expert_layer: src.classes.graph.Graph
+        :param skill_ids: The IDs of the skills to add nodes for.
+        :type skill_ids: list
+        """
+        if expert_layer:
+            self.graph = expert_layer.copy()
+        else:
+            self.graph = Graph()
+            self._add_nodes(skill_ids)
 
-    def _connect_experts_to_source(self):
-        """Connects all expert nodes to the network source with an edge of capacity 1."""
-        for expert_id in range(self.expert_count):
-            self.graph.add_edge(self.s, self._v_expert(expert_id), capacity=1)
+    def _add_nodes(self, skill_ids=()):
+        """
+        Adds nodes for experts, the given skills and projects, as well as the network source and sink, to the graph.
+
+        :param skill_ids: The IDs of the skills to add nodes for, in ascending order.
+        :type skill_ids: list
+        """
+        self.graph.add_nodes([self.s] + [self._v_expert(expert_id) for expert_id in range(self.expert_count)]
+                             + [self._v_skill(skill_id) for skill_id in skill_ids]
+                             + [self._v_project(project_id) for project_id in range(self.project_count)] + [self.t])
 
-    def _connect_experts_to_skills(self):
+    def _connect_expert_to_skills(self, expert_id, expert_skills):
         """
-        Connects all expert nodes to the skills they possess, with an edge of capacity 1.
-        If an expert *e* doesn't possess the skill *u*, no edge is added.
+        Connects an expert node to the skills the expert possesses, with an edge of capacity 1.
+        If the expert doesn't possess the skill *u*, no edge is added.
+
+        :param expert_id: The ID number of the expert.
+        :type expert_id: int
+        :param expert_skills: The skill vector of the expert, dense or sparse.
+        :type expert_skills: list
         """
-        for (expert_id, expert_skills) in enumerate(self.experts):
-            for (skill_id, has_skill) in enumerate(expert_skills):
-                if has_skill > 0:
-                    self.graph.add_edge(self._v_expert(expert_id), self._v_skill(skill_id), capacity=has_skill)
+        for (skill_id, has_skill) in nonzero_items(expert_skills):
+            if has_skill > 0:
+                self.graph.add_edge(self._v_expert(expert_id), self._v_skill(skill_id), capacity=has_skill)
 
-    def _connect_skills_to_projects(self):
+    def _connect_skills_to_project(self, project_id, requirements):
         """
-        Connects skill nodes to the projects that require experts qualified in that particular skill.
+        Connects skill nodes to a project that requires experts qualified in that particular skill.
 
-        The capacity of the edges is equal to the number of experts needed in the projects.
-        If a project *p* doesn't need experts qualified in skill *u*, no edge is added.
+        The capacity of the edges is equal to the number of experts needed in the project.
+        If the project doesn't need experts qualified in skill *u*, no edge is added.
+
+        :param project_id: The ID number of the project.
+        :type project_id: int
+        :param requirements: The requirement vector of the project, dense or sparse.
+        :type requirements: list
         """
-        for (project_id, requirements) in enumerate(self.projects):
-            for (skill_id, need) in enumerate(requirements):
-                if need > 0:
-                    self.graph.add_edge(self._v_skill(skill_id), self._v_project(project_id), capacity=need)
+        for (skill_id, need) in nonzero_items(requirements):
+            if need > 0:
+                self.graph.add_edge(self._v_skill(skill_id), self._v_project(project_id), capacity=need)
 
-    def _connect_projects_to_sink(self):
+    def _connect_project_to_sink(self, project_id, requirements):
         """
-        Connects project nodes to the network sink with an edge of capacity equal to the sum of the project requirement
-        vector.
+        Connects a project node to the network sink with an edge of capacity equal to the sum of the project
+        requirement vector.
         This ensures that the capacity of that particular edge is not a bottleneck when calculating the maximum flow.
+
+        :param project_id: The ID number of the project.
+        :type project_id: int
+        :param requirements: The requirement vector of the project, dense or sparse.
+        :type requirements: list
         """
-        for (project_id, requirements) in enumerate(self.projects):
-            c = sum(requirements)
-            if c > 0:
-                self.graph.add_edge(self._v_project(project_id), self.t, capacity=c)
+        c = sum(need for _, need in nonzero_items(requirements))
+        self.demand += c
+        if c > 0:
+            self.graph.add_edge(self._v_project(project_id), self.t, capacity=c)
 
     @staticmethod
     def _v_expert(expert_id):
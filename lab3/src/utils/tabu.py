@@ -0,0 +1,84 @@
+from src.utils.scheduling import SchedulingSolver
+
+
+class TabuSolver(SchedulingSolver):
+    def __init__(self, scheduling_data, seed=None, verbose=True, seeding='random',
+                 max_iteration_count=1000, max_iterations_without_change=100,
+                 neighbourhood_size=20, tabu_tenure=7,
+                 time_budget=None, on_improvement=None, progress=None):
+        super().__init__(scheduling_data, seed=seed, verbose=verbose, seeding=seeding,
+                         time_budget=time_budget, on_improvement=on_improvement, progress=progress)
+        self.max_iteration_count = max_iteration_count
+        self.max_iterations_without_change = max_iterations_without_change
+        self.neighbourhood_size = neighbourhood_size  # number of random moves evaluated in every iteration
+        self.tabu_tenure = tabu_tenure  # number of iterations a project can't return to the start time it left
+
+    # samples moves (project, new start time) of the neighbourhood of given member
+    def _sample_moves(self, member):
+        moves = set()
+        for _ in range(self.neighbourhood_size):
+            i = self.random.choice(self.mutable_genes)
+            lo, hi = self.domains[i]
+            gene = self.random.randint(lo, hi - 1)
+            moves.add((i, gene + 1 if gene >= member[i] else gene))
+        return moves
+
+    # solving the problem using tabu search
+    def solve(self):
+        self._start_clock()
+        member, solution = self._evaluate_canonical(self._seed_members(1)[0])
+        best_member, best_solution = member, solution
+        self._report_improvement(best_member, best_solution)
+        last_change_in_best = 0
+        tabu = {}  # (project, start time) in the frame of the current member -> the last iteration it is forbidden
+
+        reason = 'Found optimal solution. Finishing algorithm.'
+        for iteration in range(1, self.max_iteration_count + 1):
+            if best_solution[0] == 0:
+                break
+            if not self.mutable_genes:
+                reason = 'No project can be moved. Finishing algorithm.'
+                break
+            if iteration - last_change_in_best > self.max_iterations_without_change:
+                reason = 'Best result has not changed for {} iterations. Finishing algorithm.'\
+                    .format(self.max_iterations_without_change)
+                break
+            if self._out_of_time():
+                reason = 'Time budget of {:g}s has run out. Finishing algorithm.'.format(self.time_budget)
+                break
+
+            # the best non-tabu move is made even if it is worsening; tabu moves are allowed only if they improve
+            # the best result found so far (aspiration)
+            chosen = None
+            for i, start in self._sample_moves(member):
+                neighbour = member[:i] + (start,) + member[i + 1:]
+                canonical, neighbour_solution = self._evaluate_canonical(neighbour, member, solution)
+                if neighbour_solution[0] < 0:
+                    continue
+                if tabu.get((i, start), 0) >= iteration and neighbour_solution[0] >= best_solution[0]:
+                    continue
+                if not chosen or neighbour_solution[0] < chosen[4][0]:
+                    chosen = (i, member[i], neighbour, canonical, neighbour_solution)
+            if not chosen:
+                continue
+
+            # the neighbour is replaced by its canonical form, shifted in time and with identical projects permuted,
+            # so the tabu moves are mapped into the frame of the new member to keep following the same projects
+            i, left_start, neighbour, member, solution = chosen
+            permutation, offset = self._canonical_mapping(neighbour)
+            tabu = {(permutation[j], start - offset): until for (j, start), until in tabu.items() if until > iteration}
+            tabu[(permutation[i], left_start - offset)] = iteration + self.tabu_tenure
+            if solution[0] < best_solution[0]:
+                best_member, best_solution = member, solution
+                last_change_in_best = iteration
+                self._report_improvement(best_member, best_solution)
+
+            if iteration % 10 == 0:
+                self.progress.status('Iteration #{iteration}: current shortage {shortage}, best shortage '
+                                     '{best_shortage}.',
+                                     iteration=iteration, shortage=solution[0], best_shortage=best_solution[0])
+        else:
+            reason = 'Reached iteration limit. Finishing algorithm.'
+
+        self.progress.event(reason)
+        return best_member, best_solution
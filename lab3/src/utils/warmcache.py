@@ -0,0 +1,114 @@
+import hashlib
+from collections import OrderedDict
+
+from src.classes.data import nonzero_items
+from src.utils.checkpoint import instance_digest
+from src.utils.solver import Solver
+
+# Warm cache shared by all solvers in this process, set only while it is started, e.g. in the workers of the server.
+_warm_cache = None
+
+
+class WarmCache:
+    """
+    Keeps state which outlives a single search, for processes solving many instances one after another.
+
+    Two kinds of state are kept, both bounded by evicting the least recently used entries:
+
+        - the expert layers of the max-flow networks, shared by all instances with the same counts and experts,
+        - the interval caches of :class:`src.utils.scheduling.SchedulingSolver`, shared by all searches on the same
+          instance, so that a repeated instance is solved mostly without max-flow computations.
+    """
+
+    def __init__(self, max_layer_count=16, max_instance_count=16):
+        """
+        Constructor.
+
+        :param max_layer_count: The maximum number of kept expert layers.
+        :type max_layer_count: int
+        :param max_instance_count: The maximum number of instances whose interval caches are kept.
+        :type max_instance_count: int
+        """
+        self.max_layer_count = max_layer_count
+        self.max_instance_count = max_instance_count
+        self.expert_layers = OrderedDict()  # digest of the counts and experts -> expert layer
+        self.interval_caches = OrderedDict()  # digest of the instance -> interval cache
+        self.layer_hits = 0
+        self.instance_hits = 0
+
+    def start(self):
+        """Makes the solvers of this process use the cache."""
+        global _warm_cache
+        _warm_cache = self
+
+    def stop(self):
+        """Makes the solvers of this process build their state from scratch again."""
+        global _warm_cache
+        _warm_cache = None
+
+    @staticmethod
+    def _lookup(entries, key):
+        """
+        Finds an entry and marks it as the most recently used one.
+
+        :return: The entry, None if there is none.
+        """
+        entry = entries.get(key)
+        if entry is not None:
+            entries.move_to_end(key)
+        return entry
+
+    @staticmethod
+    def _insert(entries, key, entry, max_count):
+        """Inserts an entry, evicting the least recently used ones over *max_count*."""
+        entries[key] = entry
+        while len(entries) > max_count:
+            entries.popitem(last=False)
+
+    def expert_layer(self, counts, experts):
+        """
+        Gives the expert layer for the counts and experts, building it only if it isn't cached.
+
+        :param counts: A list of skill, expert and project counts.
+        :type counts: list
+        :param experts: The skill vectors of all experts.
+        :return: The expert layer, see :meth:`Solver.build_expert_layer`.
+        :rtype: src.classes.graph.Graph
+        """
+        experts_key = [tuple(nonzero_items(expert)) for expert in experts]
+        key = hashlib.sha256(repr((list(counts), experts_key)).encode()).hexdigest()
+        layer = self._lookup(self.expert_layers, key)
+        if layer is None:
+            layer = Solver.build_expert_layer(counts, experts)
+            self._insert(self.expert_layers, key, layer, self.max_layer_count)
+        else:
+            self.layer_hits += 1
+        return layer
+
+    def interval_cache(self, scheduling_data):
+        """
+        Gives the interval cache of an instance, an empty one if the instance hasn't been solved yet.
+
+        :param scheduling_data: The problem instance.
+        :type scheduling_data: src.classes.data.SchedulingData
+        :return: The interval cache.
+        :rtype: OrderedDict
+        """
+        key = instance_digest(scheduling_data)
+        cache = self._lookup(self.interval_caches, key)
+        if cache is None:
+            cache = OrderedDict()
+            self._insert(self.interval_caches, key, cache, self.max_instance_count)
+        else:
+            self.instance_hits += 1
+        return cache
+
+
+def current_warm_cache():
+    """
+    Gives the warm cache of this process.
+
+    :return: The started :class:`WarmCache`, None if there is none.
+    :rtype: WarmCache
+    """
+    return _warm_cache
@@ -0,0 +1,98 @@
+import io
+import os
+import random
+import shutil
+import tempfile
+import unittest
+
+from src.classes.data import SchedulingData
+from src.utils.binary import is_binary_instance, load_binary, write_binary
+from src.utils.parser import Parser, ParseError
+
+
+class BinaryFormatTest(unittest.TestCase):
+    """Tests for the binary instance format of :mod:`src.utils.binary`."""
+
+    def setUp(self):
+        """
+        Setup method for the tests.
+
+        Creates a temporary directory for the binary files written by the tests.
+        """
+        self.test_directory = tempfile.mkdtemp()
+
+    def _round_trip(self, data, name):
+        """
+        Writes an instance in the binary format and loads it back.
+
+        :param data: The problem instance.
+        :type data: SchedulingData
+        :param name: The name of the binary file.
+        :type name: str
+        :return: The loaded instance.
+        :rtype: SchedulingData
+        """
+        path = os.path.join(self.test_directory, name)
+        with open(path, 'wb') as file:
+            write_binary(data, file)
+        with open(path, 'rb') as file:
+            self.assertTrue(is_binary_instance(file))
+        return load_binary(path)
+
+    def assertSameInstance(self, expected, actual):
+        """
+        Asserts that two instances have the same counts, experts and projects.
+
+        :param expected: The original instance.
+        :type expected: SchedulingData
+        :param actual: The loaded instance.
+        :type actual: SchedulingData
+        """
+        self.assertEqual((actual.skill_count, actual.expert_count, actual.project_count, actual.overall_time_units),
+                         (expected.skill_count, expected.expert_count, expected.project_count,
+                          expected.overall_time_units))
+        self.assertEqual([list(expert) for expert in actual.experts], [list(expert) for expert in expected.experts])
+        self.assertEqual([(list(requirements), p_length) for requirements, p_length in actual.projects],
+                         [(list(requirements), p_length) for requirements, p_length in expected.projects])
+
+    def test_round_trip_of_random_instances(self):
+        # given
+        rng = random.Random(2)
+        for n in range(50):
+            skill_count, expert_count, project_count = rng.randint(1, 20), rng.randint(0, 6), rng.randint(0, 6)
+            data = SchedulingData([skill_count, expert_count, project_count, rng.randint(1, 10)])
+            for _ in range(expert_count):
+                data.add_expert([rng.randint(0, 1) for _ in range(skill_count)])
+            for _ in range(project_count):
+                data.add_project(([rng.choice([0, 1, 7, 2 ** 32 - 1]) for _ in range(skill_count)],
+                                  rng.randint(1, data.overall_time_units)))
+            # when
+            loaded = self._round_trip(data, 'random{}.bin'.format(n))
+            # then
+            self.assertSameInstance(data, loaded)
+
+    def test_round_trip_of_parsed_file(self):
+        # given
+        data = Parser().parse(io.StringIO('9,2,1,4\n1,0,0,0,0,0,0,0,1\n0,1,1,1,1,1,1,1,0\n1,2,3,4,5,6,7,8,9,4\n'))
+        # when
+        loaded = self._round_trip(data, 'parsed.bin')
+        # then
+        self.assertSameInstance(data, loaded)
+        self.assertEqual(loaded.experts[0][8], 1)
+        self.assertEqual(loaded.projects[0][0][8], 9)
+
+    def test_load_truncated_file(self):
+        # given
+        data = SchedulingData([3, 1, 1, 2])
+        data.add_expert([1, 0, 1])
+        data.add_project(([1, 1, 1], 2))
+        path = os.path.join(self.test_directory, 'truncated.bin')
+        with open(path, 'wb') as file:
+            write_binary(data, file)
+        with open(path, 'r+b') as file:
+            file.truncate(os.path.getsize(path) - 1)
+        # expect
+        self.assertRaisesRegex(ParseError, r'bytes, \d+ expected', load_binary, path)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_directory)
@@ -0,0 +1,49 @@
+import random
+import unittest
+from collections import OrderedDict
+
+from instances import random_instance
+from src.utils.bounds import ShortageBounds
+from src.utils.genetic import GeneticSolver
+from src.utils.selection import truncation_selection
+
+
+class ShortageBoundsTest(unittest.TestCase):
+    """Tests for the :class:`ShortageBounds` class and the pruning of :class:`GeneticSolver` based on it."""
+
+    def test_bound_never_exceeds_shortage(self):
+        # given
+        rng = random.Random(0)
+        for _ in range(40):
+            data = random_instance(rng, rng.randint(1, 5), rng.randint(1, 5), rng.randint(1, 6), rng.randint(1, 8))
+            solver = GeneticSolver(data, seed=0, verbose=False)
+            bounds = ShortageBounds(data)
+            for _ in range(10):
+                member = tuple(rng.randint(lo, hi) for lo, hi in solver.domains)
+                # when
+                bound = bounds.schedule_bound(solver._find_intervals(member))
+                # then
+                self.assertLessEqual(bound, solver._solve_scheduling(member)[0])
+
+    def test_pruning_keeps_members_below_best(self):
+        # given
+        rng = random.Random(1)
+        for _ in range(30):
+            data = random_instance(rng, rng.randint(1, 5), rng.randint(1, 5), rng.randint(2, 6), rng.randint(2, 8))
+            solver = GeneticSolver(data, seed=0, verbose=False, selection=truncation_selection, bound_pruning=True,
+                                   max_population_count=3)
+            reference = GeneticSolver(data, seed=0, verbose=False)
+            members = set(solver._canonicalize(tuple(rng.randint(lo, hi) for lo, hi in solver.domains))
+                          for _ in range(12))
+            solver.population = OrderedDict((member, None) for member in members)
+            shortages = {member: reference._solve_scheduling(member)[0] for member in members}
+            # when
+            solver._evaluate_with_bounds()
+            # then
+            kept = sorted(shortages[member] for member in solver.population)
+            best = sorted(shortages.values())[:solver.max_population_count]
+            self.assertEqual(kept[:solver.max_population_count], best)
+            for member in members - set(solver.population):
+                # a pruned member's bound shows it is worse than every one of the best members kept
+                bound = solver.bounds.schedule_bound(solver._find_intervals(member))
+                self.assertGreater(bound, best[-1])
@@ -0,0 +1,80 @@
+import itertools
+import random
+import unittest
+
+from instances import random_instance
+from src.utils.branch_and_bound import BranchAndBoundSolver
+from src.utils.scheduling import SchedulingSolver
+
+
+class _EarliestStartSolver(BranchAndBoundSolver):
+    """Branch and bound starting from the earliest start of all projects, the search itself must find the optimum."""
+
+    def _seed_members(self, count):
+        return [tuple(lo for lo, _ in self.domains)]
+
+
+class BranchAndBoundSolverTest(unittest.TestCase):
+    """Tests for the :class:`BranchAndBoundSolver` class."""
+
+    @staticmethod
+    def _random_instance(rng):
+        """
+        Builds a random problem instance small enough to be solved by brute force, some of its projects identical.
+
+        :param rng: The random number generator to use.
+        :type rng: random.Random
+        :return: The problem instance.
+        :rtype: SchedulingData
+        """
+        return random_instance(rng, rng.randint(1, 3), rng.randint(1, 4), rng.randint(1, 5), rng.randint(1, 6),
+                               needs=range(3), identical_chance=0.3)
+
+    @staticmethod
+    def _brute_force(data):
+        """
+        Finds the optimal shortage by evaluating every schedule.
+
+        :param data: The problem instance.
+        :type data: SchedulingData
+        :return: The lowest total shortage of all schedules.
+        :rtype: int
+        """
+        solver = SchedulingSolver(data, verbose=False)
+        return min(solver._solve_scheduling(member)[0]
+                   for member in itertools.product(*(range(lo, hi + 1) for lo, hi in solver.domains)))
+
+    def test_optimum_matches_brute_force(self):
+        # given
+        rng = random.Random(0)
+        for _ in range(60):
+            data = self._random_instance(rng)
+            # when
+            member, solution = BranchAndBoundSolver(data, seed=0, verbose=False).solve()
+            # then
+            self.assertEqual(solution[0], self._brute_force(data))
+            self.assertEqual(SchedulingSolver(data, verbose=False)._solve_scheduling(member)[0], solution[0])
+
+    def test_search_finds_optimum_without_heuristic_schedules(self):
+        # given
+        rng = random.Random(2)
+        for _ in range(60):
+            data = self._random_instance(rng)
+            # when
+            member, solution = _EarliestStartSolver(data, seed=0, verbose=False).solve()
+            # then
+            self.assertEqual(solution[0], self._brute_force(data))
+            self.assertEqual(SchedulingSolver(data, verbose=False)._solve_scheduling(member)[0], solution[0])
+
+    def test_node_limit_gives_valid_schedule(self):
+        # given
+        rng = random.Random(1)
+        for _ in range(20):
+            data = self._random_instance(rng)
+            solver = BranchAndBoundSolver(data, seed=0, verbose=False, max_node_count=2)
+            # when
+            member, solution = solver.solve()
+            # then
+            self.assertLessEqual(solver.node_count, 2)
+            self.assertGreaterEqual(solution[0], self._brute_force(data))
+            self.assertEqual(SchedulingSolver(data, verbose=False)._solve_scheduling(member)[0], solution[0])
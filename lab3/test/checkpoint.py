@@ -0,0 +1,93 @@
+import os
+import random
+import shutil
+import tempfile
+import unittest
+
+from instances import random_instance
+from src.classes.data import SparseVector, nonzero_items
+from src.utils.checkpoint import CheckpointError, instance_digest, load_checkpoint, save_checkpoint
+from src.utils.genetic import GeneticSolver
+
+
+class CheckpointTest(unittest.TestCase):
+    """Tests for saving and resuming the search of :class:`GeneticSolver` with :mod:`src.utils.checkpoint`."""
+
+    def setUp(self):
+        """
+        Setup method for the tests.
+
+        Creates a temporary directory for the checkpoint files and a problem instance which is not solved with zero
+        shortage in a few generations.
+        """
+        self.test_directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.test_directory, 'search.ckpt')
+        self.data = random_instance(random.Random(0), 5, 4, 8, 8, needs=(0, 1, 2))
+
+    def _solver(self, data, state=None):
+        """
+        Creates a genetic solver with fixed settings.
+
+        :param data: The problem instance.
+        :type data: SchedulingData
+        :param state: The state to resume the search from, if any.
+        :type state: dict
+        :return: The solver.
+        :rtype: GeneticSolver
+        """
+        return GeneticSolver(data, seed=3, verbose=False, state=state, seeding='mixed', max_population_count=6,
+                             max_generation_count=30, checkpoint_path=self.path, checkpoint_interval=7)
+
+    def test_resumed_search_equals_uninterrupted_one(self):
+        # given
+        uninterrupted = self._solver(self.data)
+        expected = uninterrupted.solve()
+        interrupted = self._solver(self.data)
+        interrupted.run(7)
+        interrupted.save_checkpoint()
+        # when
+        resumed = self._solver(self.data, load_checkpoint(self.path, self.data))
+        result = resumed.solve()
+        # then
+        self.assertGreater(expected[1][0], 0)
+        self.assertEqual(result, expected)
+        self.assertEqual(resumed.generation_counter, uninterrupted.generation_counter)
+        self.assertEqual(list(resumed.population.items()), list(uninterrupted.population.items()))
+        self.assertEqual(resumed.cache_hits, uninterrupted.cache_hits)
+
+    def test_reject_checkpoint_of_different_instance(self):
+        # given
+        solver = self._solver(self.data)
+        solver.run(2)
+        solver.save_checkpoint()
+        other_data = random_instance(random.Random(1), 5, 4, 8, 8, needs=(0, 1, 2))
+        # expect
+        self.assertRaisesRegex(CheckpointError, 'different problem instance', load_checkpoint, self.path, other_data)
+
+    def test_reject_invalid_checkpoints(self):
+        # given
+        with open(self.path, 'wb') as file:
+            file.write(b'not a checkpoint')
+        # expect
+        self.assertRaisesRegex(CheckpointError, 'Can\'t read checkpoint', load_checkpoint, self.path, self.data)
+        # given
+        save_checkpoint(self.path, self.data, {})
+        with open(self.path, 'rb') as file:
+            contents = file.read()
+        with open(self.path, 'wb') as file:
+            file.write(contents[:len(contents) // 2])
+        # expect
+        self.assertRaisesRegex(CheckpointError, 'Can\'t read checkpoint', load_checkpoint, self.path, self.data)
+
+    def test_dense_and_sparse_instances_share_digest(self):
+        # given
+        sparse_data = random_instance(random.Random(0), 5, 4, 8, 8, needs=(0, 1, 2))
+        sparse_data.experts = [SparseVector(len(expert), list(nonzero_items(expert)))
+                               for expert in sparse_data.experts]
+        sparse_data.projects = [(SparseVector(len(requirements), list(nonzero_items(requirements))), p_length)
+                                for requirements, p_length in sparse_data.projects]
+        # expect
+        self.assertEqual(instance_digest(sparse_data), instance_digest(self.data))
+
+    def tearDown(self):
+        shutil.rmtree(self.test_directory)
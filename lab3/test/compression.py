@@ -0,0 +1,112 @@
+import gzip
+import lzma
+import os
+import shutil
+import tempfile
+import unittest
+
+from src.utils.compression import DECOMPRESSION_ERRORS, open_input
+from src.utils.parser import Parser, ParseError
+
+# A valid instance in the dense text format.
+_CONTENTS = '3,2,2,4\n1,0,1\n0,1,1\n2,0,10,3\n0,1,0,1\n' * 20
+
+
+class CompressionTest(unittest.TestCase):
+    """Tests for reading compressed input files with :func:`src.utils.compression.open_input`."""
+
+    def setUp(self):
+        """
+        Setup method for the tests.
+
+        Creates a temporary directory for the compressed files written by the tests.
+        """
+        self.test_directory = tempfile.mkdtemp()
+
+    def _write(self, name, data):
+        """
+        Writes a file into the temporary directory.
+
+        :param name: The name of the file.
+        :type name: str
+        :param data: The contents of the file.
+        :type data: bytes
+        :return: The path of the file.
+        :rtype: str
+        """
+        path = os.path.join(self.test_directory, name)
+        with open(path, 'wb') as file:
+            file.write(data)
+        return path
+
+    @staticmethod
+    def _parse(path):
+        """
+        Parses a (compressed) input file.
+
+        :param path: The path of the file.
+        :type path: str
+        :return: The parsed instance.
+        :rtype: src.classes.data.SchedulingData
+        """
+        with open_input(path) as file:
+            return Parser().parse_bulk(file)
+
+    def assertInvalid(self, path):
+        """
+        Asserts that reading a file throws one of the errors the program reports for invalid input.
+
+        :param path: The path of the file.
+        :type path: str
+        """
+        self.assertRaises((OSError,) + DECOMPRESSION_ERRORS, self._parse, path)
+
+    def test_read_compressed_files(self):
+        # given
+        gzip_path = self._write('instance.gz', gzip.compress(_CONTENTS.encode()))
+        xz_path = self._write('instance.xz', lzma.compress(_CONTENTS.encode()))
+        # when
+        gzip_data = self._parse(gzip_path)
+        xz_data = self._parse(xz_path)
+        # then
+        self.assertEqual(gzip_data.projects, [([2, 0, 10], 3), ([0, 1, 0], 1)])
+        self.assertEqual(xz_data.projects, gzip_data.projects)
+
+    def test_truncated_files(self):
+        # given
+        gzip_data = gzip.compress(_CONTENTS.encode())
+        xz_data = lzma.compress(_CONTENTS.encode())
+        # expect
+        self.assertRaises(EOFError, self._parse, self._write('instance.gz', gzip_data[:len(gzip_data) // 2]))
+        self.assertRaises(EOFError, self._parse, self._write('instance.xz', xz_data[:len(xz_data) // 2]))
+        self.assertInvalid(self._write('header.gz', gzip_data[:5]))
+        self.assertInvalid(self._write('header.xz', xz_data[:5]))
+
+    def test_corrupted_files(self):
+        # given
+        gzip_data = bytearray(gzip.compress(_CONTENTS.encode(), mtime=0))
+        gzip_data[10] |= 0b110  # reserved type of the first deflate block
+        xz_data = bytearray(lzma.compress(_CONTENTS.encode()))
+        middle = len(xz_data) // 2
+        xz_data[middle:middle + 8] = bytes(byte ^ 0xff for byte in xz_data[middle:middle + 8])
+        # expect
+        self.assertRaises(DECOMPRESSION_ERRORS, self._parse, self._write('instance.gz', bytes(gzip_data)))
+        self.assertRaises(DECOMPRESSION_ERRORS, self._parse, self._write('instance.xz', bytes(xz_data)))
+
+    def test_corruptions_throw_only_reported_errors(self):
+        # given
+        gzip_data = gzip.compress(_CONTENTS.encode(), mtime=0)
+        xz_data = lzma.compress(_CONTENTS.encode())
+        for data, name in ((gzip_data, 'instance.gz'), (xz_data, 'instance.xz')):
+            for position in range(0, len(data), 3):
+                corrupted = bytearray(data)
+                corrupted[position] ^= 0x55
+                path = self._write(name, bytes(corrupted))
+                # expect
+                try:
+                    self._parse(path)
+                except (OSError, ParseError) + DECOMPRESSION_ERRORS:
+                    pass  # the errors the program reports, any other one fails the test
+
+    def tearDown(self):
+        shutil.rmtree(self.test_directory)
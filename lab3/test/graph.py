@@ -0,0 +1,80 @@
+import random
+import unittest
+
+from src.classes.graph import Graph, set_backend
+
+try:
+    import networkx
+except ImportError:
+    networkx = None
+
+
+@unittest.skipIf(networkx is None, 'networkx is not installed')
+class GraphTest(unittest.TestCase):
+    """Tests for the :class:`Graph` class, comparing the dict backend with the networkx one."""
+
+    @staticmethod
+    def _random_edges(rng, node_count):
+        """
+        Draws the edges of a random network.
+
+        :param rng: The random number generator to use.
+        :type rng: random.Random
+        :param node_count: The number of nodes, the source being 0 and the sink the last one.
+        :type node_count: int
+        :return: A list of (v_from, v_to, capacity) edges, without duplicates, loops and antiparallel pairs.
+        :rtype: list
+        """
+        edges = {}
+        for _ in range(rng.randint(0, node_count * 3)):
+            v_from, v_to = rng.sample(range(node_count), 2)
+            if (v_to, v_from) not in edges:
+                edges[v_from, v_to] = rng.randint(0, 5)
+        return [(v_from, v_to, capacity) for (v_from, v_to), capacity in edges.items()]
+
+    @staticmethod
+    def _maximum_flow(backend, node_count, edges):
+        """
+        Builds a network with the given backend and solves its maximum flow.
+
+        :param backend: The name of the backend, see :func:`set_backend`.
+        :type backend: str
+        :param node_count: The number of nodes, the source being 0 and the sink the last one.
+        :type node_count: int
+        :param edges: A list of (v_from, v_to, capacity) edges.
+        :type edges: list
+        :return: The value of the maximum flow and the :class:`Flow` object.
+        :rtype: tuple
+        """
+        set_backend(backend)
+        graph = Graph()
+        graph.add_nodes(range(node_count))
+        for v_from, v_to, capacity in edges:
+            graph.add_edge(v_from, v_to, capacity)
+        return graph.maximum_flow(0, node_count - 1)
+
+    def test_maximum_flow_matches_networkx(self):
+        # given
+        rng = random.Random(0)
+        for _ in range(200):
+            node_count = rng.randint(2, 12)
+            edges = self._random_edges(rng, node_count)
+            reference = networkx.DiGraph()
+            reference.add_nodes_from(range(node_count))
+            reference.add_weighted_edges_from(edges, weight='capacity')
+            # when
+            value, flow = self._maximum_flow('dict', node_count, edges)
+            networkx_value, _ = self._maximum_flow('networkx', node_count, edges)
+            # then
+            self.assertEqual(value, networkx.maximum_flow_value(reference, 0, node_count - 1))
+            self.assertEqual(networkx_value, value)
+            balance = [0] * node_count
+            for v_from, v_to, capacity in edges:
+                self.assertTrue(0 <= flow.get_flow_value(v_from, v_to) <= capacity)
+                balance[v_from] -= flow.get_flow_value(v_from, v_to)
+                balance[v_to] += flow.get_flow_value(v_from, v_to)
+            self.assertEqual(balance[1:-1], [0] * (node_count - 2))
+            self.assertEqual(balance[-1], value)
+
+    def tearDown(self):
+        set_backend('dict')
@@ -0,0 +1,49 @@
+from src.classes.data import SchedulingData
+
+
+def random_instance(rng, skill_count, expert_count, project_count, time_units, needs=(0, 0, 1, 2),
+                    identical_chance=0.0):
+    """
+    Builds a random problem instance for the tests.
+
+    :param rng: The random number generator to use.
+    :type rng: random.Random
+    :param skill_count: The number of skills.
+    :type skill_count: int
+    :param expert_count: The number of experts.
+    :type expert_count: int
+    :param project_count: The number of projects.
+    :type project_count: int
+    :param time_units: The number of overall time units.
+    :type time_units: int
+    :param needs: The values project requirements are drawn from.
+    :type needs: collections.abc.Sequence
+    :param identical_chance: The chance of a project being a copy of an earlier one.
+    :type identical_chance: float
+    :return: The problem instance.
+    :rtype: SchedulingData
+    """
+    data = SchedulingData([skill_count, expert_count, project_count, time_units])
+    for _ in range(expert_count):
+        data.add_expert([rng.randint(0, 1) for _ in range(skill_count)])
+    for _ in range(project_count):
+        if data.projects and identical_chance and rng.random() < identical_chance:
+            data.add_project(rng.choice(data.projects))
+        else:
+            data.add_project(([rng.choice(needs) for _ in range(skill_count)], rng.randint(1, time_units)))
+    return data
+
+
+def instance_text(data):
+    """
+    Formats a problem instance as the contents of an input file in the dense text format.
+
+    :param data: The problem instance.
+    :type data: SchedulingData
+    :return: The contents of the input file.
+    :rtype: str
+    """
+    lines = ['{},{},{},{}'.format(data.skill_count, data.expert_count, data.project_count, data.overall_time_units)]
+    lines.extend(','.join(str(x) for x in expert) for expert in data.experts)
+    lines.extend(','.join(str(x) for x in list(requirements) + [p_length]) for requirements, p_length in data.projects)
+    return '\n'.join(lines) + '\n'
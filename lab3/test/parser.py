@@ -0,0 +1,190 @@
+import io
+import random
+import unittest
+
+from instances import instance_text, random_instance
+from src.utils.parser import Parser, ParseError
+
+
+class ParserTest(unittest.TestCase):
+    """Tests for the :class:`Parser` class, comparing the bulk parser with the line by line one."""
+
+    @staticmethod
+    def _parse(method, contents):
+        """
+        Parses the contents of an input file with a parser method.
+
+        :param method: The name of the method of :class:`Parser`, 'parse' or 'parse_bulk'.
+        :type method: str
+        :param contents: The contents of the input file.
+        :type contents: str
+        :return: A tuple containing the counts, experts and projects of the parsed instance and the last line
+                 number, or the message of the :class:`ParseError` thrown.
+        :rtype: tuple or str
+        """
+        parser = Parser()
+        try:
+            data = getattr(parser, method)(io.StringIO(contents))
+        except ParseError as e:
+            return str(e)
+        counts = (data.skill_count, data.expert_count, data.project_count, data.overall_time_units)
+        projects = [(list(requirements), p_length) for requirements, p_length in data.projects]
+        return counts, [list(expert) for expert in data.experts], projects, parser.line_no
+
+    def assertSameResult(self, contents):
+        """
+        Asserts that both parsers give the same instance, or throw a :class:`ParseError` with the same message.
+
+        :param contents: The contents of the input file.
+        :type contents: str
+        """
+        self.assertEqual(self._parse('parse', contents), self._parse('parse_bulk', contents), repr(contents))
+
+    def test_bulk_matches_lines_on_random_instances(self):
+        # given
+        rng = random.Random(0)
+        for _ in range(200):
+            data = random_instance(rng, rng.randint(1, 12), rng.randint(0, 8), rng.randint(0, 8), rng.randint(1, 20),
+                                   needs=range(rng.choice([1, 9, 1000]) + 1))
+            contents = instance_text(data)
+            # expect
+            self.assertSameResult(contents)
+
+    def test_bulk_matches_lines_on_corrupted_instances(self):
+        # given
+        rng = random.Random(1)
+        replacements = ['', ' ', '-1', '2', 'x', ',', '\n', '10', '0']
+        for _ in range(300):
+            contents = instance_text(random_instance(rng, rng.randint(1, 6), rng.randint(1, 4), rng.randint(1, 4),
+                                                     rng.randint(1, 5), needs=range(4)))
+            position = rng.randrange(len(contents))
+            contents = contents[:position] + rng.choice(replacements) + contents[position + 1:]
+            # expect
+            self.assertSameResult(contents)
+
+    def test_bulk_matches_lines_on_edge_cases(self):
+        # given
+        cases = [
+            '',
+            '\n',
+            '2,0,0,5\n',
+            '2,0,0,5',
+            '2,1,0,5\n1,0',
+            '2,0,1,5\n0,0,1',
+            '2,1,1,5\n1,0\n0,0,1\n',
+            '2,1,1,5\n1,0\n0,0,1\ntrailing data\n',
+            '2,1,1,5\n 1 , 0 \n 3 ,4, 5\n',
+            '2,1,1,5\n1,0\n',
+            '2,1,1,5\n1,0\n\n',
+            '2,2,1,5\n1,0\n\n1,1,1\n',
+            '2,1,1,5\n1,,0\n1,1,1\n',
+            '2,1,1,5\n1,0,1\n1,1,1\n',
+            '2,1,1,5\n1,2\n1,1,1\n',
+            '2,1,1,5\n1,0\n1,-1,1\n',
+            '2,1,1,5\n1,0\n1,1,0\n',
+            '2,1,1,5\n1,0\n1,1,6\n',
+            '2,1,1,5\n1,0\n1,1,1.5\n',
+            '0,1,1,5\n1,0\n1,1,1\n',
+            '2,-1,1,0\n',
+            '2,1,1,5\r\n1,0\r\n1,1,1\r\n',
+            '12,1,1,5\n1,0,1,0,1,0,1,0,1,0,1,0\n10,0,0,0,0,0,0,0,0,0,0,11,5\n',
+        ]
+        for contents in cases:
+            # expect
+            self.assertSameResult(contents)
+
+    def test_bulk_parses_correct_file(self):
+        # when
+        data = Parser().parse_bulk(io.StringIO('3,2,2,4\n1,0,1\n0,1,1\n2,0,10,3\n0,1,0,1\n'))
+        # then
+        self.assertEqual((data.skill_count, data.expert_count, data.project_count, data.overall_time_units),
+                         (3, 2, 2, 4))
+        self.assertEqual(data.experts, [[1, 0, 1], [0, 1, 1]])
+        self.assertEqual(data.projects, [([2, 0, 10], 3), ([0, 1, 0], 1)])
+
+    def test_bulk_reports_the_line_of_an_error(self):
+        # expect
+        self.assertRaisesRegex(ParseError, r'Line 4: Project requirement vector must be non-negative',
+                               Parser().parse_bulk, io.StringIO('2,2,2,3\n1,0\n0,1\n1,-1,2\n1,1,1\n'))
+
+
+class SparseParserTest(unittest.TestCase):
+    """Tests for the sparse format read by :meth:`Parser.parse_sparse`."""
+
+    @staticmethod
+    def _sparse_text(data):
+        """
+        Formats a problem instance as the contents of an input file in the sparse format.
+
+        :param data: The problem instance.
+        :type data: SchedulingData
+        :return: The contents of the input file.
+        :rtype: str
+        """
+        lines = ['{},{},{},{}'.format(data.skill_count, data.expert_count, data.project_count, data.overall_time_units)]
+        lines.extend(','.join(str(s) for s, has_skill in enumerate(expert) if has_skill) for expert in data.experts)
+        for requirements, p_length in data.projects:
+            pairs = ['{}:{}'.format(s, need) for s, need in enumerate(requirements) if need]
+            lines.append(','.join([str(p_length)] + pairs))
+        return '\n'.join(lines) + '\n'
+
+    @staticmethod
+    def _instance(data):
+        """
+        Converts a parsed instance into plain lists, so that dense and sparse vectors can be compared.
+
+        :param data: The problem instance.
+        :type data: SchedulingData
+        :return: A tuple containing the counts, experts and projects of the instance.
+        :rtype: tuple
+        """
+        counts = (data.skill_count, data.expert_count, data.project_count, data.overall_time_units)
+        projects = [(list(requirements), p_length) for requirements, p_length in data.projects]
+        return counts, [list(expert) for expert in data.experts], projects
+
+    def test_sparse_matches_dense_on_random_instances(self):
+        # given
+        rng = random.Random(0)
+        for _ in range(200):
+            data = random_instance(rng, rng.randint(1, 12), rng.randint(0, 8), rng.randint(0, 8), rng.randint(1, 20),
+                                   needs=range(rng.choice([1, 9, 1000]) + 1))
+            # when
+            dense = Parser().parse(io.StringIO(instance_text(data)))
+            sparse = Parser().parse_sparse(io.StringIO(self._sparse_text(data)))
+            # then
+            self.assertEqual(self._instance(sparse), self._instance(dense))
+
+    def test_parse_correct_file(self):
+        # when
+        data = Parser().parse_sparse(io.StringIO('4,2,2,4\n0,2\n\n3,0:2,2:10\n1, 1:1 ,3:0\n'))
+        # then
+        self.assertEqual(self._instance(data), ((4, 2, 2, 4), [[1, 0, 1, 0], [0, 0, 0, 0]],
+                                                [([2, 0, 10, 0], 3), ([0, 1, 0, 0], 1)]))
+        self.assertEqual(data.projects[1][0].items, [(1, 1)])
+
+    def test_malformed_files(self):
+        # given
+        cases = [
+            ('', r'Line 1: Unexpected empty line or end-of-file hit'),
+            ('3,1,1,4\n', r'Line 2: Unexpected empty line or end-of-file hit'),
+            ('3,1,1,4\n0\n', r'Line 3: Unexpected empty line or end-of-file hit'),
+            ('3,1,1,4\n0\n\n', r'Line 3: Unexpected empty line or end-of-file hit'),
+            ('3,1,1,4\n0,,1\n1,0:1\n', r'Line 2: At least one argument is missing a value'),
+            ('3,1,1,4\nx\n1,0:1\n', r'Line 2: Non-base 10 integral value found'),
+            ('3,1,1,4\n3\n1,0:1\n', r'Line 2: Skill index 3 out of range, it must be between 0 and 2'),
+            ('3,1,1,4\n-1\n1,0:1\n', r'Line 2: Skill index -1 out of range'),
+            ('3,1,1,4\n1,1\n1,0:1\n', r'Line 2: Skill index 1 listed more than once'),
+            ('3,1,1,4\n0\nx,0:1\n', r'Line 3: Non-base 10 integral value found'),
+            ('3,1,1,4\n0\n1,0\n', r'Line 3: Requirements must be given as skill:need pairs'),
+            ('3,1,1,4\n0\n1,0:x\n', r'Line 3: Non-base 10 integral value found'),
+            ('3,1,1,4\n0\n1,0:1,0:2\n', r'Line 3: Skill index 0 listed more than once'),
+            ('3,1,1,4\n0\n1,5:1\n', r'Line 3: Skill index 5 out of range'),
+            ('3,1,1,4\n0\n1,0:-1\n', r'Line 3: Project requirement vector must be non-negative'),
+            ('3,1,1,4\n0\n0,0:1\n', r'Line 3: The number of project time units must be positive'),
+            ('3,1,1,4\n0\n5,0:1\n', r'Line 3: The number of project time units must not be greater than the total'),
+            ('0,1,1,4\n\n1\n', r'The number of skills must be positive'),
+        ]
+        for contents, message in cases:
+            # expect
+            with self.assertRaisesRegex(ParseError, message, msg=repr(contents)):
+                Parser().parse_sparse(io.StringIO(contents))
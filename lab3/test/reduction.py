@@ -0,0 +1,97 @@
+import itertools
+import random
+import unittest
+
+from src.classes.data import SchedulingData
+from src.utils.reduction import ProblemReduction
+from src.utils.scheduling import SchedulingSolver
+
+
+class ProblemReductionTest(unittest.TestCase):
+    """Tests for the :class:`ProblemReduction` class."""
+
+    @staticmethod
+    def _setup_input(time_units, experts, projects):
+        """
+        Method used to setup a problem instance.
+
+        :param time_units: The number of overall time units.
+        :type time_units: int
+        :param experts: A list of expert skill vectors.
+        :type experts: list
+        :param projects: A list of (requirement vector, time units) tuples of projects.
+        :type projects: list
+        :return: The problem instance.
+        :rtype: SchedulingData
+        """
+        data = SchedulingData([len(projects[0][0]), len(experts), len(projects), time_units])
+        data.experts = experts
+        data.projects = projects
+        return data
+
+    @staticmethod
+    def _schedules(data):
+        """
+        Lists all valid schedules of a problem instance.
+
+        :param data: The problem instance.
+        :type data: SchedulingData
+        :return: An iterable of the start times of all projects.
+        """
+        return itertools.product(*(range(data.overall_time_units - p_length + 1) for _, p_length in data.projects))
+
+    def test_reduce_small_instance(self):
+        # given
+        experts = [[1, 0, 0], [1, 0, 0], [0, 1, 1], [0, 1, 0]]
+        projects = [([1, 0, 0], 2), ([0, 1, 1], 1), ([1, 0, 0], 3), ([0, 0, 0], 1), ([0, 0, 1], 2)]
+        data = self._setup_input(4, experts, projects)
+        # when
+        reduction = ProblemReduction(data)
+        # then
+        # skill 0 has 2 dedicated experts for a demand of 2, skills 1 and 2 share the third expert
+        self.assertEqual(reduction.fixed_projects, {0: 0, 2: 0, 3: 0})
+        self.assertEqual(reduction.free_projects, [1, 4])
+        reduced_data = reduction.reduced_data
+        self.assertEqual((reduced_data.skill_count, reduced_data.expert_count, reduced_data.project_count,
+                          reduced_data.overall_time_units), (3, 4, 2, 4))
+        self.assertEqual(reduced_data.experts, experts)
+        self.assertEqual(reduced_data.projects, [([0, 1, 1], 1), ([0, 0, 1], 2)])
+        self.assertEqual(reduction.restore_member((3, 1)), (0, 3, 0, 0, 1))
+
+    def test_reduce_nothing_when_demand_exceeds_dedicated_experts(self):
+        # given
+        data = self._setup_input(3, [[1, 0], [0, 1]], [([1, 0], 2), ([1, 1], 2)])
+        # when
+        reduction = ProblemReduction(data)
+        # then
+        self.assertEqual(reduction.fixed_projects, {})
+        self.assertEqual(reduction.reduced_data.projects, data.projects)
+        result = ((0, 1), SchedulingSolver(data, verbose=False).evaluate((0, 1)))
+        self.assertIs(reduction.restore(result), result)
+
+    def test_fixed_projects_never_change_the_shortage(self):
+        # given
+        rng = random.Random(0)
+        for _ in range(80):
+            skill_count = rng.randint(1, 4)
+            experts = [[rng.randint(0, 1) for _ in range(skill_count)] for _ in range(rng.randint(1, 6))]
+            projects = [([rng.choice([0, 0, 1, 2]) for _ in range(skill_count)], rng.randint(1, 4))
+                        for _ in range(rng.randint(1, 4))]
+            data = self._setup_input(4, experts, projects)
+            reduction = ProblemReduction(data)
+            full_solver = SchedulingSolver(data, verbose=False)
+            reduced_solver = SchedulingSolver(reduction.reduced_data, verbose=False)
+            for reduced_member in self._schedules(reduction.reduced_data):
+                reduced_solution = reduced_solver.evaluate(reduced_member)
+                # when
+                member, solution = reduction.restore((reduced_member, reduced_solution))
+                moved_member = list(member)
+                for project_id in reduction.fixed_projects:
+                    moved_member[project_id] = rng.randint(0, 4 - projects[project_id][1])
+                # then
+                self.assertEqual(solution[0], reduced_solution[0])
+                self.assertEqual(full_solver.evaluate(tuple(moved_member))[0], reduced_solution[0])
+            reduced_optimum = min(reduced_solver.evaluate(member)[0]
+                                  for member in self._schedules(reduction.reduced_data))
+            full_optimum = min(full_solver.evaluate(member)[0] for member in self._schedules(data))
+            self.assertEqual(reduced_optimum, full_optimum)
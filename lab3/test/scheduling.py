@@ -0,0 +1,177 @@
+import random
+import unittest
+
+from instances import random_instance
+from src.classes.data import SchedulingData
+from src.utils.scheduling import SchedulingSolver
+
+
+def random_member(rng, solver):
+    """
+    Draws a random valid schedule.
+
+    :param rng: The random number generator to use.
+    :type rng: random.Random
+    :param solver: The solver giving the domains of the projects.
+    :type solver: SchedulingSolver
+    :return: The start times of all projects.
+    :rtype: tuple
+    """
+    return tuple(rng.randint(lo, hi) for lo, hi in solver.domains)
+
+
+class DeltaEvaluationTest(unittest.TestCase):
+    """Tests for the :meth:`SchedulingSolver._solve_scheduling_delta` method."""
+
+    def assertSameSolution(self, expected, actual):
+        """
+        Asserts that two solutions have the same shortages, intervals and assignments.
+
+        :param expected: The solution evaluated from scratch.
+        :type expected: tuple
+        :param actual: The solution evaluated incrementally.
+        :type actual: tuple
+        """
+        self.assertEqual(actual[0], expected[0])
+        self.assertEqual(actual[1], expected[1])
+        self.assertEqual(actual[2], expected[2])
+        self.assertEqual(actual[3], expected[3])
+
+    def test_delta_matches_full_evaluation_on_random_moves(self):
+        # given
+        rng = random.Random(0)
+        for _ in range(30):
+            data = random_instance(rng, rng.randint(1, 4), rng.randint(1, 6), rng.randint(1, 7), rng.randint(1, 12))
+            solver = SchedulingSolver(data, verbose=False)
+            reference = SchedulingSolver(data, verbose=False)  # evaluates from scratch with caches of its own
+            parent = random_member(rng, solver)
+            parent_solution = solver._solve_scheduling(parent)
+            for _ in range(20):
+                member = list(parent)
+                for i in rng.sample(range(data.project_count), rng.randint(1, data.project_count)):
+                    member[i] = rng.randint(*solver.domains[i])
+                member = tuple(member)
+                # when
+                solution = solver._solve_scheduling_delta(parent, parent_solution, member)
+                # then
+                self.assertSameSolution(reference._solve_scheduling(member), solution)
+                if rng.random() < 0.5:  # walk on, so that deltas are also taken from incrementally solved parents
+                    parent, parent_solution = member, solution
+
+    def test_delta_of_invalid_member(self):
+        # given
+        data = random_instance(random.Random(1), 2, 2, 2, 5)
+        solver = SchedulingSolver(data, verbose=False)
+        parent = tuple(lo for lo, _ in solver.domains)
+        member = (solver.domains[0][1] + 1,) + parent[1:]
+        # when
+        solution = solver._solve_scheduling_delta(parent, solver._solve_scheduling(parent), member)
+        # then
+        self.assertEqual(solution, (-1, None, None, None))
+
+    def test_delta_of_unchanged_member(self):
+        # given
+        data = random_instance(random.Random(2), 3, 4, 4, 8)
+        solver = SchedulingSolver(data, verbose=False)
+        parent = random_member(random.Random(3), solver)
+        parent_solution = solver._solve_scheduling(parent)
+        # when
+        solution = solver._solve_scheduling_delta(parent, parent_solution, parent)
+        # then
+        self.assertSameSolution(parent_solution, solution)
+
+
+class CanonicalFormTest(unittest.TestCase):
+    """Tests for the canonical forms of schedules of the :class:`SchedulingSolver` class."""
+
+    @staticmethod
+    def _instance_with_identical_projects(rng):
+        """
+        Builds a random problem instance, in which some projects are copies of others.
+
+        :param rng: The random number generator to use.
+        :type rng: random.Random
+        :return: The problem instance.
+        :rtype: SchedulingData
+        """
+        return random_instance(rng, rng.randint(1, 4), rng.randint(1, 6), rng.randint(2, 8), rng.randint(4, 12),
+                               identical_chance=0.5)
+
+    @staticmethod
+    def _variants(rng, solver, member):
+        """
+        Builds schedules differing from a schedule only by an offset and a permutation of identical projects.
+
+        :param rng: The random number generator to use.
+        :type rng: random.Random
+        :param solver: The solver giving the domains and classes of identical projects.
+        :type solver: SchedulingSolver
+        :param member: The schedule.
+        :type member: tuple
+        :return: The list of the schedules.
+        :rtype: list
+        """
+        slack_before = min(gene - lo for gene, (lo, _) in zip(member, solver.domains))
+        slack_after = min(hi - gene for gene, (_, hi) in zip(member, solver.domains))
+        variants = []
+        for offset in range(-slack_before, slack_after + 1):
+            variant = [gene + offset for gene in member]
+            for project_ids in solver.project_classes:
+                starts = [variant[i] for i in project_ids]
+                rng.shuffle(starts)
+                for i, start in zip(project_ids, starts):
+                    variant[i] = start
+            variants.append(tuple(variant))
+        return variants
+
+    def test_canonical_forms_of_equivalent_schedules_are_equal(self):
+        # given
+        rng = random.Random(4)
+        for _ in range(30):
+            solver = SchedulingSolver(self._instance_with_identical_projects(rng), verbose=False)
+            member = random_member(rng, solver)
+            for variant in self._variants(rng, solver, member):
+                # expect
+                self.assertEqual(solver._canonicalize(variant), solver._canonicalize(member))
+
+    def test_canonical_form_is_a_fixed_point(self):
+        # given
+        rng = random.Random(5)
+        for _ in range(30):
+            solver = SchedulingSolver(self._instance_with_identical_projects(rng), verbose=False)
+            # when
+            canonical = solver._canonicalize(random_member(rng, solver))
+            # then
+            self.assertEqual(solver._canonicalize(canonical), canonical)
+            self.assertTrue(solver._validate_scheduling(canonical))
+            self.assertEqual(min(gene - lo for gene, (lo, _) in zip(canonical, solver.domains)), 0)
+
+    def test_canonical_solutions_of_equivalent_schedules_are_equal(self):
+        # given
+        rng = random.Random(6)
+        for _ in range(20):
+            data = self._instance_with_identical_projects(rng)
+            solver = SchedulingSolver(data, verbose=False)
+            member = random_member(rng, solver)
+            canonical, solution = solver._evaluate_canonical(member)
+            for variant in self._variants(rng, solver, member):
+                # when
+                variant_solution = SchedulingSolver(data, verbose=False)._evaluate_canonical(variant)[1]
+                # then
+                self.assertEqual(variant_solution[0], solution[0])
+                self.assertEqual(variant_solution[2], solution[2])
+                self.assertEqual(variant_solution[3], solution[3])
+            direct_solution = solver._solve_scheduling(canonical)
+            self.assertEqual((direct_solution[0], direct_solution[2]), (solution[0], solution[2]))
+
+    def test_different_projects_are_not_permuted(self):
+        # given
+        data = SchedulingData([2, 1, 2, 4])
+        data.add_expert([1, 0])
+        data.add_project(([1, 0], 1))
+        data.add_project(([0, 1], 1))
+        solver = SchedulingSolver(data, verbose=False)
+        # expect
+        self.assertEqual(solver.project_classes, [])
+        self.assertNotEqual(solver._canonicalize((0, 2)), solver._canonicalize((2, 0)))
+        self.assertEqual(solver._canonicalize((1, 3)), (0, 2))
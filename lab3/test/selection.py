@@ -0,0 +1,101 @@
+import random
+import unittest
+
+from instances import random_instance
+from src.utils.genetic import GeneticSolver
+from src.utils.selection import elitism, fitness, get_selection, stochastic_universal_sampling, \
+    tournament_selection, truncation_selection
+
+
+class SelectionTest(unittest.TestCase):
+    """Tests for the selection methods of :mod:`src.utils.selection`."""
+
+    @staticmethod
+    def _candidates(rng, count):
+        """
+        Builds evaluated candidates with random shortages, the members being their indices.
+
+        :param rng: The random number generator to use.
+        :type rng: random.Random
+        :param count: The number of candidates.
+        :type count: int
+        :return: A list of (member, solution) pairs.
+        :rtype: list
+        """
+        return [((i,), (rng.randint(0, 20), [], [], [])) for i in range(count)]
+
+    def test_stochastic_universal_sampling(self):
+        # given
+        rng = random.Random(0)
+        for _ in range(50):
+            candidates = self._candidates(rng, rng.randint(1, 12))
+            count = rng.randint(1, 20)
+            seed = rng.random()
+            # when
+            selected = stochastic_universal_sampling(candidates, count, random.Random(seed))
+            # then
+            self.assertEqual(selected, stochastic_universal_sampling(candidates, count, random.Random(seed)))
+            self.assertEqual(len(selected), count)
+            total = sum(fitness(solution) for _, solution in candidates)
+            for candidate in candidates:
+                # evenly spaced pointers select every candidate its expected number of times, rounded either way
+                expected = fitness(candidate[1]) / total * count
+                self.assertLessEqual(abs(selected.count(candidate) - expected), 1)
+
+    def test_tournament_selection(self):
+        # given
+        rng = random.Random(1)
+        for tournament_size in (1, 2, 5):
+            candidates = self._candidates(rng, 10)
+            replayed_rng = random.Random(tournament_size)
+            # when
+            selected = tournament_selection(candidates, 30, random.Random(tournament_size), tournament_size)
+            # then
+            for candidate in selected:
+                contestants = [candidates[replayed_rng.randrange(len(candidates))] for _ in range(tournament_size)]
+                self.assertEqual(candidate[1][0], min(solution[0] for _, solution in contestants))
+                self.assertIn(candidate, contestants)
+
+    def test_truncation_selection(self):
+        # given
+        candidates = self._candidates(random.Random(2), 15)
+        # when
+        selected = truncation_selection(candidates, 5, random.Random(0))
+        # then
+        self.assertEqual(selected, sorted(candidates, key=lambda candidate: candidate[1][0])[:5])
+        self.assertEqual(selected, truncation_selection(candidates, 5, random.Random(1)))
+
+    def test_elitism_splits_best_candidates(self):
+        # given
+        candidates = self._candidates(random.Random(3), 15)
+        # when
+        best, rest = elitism(candidates, 4)
+        # then
+        self.assertEqual(sorted(best + rest), sorted(candidates))
+        self.assertLessEqual(max(solution[0] for _, solution in best), min(solution[0] for _, solution in rest))
+
+    def test_solver_selects_distinct_members_with_elite(self):
+        # given
+        data = random_instance(random.Random(4), 4, 3, 6, 8)
+        for name in ('sus', 'tournament', 'truncation'):
+            solver = GeneticSolver(data, seed=0, verbose=False, selection=get_selection(name), elite_count=2)
+            candidates = self._candidates(random.Random(5), 12)
+            # when
+            selected = solver._select(candidates, 6)
+            # then
+            self.assertEqual(len(selected), 6)
+            self.assertTrue(all(candidate in candidates for candidate in selected.items()))
+            for member, solution in elitism(candidates, 2)[0]:
+                self.assertIn(member, selected)
+
+    def test_seeded_search_is_deterministic_in_every_mode(self):
+        # given
+        data = random_instance(random.Random(6), 5, 4, 8, 8, needs=(0, 1, 2))
+        for name in ('sus', 'tournament', 'truncation'):
+            def solve():
+                return GeneticSolver(data, seed=7, verbose=False, selection=get_selection(name), elite_count=1,
+                                     seeding='mixed', max_population_count=6, max_generation_count=25).solve()
+            # when
+            result = solve()
+            # then
+            self.assertEqual(solve(), result, name)
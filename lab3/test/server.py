@@ -0,0 +1,43 @@
+import os
+import shutil
+import socket
+import tempfile
+import unittest
+
+from src.utils.server import SolverServer
+
+
+class SolverServerTest(unittest.TestCase):
+    """Tests for the :class:`SolverServer` class."""
+
+    def setUp(self):
+        """
+        Setup method for the tests.
+
+        Creates a temporary directory for the Unix sockets of the tests.
+        """
+        self.test_directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.test_directory, 'solver.sock')
+
+    def test_refuse_to_replace_regular_file(self):
+        # given
+        with open(self.path, 'w') as file:
+            file.write('data')
+        # expect
+        self.assertRaisesRegex(OSError, 'Not a socket', SolverServer, self.path, None, None)
+        with open(self.path) as file:
+            self.assertEqual(file.read(), 'data')
+
+    def test_replace_stale_socket(self):
+        # given
+        stale = socket.socket(socket.AF_UNIX)
+        stale.bind(self.path)
+        stale.close()
+        # when
+        server = SolverServer('unix:' + self.path, None, None)
+        # then
+        server.http_server.server_close()
+        self.assertEqual(server.address, self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_directory)